@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1 import four_edge, three_edge, two_edge, circular_edge, health_check, auth
+from app.api.v1 import four_edge, three_edge, two_edge, circular_edge, batch, schedule, sweep, optimizer, capacity, panel_size, igu, probability, load_combination, jobs, health_check, auth
 
 router = APIRouter()
 
@@ -11,4 +11,16 @@ prefix_glass = "/v1/glass"
 router.include_router(four_edge.router, prefix=prefix_glass, tags=["四辺支持"])
 router.include_router(three_edge.router, prefix=prefix_glass, tags=["三辺支持"])
 router.include_router(two_edge.router, prefix=prefix_glass, tags=["二辺支持"])
-router.include_router(circular_edge.router, prefix=prefix_glass, tags=["円周支持"])
\ No newline at end of file
+router.include_router(circular_edge.router, prefix=prefix_glass, tags=["円周支持"])
+router.include_router(batch.router, prefix=prefix_glass, tags=["一括計算"])
+router.include_router(schedule.router, prefix=prefix_glass, tags=["一覧表計算"])
+router.include_router(sweep.router, prefix=prefix_glass, tags=["パラメータスイープ"])
+router.include_router(optimizer.router, prefix=prefix_glass, tags=["最小板厚"])
+router.include_router(capacity.router, prefix=prefix_glass, tags=["最大風圧"])
+router.include_router(panel_size.router, prefix=prefix_glass, tags=["最大寸法"])
+router.include_router(igu.router, prefix=prefix_glass, tags=["複層ガラス"])
+router.include_router(probability.router, prefix=prefix_glass, tags=["破損確率"])
+router.include_router(load_combination.router, prefix=prefix_glass, tags=["荷重の組み合わせ"])
+
+prefix_jobs = "/v1/jobs"
+router.include_router(jobs.router, prefix=prefix_jobs, tags=["ジョブ"])
\ No newline at end of file
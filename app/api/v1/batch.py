@@ -0,0 +1,84 @@
+import json
+from typing import AsyncIterator, List, Optional
+
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter, ValidationError
+
+from app.services.glass_calculator.glass_calculator import CalculateStress
+from app.schemas.glass import (
+    BatchInputScheme,
+    BatchItemScheme,
+    BatchCalculationResult,
+)
+
+router = APIRouter()
+
+batch_item_adapter = TypeAdapter(BatchItemScheme)
+
+class RequestStreamingResponse(StreamingResponse):
+    """
+    リクエスト本文を読みながら返すStreamingResponse。
+    StreamingResponseは切断監視のためにreceiveを読むため、本文の読み込みと競合しないよう
+    切断の検出はrequest.stream()側に任せる。
+    """
+    async def __call__(self, scope, receive, send) -> None:
+        await self.stream_response(send)
+
+@router.post("/batch", response_model=BatchCalculationResult)
+async def perform_calculation_batch(input_data: BatchInputScheme):
+    result = CalculateStress.calculate_batch(input_data)
+    return result
+
+@router.post("/stream", response_class=StreamingResponse)
+async def perform_calculation_stream(
+    request: Request,
+    chunk_size: int = Query(1000, ge=1, le=10000),
+):
+    """
+    NDJSON（1行1パネル）で受け取ったパネルを chunk_size 行ずつ計算し、
+    チャンクが終わるたびに結果をNDJSONで返す。
+    """
+    return RequestStreamingResponse(_stream_results(request, chunk_size), media_type="application/x-ndjson")
+
+async def _stream_results(request: Request, chunk_size: int) -> AsyncIterator[bytes]:
+    # 読み込んだ行はチャンク単位で計算して捨てるため、メモリ使用量は行数によらず一定
+    lines: List[bytes] = []
+    buffer = b""
+    async for body in request.stream():
+        buffer += body
+        *complete, buffer = buffer.split(b"\n")
+        for line in complete:
+            if line.strip():
+                lines.append(line)
+            if len(lines) >= chunk_size:
+                yield await run_in_threadpool(_calculate_chunk, lines)
+                lines = []
+    if buffer.strip():
+        lines.append(buffer)
+    if lines:
+        yield await run_in_threadpool(_calculate_chunk, lines)
+
+def _calculate_chunk(lines: List[bytes]) -> bytes:
+    # 行ごとに検証し、検証エラーの行はエラーとして同じ位置に返す
+    panels = []
+    errors: List[Optional[str]] = []
+    for line in lines:
+        try:
+            panels.append(batch_item_adapter.validate_json(line))
+            errors.append(None)
+        except ValidationError as e:
+            errors.append(_format_validation_error(e))
+
+    results = iter(CalculateStress.calculate_batch_rows(panels))
+    rows = [{"error": error} if error is not None else next(results) for error in errors]
+    return "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows).encode()
+
+def _format_validation_error(e: ValidationError) -> str:
+    # "項目: メッセージ" 形式で1行にまとめる
+    messages = []
+    for err in e.errors():
+        loc = ".".join(map(str, err["loc"]))
+        messages.append(f"{loc}: {err['msg']}" if loc else err["msg"])
+    return "; ".join(messages)
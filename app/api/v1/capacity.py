@@ -0,0 +1,10 @@
+from fastapi import APIRouter
+from app.schemas.glass import CapacityInputScheme, CapacityResult
+from app.services.glass_calculator.capacity import WindCapacity
+
+router = APIRouter()
+
+@router.post("/capacity", response_model=CapacityResult)
+async def perform_calculation_capacity(input_data: CapacityInputScheme):
+    """パネルごとに許容応力・変位の制限値に達する最大風圧を返す"""
+    return {"results": WindCapacity.calculate_batch(input_data.panels)}
@@ -3,7 +3,9 @@ from app.services.glass_calculator.glass_calculator import CalculateStress
 from app.schemas.glass import (
     FourSidePartialInputScheme,
     FourSideUniformInputScheme,
+    FourSideUniformBatchInputScheme,
     CalculationResult,
+    BatchCalculationResult,
 )
 
 router = APIRouter()
@@ -16,4 +18,9 @@ async def perform_calculation_four_partial(input_data: FourSidePartialInputSchem
 @router.post("/four-uniform", response_model=CalculationResult)
 async def perform_calculation_four_uniform(input_data: FourSideUniformInputScheme):
     result = CalculateStress.calculate_fourside_uniform(input_data)
+    return result
+
+@router.post("/four-uniform/batch", response_model=BatchCalculationResult)
+async def perform_calculation_four_uniform_batch(input_data: FourSideUniformBatchInputScheme):
+    result = CalculateStress.calculate_fourside_uniform_batch(input_data)
     return result
\ No newline at end of file
@@ -1,5 +1,9 @@
 from fastapi import APIRouter
 
+from app.services.result_cache.result_cache import get_result_cache
+from app.services.result_cache.result_store import get_result_store
+from app.services.glass_calculator.fem.plate import model_cache_stats
+
 router = APIRouter()
 
 @router.get("/health", tags=["Health Check"])
@@ -8,4 +12,17 @@ async def health_check():
     Health check endpoint to verify the API is running.
     Returns a simple message indicating the service is up.
     """
-    return {"status": "ok", "message": "API is running smoothly."}
\ No newline at end of file
+    return {"status": "ok", "message": "API is running smoothly."}
+
+@router.get("/cache", tags=["Health Check"])
+async def result_cache_stats():
+    """
+    計算結果キャッシュの件数（ヒット、ミス、削除）と使用状況を返す
+    永続キャッシュが無効の場合、store はNone。fem はFEMの分解済み剛性行列のキャッシュ
+    """
+    store = get_result_store()
+    return {
+        **get_result_cache().stats(),
+        "store": None if store is None else store.stats(),
+        "fem": model_cache_stats(),
+    }
@@ -0,0 +1,15 @@
+from fastapi import APIRouter
+from app.schemas.glass import IGUBatchInputScheme, IGUBatchResult, IGUInputScheme, IGURowResult
+from app.services.glass_calculator.igu import InsulatingGlassUnit
+
+router = APIRouter()
+
+@router.post("/igu", response_model=IGURowResult)
+async def perform_calculation_igu(input_data: IGUInputScheme):
+    """複層ガラスの外側・内側のガラスの荷重分担と応力・変位を返す"""
+    return InsulatingGlassUnit.calculate_batch([input_data])[0]
+
+@router.post("/igu/batch", response_model=IGUBatchResult)
+async def perform_calculation_igu_batch(input_data: IGUBatchInputScheme):
+    """複数の複層ガラスの荷重分担をまとめて計算する"""
+    return {"results": InsulatingGlassUnit.calculate_batch(input_data.units)}
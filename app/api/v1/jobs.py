@@ -0,0 +1,40 @@
+import json
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from app.schemas.glass import JobInputScheme, JobStatusResult
+from app.services.job_queue.job_queue import get_job_queue, get_job_worker_pool
+
+router = APIRouter()
+
+@router.post("", response_model=JobStatusResult)
+async def submit_job(input_data: JobInputScheme):
+    """一括計算ジョブを登録し、ジョブIDを返す"""
+    status = get_job_queue().submit(input_data.panels, input_data.chunk_size)
+    worker_pool = get_job_worker_pool()
+    worker_pool.start()
+    worker_pool.notify()
+    return status
+
+@router.get("/{job_id}", response_model=JobStatusResult)
+async def get_job_status(job_id: str):
+    """ジョブの状態（進捗）を返す"""
+    status = get_job_queue().get_status(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="ジョブが見つかりません")
+    return status
+
+@router.get("/{job_id}/results", response_class=StreamingResponse)
+async def get_job_results(job_id: str):
+    """
+    ジョブの結果を入力順のNDJSONで返す
+    実行中・失敗したジョブは先頭から続けて終わったチャンクまでの結果を返します
+    （失敗したチャンクの行はエラー）。ジョブの状態はヘッダー X-Job-Status に返します。
+    """
+    queue = get_job_queue()
+    status = queue.get_status(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="ジョブが見つかりません")
+
+    lines = (json.dumps(row, ensure_ascii=False) + "\n" for row in queue.iter_results(job_id))
+    return StreamingResponse(lines, media_type="application/x-ndjson", headers={"X-Job-Status": status["status"]})
@@ -0,0 +1,10 @@
+from fastapi import APIRouter
+from app.schemas.glass import LoadCombinationInputScheme, LoadCombinationResult
+from app.services.glass_calculator.load_combination import LoadCombination
+
+router = APIRouter()
+
+@router.post("/combination", response_model=LoadCombinationResult)
+async def perform_calculation_combination(input_data: LoadCombinationInputScheme):
+    """パネルごとに全ての荷重の組み合わせを計算し、検定比が最大の組み合わせを返す"""
+    return {"results": LoadCombination.calculate_batch(input_data.panels, input_data.details)}
@@ -0,0 +1,23 @@
+from fastapi import APIRouter
+from app.schemas.glass import ThicknessOptimizationInputScheme, ThicknessOptimizationResult
+from app.services.glass_calculator.contracts.enums import SupportTypeEnum
+from app.services.glass_calculator.optimizer import ThicknessOptimizer
+
+router = APIRouter()
+
+@router.post("/optimize-thickness", response_model=ThicknessOptimizationResult)
+async def perform_thickness_optimization(input_data: ThicknessOptimizationInputScheme):
+    """短期許容応力と変位の制限値を満たす最も軽い積層構成を返す"""
+    try:
+        return ThicknessOptimizer.optimize(
+            SupportTypeEnum(input_data.support),
+            {"a": input_data.a, "b": input_data.b, "a1": input_data.a1, "b1": input_data.b1},
+            input_data.w,
+            input_data.E,
+            input_data.glass_type,
+            input_data.catalog,
+            input_data.max_plies,
+            input_data.deflection_limit,
+        )
+    except ValueError as e:
+        return {"candidates": 0, "evaluated": 0, "error": str(e)}
@@ -0,0 +1,22 @@
+from fastapi import APIRouter
+from app.schemas.glass import PanelSizeInputScheme, PanelSizeResult
+from app.services.glass_calculator.contracts.enums import SupportTypeEnum
+from app.services.glass_calculator.panel_size import PanelSizeSolver
+
+router = APIRouter()
+
+@router.post("/panel-size", response_model=PanelSizeResult)
+async def perform_panel_size_calculation(input_data: PanelSizeInputScheme):
+    """辺長比ごとに短期許容応力と変位の制限値を満たす最大寸法を返す"""
+    try:
+        return PanelSizeSolver.solve(
+            SupportTypeEnum(input_data.support),
+            input_data.ratio,
+            input_data.t,
+            input_data.w,
+            input_data.E,
+            input_data.glass_type,
+            input_data.deflection_limit,
+        )
+    except ValueError as e:
+        return {"error": str(e)}
@@ -0,0 +1,19 @@
+import json
+
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+from app.schemas.glass import BreakageProbabilityInputScheme, BreakageProbabilityResult
+from app.services.glass_calculator.probability import BreakageProbability
+
+router = APIRouter()
+
+@router.post("/probability", response_model=BreakageProbabilityResult)
+def perform_calculation_probability(input_data: BreakageProbabilityInputScheme):
+    """モンテカルロ法による破損確率と応力のパーセンタイル（信頼区間付き）を返す"""
+    return BreakageProbability.calculate(input_data)
+
+@router.post("/probability/stream", response_class=StreamingResponse)
+async def perform_calculation_probability_stream(input_data: BreakageProbabilityInputScheme):
+    """チャンク（chunk_size 標本）ごとに、それまでの標本による推定値をNDJSONで返す"""
+    lines = (json.dumps(row, ensure_ascii=False) + "\n" for row in BreakageProbability.iter_estimates(input_data))
+    return StreamingResponse(lines, media_type="application/x-ndjson")
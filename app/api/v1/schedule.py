@@ -0,0 +1,31 @@
+from fastapi import APIRouter, File, HTTPException, UploadFile
+from fastapi.responses import Response
+from app.services.glass_calculator.schedule import GlassSchedule
+
+router = APIRouter()
+
+@router.post("/schedule", response_class=Response)
+async def perform_calculation_schedule(file: UploadFile = File(...)):
+    """
+    ガラス一覧表（CSV または Parquet）をアップロードし、
+    sigma, delta, utilization_short_term, utilization_long_term, error 列を追加した同じ形式のファイルを返す。
+    """
+    filename = file.filename or "schedule.csv"
+    content = await file.read()
+    try:
+        if filename.lower().endswith(".parquet"):
+            result = GlassSchedule.calculate_parquet(content)
+            media_type = "application/vnd.apache.parquet"
+        elif filename.lower().endswith(".csv"):
+            result = GlassSchedule.calculate_csv(content)
+            media_type = "text/csv"
+        else:
+            raise ValueError("CSV（.csv）またはParquet（.parquet）ファイルを指定してください")
+    except (ValueError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return Response(
+        content=result,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,38 @@
+import numpy as np
+from fastapi import APIRouter, HTTPException
+from app.schemas.glass import SweepInputScheme, SweepResult
+from app.services.glass_calculator.contracts.enums import SupportTypeEnum
+from app.services.glass_calculator.sweep import ParametricSweep
+
+router = APIRouter()
+
+@router.post("/sweep", response_model=SweepResult)
+async def perform_calculation_sweep(input_data: SweepInputScheme):
+    """
+    a, b, 積層構成, w の直積を計算し、C順に並べたグリッドを返す。
+    グリッドが limit を超える場合は next_offset を指定して続きを取得する。
+    """
+    try:
+        a = ParametricSweep.expand_axis(input_data.a)
+        b = ParametricSweep.expand_axis(input_data.b)
+        w = ParametricSweep.expand_axis(input_data.w)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    result = ParametricSweep.calculate(
+        SupportTypeEnum(input_data.support), a, b, input_data.t, w, input_data.E, input_data.offset, input_data.limit,
+        input_data.glass_type,
+    )
+    return {
+        **result,
+        "axes": {"a": a.tolist(), "b": b.tolist(), "t": input_data.t, "w": w.tolist()},
+        "sigma": _to_list(result["sigma"]),
+        "delta": _to_list(result["delta"]),
+        "utilization_short_term": _to_list(result["utilization_short_term"], 3),
+        "utilization_long_term": _to_list(result["utilization_long_term"], 3),
+    }
+
+def _to_list(values: np.ndarray, digits: int = 2) -> list:
+    # 小数第 digits 位に丸め、計算できなかった値はNoneにする
+    rounded = np.round(values, digits)
+    return [None if np.isnan(value) else value for value in rounded.tolist()]
@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -6,8 +8,17 @@ from mangum import Mangum
 # Glass Stress Calculation API
 from app.api.api import router as glass_calculator_router
 # Authentication Router
+from app.services.job_queue.job_queue import get_job_worker_pool
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 起動時にジョブのワーカーを開始し、前回停止時に未完了だったチャンクから再開する
+    worker_pool = get_job_worker_pool()
+    worker_pool.start()
+    yield
+    worker_pool.stop()
 
-app = FastAPI(title="Glass Stress Calculator")
+app = FastAPI(title="Glass Stress Calculator", lifespan=lifespan)
 
 # lambdaで設定するため通常のCORS設定はコメントアウト
 # app.add_middleware(
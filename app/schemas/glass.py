@@ -1,9 +1,32 @@
-from typing import List
-from pydantic import BaseModel, PositiveFloat
+from typing import Annotated, Dict, List, Literal, Optional, Union
+from pydantic import BaseModel, Field, PositiveFloat
+
+from app.services.glass_calculator.contracts.enums import EdgeConditionEnum, GlassTypeEnum, InterlayerMaterialTypeEnum, LoadCaseTypeEnum, LoadDurationEnum, LookupModeEnum, SolverEnum
 
 class CalculationResult(BaseModel):
     sigma: float # 最大応力
     delta: float # 最大変位 
+    utilization_short_term: Optional[float] = None # 検定比（最大応力/短期許容応力（面内））
+    utilization_long_term: Optional[float] = None # 検定比（最大応力/長期許容応力（面内））
+    coefficient_version: Optional[str] = None # 使用した係数テーブルの版（支持条件:版。FEMの場合はNone）
+    solver: Optional[str] = None # 計算方法（table, fem, nonlinear）
+
+class BatchCalculationRowResult(BaseModel):
+    sigma: Optional[float] = None # 最大応力（エラー行はNone）
+    delta: Optional[float] = None # 最大変位（エラー行はNone）
+    utilization_short_term: Optional[float] = None # 検定比（最大応力/短期許容応力（面内））
+    utilization_long_term: Optional[float] = None # 検定比（最大応力/長期許容応力（面内））
+    coefficient_version: Optional[str] = None # 使用した係数テーブルの版（支持条件:版。FEMの場合はNone）
+    solver: Optional[str] = None # 計算方法（table, fem, nonlinear）
+    error: Optional[str] = None # 行ごとのエラーメッセージ
+
+class BatchCalculationResult(BaseModel):
+    results: List[BatchCalculationRowResult] # 入力順の計算結果
+
+class FEMOptionsScheme(BaseModel):
+    divisions: int = Field(16, ge=1, le=128) # 短辺方向の要素分割数
+    edges: Optional[List[EdgeConditionEnum]] = Field(None, min_length=4, max_length=4) # 辺の条件（下辺, 右辺, 上辺, 左辺。Noneの場合は支持条件の既定値）
+    load_steps: int = Field(4, ge=1, le=100) # 大たわみ解析の荷重増分数
 
 class FourSideUniformInputScheme(BaseModel):
     a: PositiveFloat# 短辺寸法（mm）
@@ -12,6 +35,17 @@ class FourSideUniformInputScheme(BaseModel):
     w: PositiveFloat# 風圧（Pa）
     nu: float = 0.22 # ポアソン比（ガラスの標準値）
     E: float = 71600 # ヤング係数（ガラスの標準値）
+    glass_type: GlassTypeEnum = GlassTypeEnum.FLOAT # ガラスの種類
+    interlayer: InterlayerMaterialTypeEnum = InterlayerMaterialTypeEnum.SG # 中間膜の種類（sg: 完全一体、pvb, eva: せん断結合を考慮した有効板厚）
+    interlayer_thickness: PositiveFloat = 0.76 # 中間膜1層の厚さ（mm）
+    load_duration: LoadDurationEnum = LoadDurationEnum.GUST # 荷重の継続時間（中間膜のせん断弾性係数に使用）
+    temperature: float = Field(20, ge=-20, le=80) # 中間膜の温度（℃）
+    lookup_mode: LookupModeEnum = LookupModeEnum.STEP # 係数の求め方（step: 表の行の値、linear: 線形補間）
+    solver: SolverEnum = SolverEnum.TABLE # 計算方法（table: 係数表、fem: FEM、auto: 係数表の範囲外の場合のみFEM、nonlinear: 大たわみのFEM）
+    fem: FEMOptionsScheme = FEMOptionsScheme() # FEMの設定
+
+class FourSideUniformBatchInputScheme(BaseModel):
+    panels: List[FourSideUniformInputScheme] # 四辺支持板のリスト
 
 class FourSidePartialInputScheme(BaseModel):
     a: PositiveFloat# 短辺寸法（mm）
@@ -22,6 +56,14 @@ class FourSidePartialInputScheme(BaseModel):
     w: PositiveFloat# 風圧（Pa）
     nu: float = 0.22 # ポアソン比（ガラスの標準値）
     E: float = 71600 # ヤング係数（ガラスの標準値）
+    glass_type: GlassTypeEnum = GlassTypeEnum.FLOAT # ガラスの種類
+    interlayer: InterlayerMaterialTypeEnum = InterlayerMaterialTypeEnum.SG # 中間膜の種類（sg: 完全一体、pvb, eva: せん断結合を考慮した有効板厚）
+    interlayer_thickness: PositiveFloat = 0.76 # 中間膜1層の厚さ（mm）
+    load_duration: LoadDurationEnum = LoadDurationEnum.GUST # 荷重の継続時間（中間膜のせん断弾性係数に使用）
+    temperature: float = Field(20, ge=-20, le=80) # 中間膜の温度（℃）
+    lookup_mode: LookupModeEnum = LookupModeEnum.STEP # 係数の求め方（step: 表の行の値、linear: 3重線形補間）
+    solver: SolverEnum = SolverEnum.TABLE # 計算方法（table: 係数表、fem: FEM、auto: 係数表の範囲外の場合のみFEM、nonlinear: 大たわみのFEM）
+    fem: FEMOptionsScheme = FEMOptionsScheme() # FEMの設定
     
 class ThreeSideUniformInputScheme(BaseModel):
     free: PositiveFloat# 自由辺寸法（mm）
@@ -30,6 +72,14 @@ class ThreeSideUniformInputScheme(BaseModel):
     w: PositiveFloat# 風圧（Pa）
     nu: float = 0.22 # ポアソン比（ガラスの標準値）
     E: float = 71600 # ヤング係数（ガラスの標準値）
+    glass_type: GlassTypeEnum = GlassTypeEnum.FLOAT # ガラスの種類
+    interlayer: InterlayerMaterialTypeEnum = InterlayerMaterialTypeEnum.SG # 中間膜の種類（sg: 完全一体、pvb, eva: せん断結合を考慮した有効板厚）
+    interlayer_thickness: PositiveFloat = 0.76 # 中間膜1層の厚さ（mm）
+    load_duration: LoadDurationEnum = LoadDurationEnum.GUST # 荷重の継続時間（中間膜のせん断弾性係数に使用）
+    temperature: float = Field(20, ge=-20, le=80) # 中間膜の温度（℃）
+    lookup_mode: LookupModeEnum = LookupModeEnum.STEP # 係数の求め方（step: 表の行の値、linear: 線形補間）
+    solver: SolverEnum = SolverEnum.TABLE # 計算方法（table: 係数表、fem: FEM、auto: 係数表の範囲外の場合のみFEM、nonlinear: 大たわみのFEM）
+    fem: FEMOptionsScheme = FEMOptionsScheme() # FEMの設定
 
 class TwoSideUniformInputScheme(BaseModel):
     free: PositiveFloat# 自由辺寸法（mm）
@@ -38,6 +88,14 @@ class TwoSideUniformInputScheme(BaseModel):
     w: PositiveFloat# 風圧（Pa）
     nu: float = 0.22 # ポアソン比（ガラスの標準値）
     E: float = 71600 # ヤング係数（ガラスの標準値）
+    glass_type: GlassTypeEnum = GlassTypeEnum.FLOAT # ガラスの種類
+    interlayer: InterlayerMaterialTypeEnum = InterlayerMaterialTypeEnum.SG # 中間膜の種類（sg: 完全一体、pvb, eva: せん断結合を考慮した有効板厚）
+    interlayer_thickness: PositiveFloat = 0.76 # 中間膜1層の厚さ（mm）
+    load_duration: LoadDurationEnum = LoadDurationEnum.GUST # 荷重の継続時間（中間膜のせん断弾性係数に使用）
+    temperature: float = Field(20, ge=-20, le=80) # 中間膜の温度（℃）
+    lookup_mode: LookupModeEnum = LookupModeEnum.STEP # 係数の求め方（step: 表の行の値、linear: 線形補間）
+    solver: SolverEnum = SolverEnum.TABLE # 計算方法（table: 係数表、fem: FEM、auto: 係数表の範囲外の場合のみFEM、nonlinear: 大たわみのFEM）
+    fem: FEMOptionsScheme = FEMOptionsScheme() # FEMの設定
 
 class CircularUniformInputScheme(BaseModel):
     D: PositiveFloat# 直径寸法（mm）
@@ -45,3 +103,266 @@ class CircularUniformInputScheme(BaseModel):
     w: PositiveFloat# 風圧（Pa）
     nu: float = 0.22 # ポアソン比（ガラスの標準値）
     E: float = 71600 # ヤング係数（ガラスの標準値）
+    glass_type: GlassTypeEnum = GlassTypeEnum.FLOAT # ガラスの種類
+    interlayer: InterlayerMaterialTypeEnum = InterlayerMaterialTypeEnum.SG # 中間膜の種類（sg: 完全一体、pvb, eva: せん断結合を考慮した有効板厚）
+    interlayer_thickness: PositiveFloat = 0.76 # 中間膜1層の厚さ（mm）
+    load_duration: LoadDurationEnum = LoadDurationEnum.GUST # 荷重の継続時間（中間膜のせん断弾性係数に使用）
+    temperature: float = Field(20, ge=-20, le=80) # 中間膜の温度（℃）
+    solver: SolverEnum = SolverEnum.TABLE # 計算方法（table: 係数表、nonlinear: 大たわみのFEM（軸対称））
+    fem: FEMOptionsScheme = FEMOptionsScheme() # FEMの設定（円形は divisions（半径方向）と load_steps のみ）
+
+# 一括計算用：支持条件（support）で入力を判別する
+class FourSideUniformBatchItemScheme(FourSideUniformInputScheme):
+    support: Literal["four-uniform"]
+
+class FourSidePartialBatchItemScheme(FourSidePartialInputScheme):
+    support: Literal["four-partial"]
+
+class ThreeSideUniformBatchItemScheme(ThreeSideUniformInputScheme):
+    support: Literal["three-uniform"]
+
+class TwoSideUniformBatchItemScheme(TwoSideUniformInputScheme):
+    support: Literal["two-uniform"]
+
+class CircularUniformBatchItemScheme(CircularUniformInputScheme):
+    support: Literal["circular-uniform"]
+
+BatchItemScheme = Annotated[
+    Union[
+        FourSideUniformBatchItemScheme,
+        FourSidePartialBatchItemScheme,
+        ThreeSideUniformBatchItemScheme,
+        TwoSideUniformBatchItemScheme,
+        CircularUniformBatchItemScheme,
+    ],
+    Field(discriminator="support"),
+]
+
+class BatchInputScheme(BaseModel):
+    panels: List[BatchItemScheme] # 支持条件の混在したパネルのリスト
+
+class JobInputScheme(BaseModel):
+    panels: List[BatchItemScheme] # 支持条件の混在したパネルのリスト
+    chunk_size: int = Field(1000, ge=1, le=10000) # 1チャンクの行数
+
+class JobStatusResult(BaseModel):
+    id: str # ジョブID
+    status: str # queued, running, done, failed
+    total_rows: int # 行数
+    total_chunks: int # チャンク数
+    done_chunks: int # 完了したチャンク数
+    failed_chunks: int = 0 # 再処理しても失敗したチャンク数
+    progress: float # 進捗（0〜1）
+    error: Optional[str] = None # 失敗した場合のエラーメッセージ
+
+class SweepRangeScheme(BaseModel):
+    start: PositiveFloat # 開始値
+    stop: PositiveFloat # 終了値（含む）
+    step: PositiveFloat # 刻み
+
+class SweepInputScheme(BaseModel):
+    support: Literal["four-uniform", "three-uniform"] # 支持条件
+    a: Union[List[PositiveFloat], SweepRangeScheme] # 短辺（三辺支持はフリー辺）寸法（mm）
+    b: Union[List[PositiveFloat], SweepRangeScheme] # 長辺（三辺支持は固定辺）寸法（mm）
+    t: List[Annotated[List[PositiveFloat], Field(min_length=1)]] # 積層構成のリスト（mm。空の構成は不可）
+    w: Union[List[PositiveFloat], SweepRangeScheme] # 風圧（Pa）
+    E: float = 71600 # ヤング係数（ガラスの標準値）
+    glass_type: GlassTypeEnum = GlassTypeEnum.FLOAT # ガラスの種類
+    offset: int = Field(0, ge=0) # 計算を始める位置（C順の通し番号）
+    limit: int = Field(100000, ge=1, le=1000000) # 1回に返す件数
+
+class SweepAxesResult(BaseModel):
+    a: List[float]
+    b: List[float]
+    t: List[List[float]]
+    w: List[float]
+
+class SweepResult(BaseModel):
+    shape: List[int] # グリッドの形状（a, b, t, w の順）
+    axes: SweepAxesResult # 各軸の値
+    offset: int # 今回の先頭の通し番号
+    next_offset: Optional[int] = None # 続きの通し番号（最後の場合はNone）
+    sigma: List[Optional[float]] # C順に並べた最大応力（範囲外はNone）
+    delta: List[Optional[float]] # C順に並べた最大変位（範囲外はNone）
+    utilization_short_term: List[Optional[float]] # C順に並べた検定比（最大応力/短期許容応力（面内）。範囲外はNone）
+    utilization_long_term: List[Optional[float]] # C順に並べた検定比（最大応力/長期許容応力（面内）。範囲外はNone）
+    coefficient_version: str # 使用した係数テーブルの版（支持条件:版）
+
+class PanelGeometryScheme(BaseModel):
+    support: Literal["four-uniform", "four-partial", "three-uniform", "two-uniform", "circular-uniform"] # 支持条件
+    a: PositiveFloat # 短辺（三辺・二辺支持はフリー辺、円形は直径）寸法（mm）
+    b: Optional[PositiveFloat] = None # 長辺（三辺・二辺支持は固定辺）寸法（mm）
+    a1: Optional[PositiveFloat] = None # 短辺荷重寸法（部分荷重、mm）
+    b1: Optional[PositiveFloat] = None # 長辺荷重寸法（部分荷重、mm）
+    E: float = 71600 # ヤング係数（ガラスの標準値）
+    glass_type: GlassTypeEnum = GlassTypeEnum.FLOAT # ガラスの種類
+
+class ThicknessOptimizationInputScheme(PanelGeometryScheme):
+    w: PositiveFloat # 風圧（Pa）
+    catalog: List[PositiveFloat] = Field(min_length=1, max_length=20) # 使用できる板厚（mm。最大枚数4枚で約1万通りの組み合わせ）
+    max_plies: int = Field(2, ge=1, le=4) # 合わせガラスの最大枚数
+    deflection_limit: Optional[PositiveFloat] = None # 変位の制限値（mm）
+
+class ThicknessOptimizationResult(BaseModel):
+    t: Optional[List[float]] = None # 最も軽い積層構成（mm）
+    sigma: Optional[float] = None # 最大応力
+    delta: Optional[float] = None # 最大変位
+    allowable_stress: Optional[float] = None # 短期許容応力（面内）
+    candidates: int # 候補の数
+    evaluated: int # 枝刈り後に評価した候補の数
+    error: Optional[str] = None # 条件を満たす積層構成が無い場合のメッセージ
+
+class CapacityItemScheme(PanelGeometryScheme):
+    t: List[PositiveFloat] # 板厚（mm）
+    deflection_limit: Optional[PositiveFloat] = None # 変位の制限値（mm）
+
+class CapacityInputScheme(BaseModel):
+    panels: List[CapacityItemScheme] # パネルのリスト
+
+class CapacityRowResult(BaseModel):
+    w_short_term: Optional[float] = None # 短期許容応力（面内）に達する風圧
+    w_long_term: Optional[float] = None # 長期許容応力（面内）に達する風圧
+    w_deflection: Optional[float] = None # 変位の制限値に達する風圧
+    w_max: Optional[float] = None # 最大風圧（短期許容応力と変位の制限値の小さい方）
+    governing: Optional[str] = None # 最大風圧を決める条件（short_term, deflection）
+    error: Optional[str] = None # 行ごとのエラーメッセージ
+
+class CapacityResult(BaseModel):
+    results: List[CapacityRowResult] # 入力順の計算結果
+
+class PanelSizeInputScheme(BaseModel):
+    support: Literal["four-uniform", "three-uniform", "two-uniform"] # 支持条件
+    ratio: List[PositiveFloat] # 辺長比 b/a（三辺・二辺支持は 固定辺/フリー辺）
+    t: List[PositiveFloat] # 板厚（mm）
+    w: PositiveFloat # 風圧（Pa）
+    E: float = 71600 # ヤング係数（ガラスの標準値）
+    glass_type: GlassTypeEnum = GlassTypeEnum.FLOAT # ガラスの種類
+    deflection_limit: Optional[PositiveFloat] = None # 変位の制限値（mm）
+
+class PanelSizeRowResult(BaseModel):
+    ratio: float # 辺長比
+    a: Optional[float] = None # 最大寸法（短辺、三辺・二辺支持はフリー辺、mm）
+    b: Optional[float] = None # aに対応する長辺（三辺・二辺支持は固定辺、mm）
+    governing: Optional[str] = None # 最大寸法を決める条件（short_term, deflection）
+    error: Optional[str] = None # 行ごとのエラーメッセージ
+
+class PanelSizeResult(BaseModel):
+    allowable_stress: Optional[float] = None # 短期許容応力（面内）
+    results: List[PanelSizeRowResult] = [] # 入力順の計算結果
+    error: Optional[str] = None # 積層構成・支持条件のエラーメッセージ
+
+class IGUPaneScheme(BaseModel):
+    t: List[PositiveFloat] # 板厚（mm）
+    glass_type: GlassTypeEnum = GlassTypeEnum.FLOAT # ガラスの種類
+    interlayer: InterlayerMaterialTypeEnum = InterlayerMaterialTypeEnum.SG # 中間膜の種類（合わせガラスの場合）
+    interlayer_thickness: PositiveFloat = 0.76 # 中間膜1層の厚さ（mm）
+
+class IGUInputScheme(BaseModel):
+    support: Literal["four-uniform", "two-uniform", "circular-uniform"] = "four-uniform" # 支持条件
+    a: PositiveFloat # 短辺（二辺支持はフリー辺、円形は直径）寸法（mm）
+    b: Optional[PositiveFloat] = None # 長辺（二辺支持は固定辺）寸法（mm）
+    outer: IGUPaneScheme # 外側（荷重を受ける側）のガラス
+    inner: IGUPaneScheme # 内側のガラス
+    cavity: PositiveFloat # 中空層の厚さ（mm）
+    w: float # 外側のガラスに作用する風圧（正は外から押す向き、負は負圧）
+    E: float = 71600 # ヤング係数（ガラスの標準値）
+    load_duration: LoadDurationEnum = LoadDurationEnum.GUST # 荷重の継続時間（中間膜のせん断弾性係数に使用）
+    temperature: float = Field(20, ge=-20, le=80) # 中間膜の温度（℃）
+    production_pressure: PositiveFloat = 101.3 # 製造時の気圧（kPa）
+    production_temperature: float = 20 # 製造時の温度（℃）
+    delta_temperature: float = 0 # 製造時からの中空層の温度の上昇（K）
+    delta_pressure: float = 0 # 製造時からの気圧の低下（kPa）
+    altitude_difference: float = 0 # 製造地からの標高差（m）
+
+class IGUBatchInputScheme(BaseModel):
+    units: List[IGUInputScheme] # 複層ガラスのリスト
+
+class IGUPaneResult(BaseModel):
+    sigma: float # 最大応力
+    delta: float # 最大変位
+    load: float # 分担する荷重（外側は外から中空層へ、内側は中空層から室内へ向かう向きを正）
+    utilization_short_term: Optional[float] = None # 検定比（最大応力/短期許容応力（面内））
+    utilization_long_term: Optional[float] = None # 検定比（最大応力/長期許容応力（面内））
+
+class IGURowResult(BaseModel):
+    outer: Optional[IGUPaneResult] = None # 外側のガラスの計算結果
+    inner: Optional[IGUPaneResult] = None # 内側のガラスの計算結果
+    cavity_pressure: Optional[float] = None # 中空層の圧力（外気圧との差）
+    isochore_pressure: Optional[float] = None # ガラスが変形しない場合の中空層の圧力（等容圧力）
+    iterations: Optional[int] = None # 荷重分担の反復回数
+    error: Optional[str] = None # 行ごとのエラーメッセージ
+
+class IGUBatchResult(BaseModel):
+    results: List[IGURowResult] # 入力順の計算結果
+
+class BreakageProbabilityInputScheme(BaseModel):
+    panel: BatchItemScheme # 対象のパネル（w は設計風圧）
+    samples: int = Field(1000000, ge=1, le=100000000) # 標本数
+    chunk_size: int = Field(1000000, ge=1000, le=1000000) # 1チャンクの標本数（チャンクごとに推定値を返す）
+    seed: Optional[int] = Field(None, ge=0) # 乱数の種（Noneの場合は毎回異なる。使用した種は結果の seed）
+    workers: int = Field(1, ge=1, le=32) # チャンクを計算するプロセス数（1の場合はプロセスプールを使わない。Lambdaでは1に制限）
+    thickness_tolerance: Optional[float] = Field(None, ge=0) # 板厚の許容差（±mm。Noneの場合は呼び厚さごとの規格値）
+    wind_mean_ratio: PositiveFloat = 1.0 # 風圧の平均/設計風圧
+    wind_cov: float = Field(0.2, ge=0, le=2) # 風圧の変動係数
+    weibull_shape: Optional[PositiveFloat] = None # 表面強度のWeibull係数（Noneの場合はガラスの種類ごとの代表値）
+    weibull_scale: Optional[PositiveFloat] = None # 表面強度の尺度母数（Noneの場合は許容応力の表の破壊強度から求める）
+    percentiles: List[Annotated[float, Field(ge=0, le=100)]] = Field([50, 95, 99, 99.9], min_length=1) # 応力のパーセンタイル（0〜100）
+    confidence: float = Field(0.95, gt=0, lt=1) # 信頼区間の信頼水準
+
+class StressPercentileResult(BaseModel):
+    percentile: float # パーセンタイル
+    value: float # 応力の推定値
+    lower: float # 信頼区間の下限
+    upper: float # 信頼区間の上限
+
+class BreakageProbabilityResult(BaseModel):
+    samples: int = 0 # 計算した標本数
+    failures: int = 0 # 応力が表面強度以上となった標本数
+    failure_probability: Optional[float] = None # 破損確率の推定値
+    failure_probability_lower: Optional[float] = None # 破損確率の信頼区間の下限（Wilson）
+    failure_probability_upper: Optional[float] = None # 破損確率の信頼区間の上限（Wilson）
+    mean_stress: Optional[float] = None # 応力の平均
+    stress_percentiles: List[StressPercentileResult] = [] # 応力のパーセンタイル
+    weibull_shape: Optional[float] = None # 使用したWeibull係数
+    weibull_scale: Optional[float] = None # 使用した尺度母数
+    seed: Optional[int] = None # 使用した乱数の種（同じ種で同じ結果を再現できる）
+    done: bool = False # 全標本を計算したか
+    error: Optional[str] = None # エラーメッセージ
+
+class LoadCaseScheme(BaseModel):
+    name: str # 荷重ケースの名前（組み合わせで参照する）
+    kind: LoadCaseTypeEnum # 荷重の種類
+    w: Optional[float] = None # 面外方向の荷重（N/mm²。正は押す向き、負は負圧。自重は省略すると板厚と傾斜角から求める）
+    duration: Optional[LoadDurationEnum] = None # 荷重の継続時間（Noneの場合は荷重の種類ごとの既定値）
+
+class LoadCombinationScheme(BaseModel):
+    name: Optional[str] = None # 組み合わせの名前（Noneの場合は荷重ケースの名前を"+"でつなぐ）
+    factors: Dict[str, float] = Field(min_length=1) # 荷重ケースの名前と荷重係数
+
+class LoadCombinationPanelScheme(PanelGeometryScheme):
+    t: List[PositiveFloat] # 板厚（mm）
+    interlayer: InterlayerMaterialTypeEnum = InterlayerMaterialTypeEnum.SG # 中間膜の種類（sg: 完全一体、pvb, eva: 荷重の継続時間ごとの有効板厚）
+    interlayer_thickness: PositiveFloat = 0.76 # 中間膜1層の厚さ（mm）
+    temperature: float = Field(20, ge=-20, le=80) # 中間膜の温度（℃）
+    slope: float = Field(90, ge=0, le=90) # 水平面からの傾斜角（度。90は鉛直、0は水平）
+    cases: List[LoadCaseScheme] = Field(min_length=1, max_length=10) # 荷重ケース
+    combinations: Optional[List[LoadCombinationScheme]] = Field(None, min_length=1) # 荷重の組み合わせ（Noneの場合は全ての組み合わせ）
+
+class LoadCombinationInputScheme(BaseModel):
+    panels: List[LoadCombinationPanelScheme] # パネルのリスト
+    details: bool = False # 全ての組み合わせの結果を返すか
+
+class LoadCombinationCaseResult(BaseModel):
+    name: str # 組み合わせの名前
+    sigma: float # 最大応力（絶対値）
+    delta: float # 最大変位（絶対値）
+    term: str # 許容応力の区分（short_term, long_term）
+    utilization: float # 検定比（最大応力/許容応力（面内））
+
+class LoadCombinationRowResult(BaseModel):
+    governing: Optional[LoadCombinationCaseResult] = None # 検定比が最大の組み合わせ
+    combinations: Optional[List[LoadCombinationCaseResult]] = None # 全ての組み合わせの結果（details=Trueの場合）
+    error: Optional[str] = None # 行ごとのエラーメッセージ
+
+class LoadCombinationResult(BaseModel):
+    results: List[LoadCombinationRowResult] # 入力順の計算結果
@@ -1,6 +1,9 @@
+import bisect
 from enum import Enum
 from typing import TypeVar, Union, Sequence
 
+import numpy as np
+
 # Define a type variable for numeric types
 T = TypeVar('T', bound=Union[int, float])
 
@@ -20,21 +23,23 @@ def binary_search(arr: Sequence[T], target: T, bisect_type: BisectTypeEnum = Bis
     Returns:
         The index where target should be inserted to maintain sorted order
     """
-    left = 0
-    right = len(arr)  # Note: Python convention uses len(arr) rather than arr.length - 1
+    # bisectモジュール（C実装）で探索する。LEFT/RIGHTの判定はループの外で1回だけ行う
+    if bisect_type == BisectTypeEnum.LEFT:
+        return bisect.bisect_left(arr, target)
+    return bisect.bisect_right(arr, target)
+
+
+def search_many(arr: Sequence[T], targets, bisect_type: BisectTypeEnum = BisectTypeEnum.LEFT) -> np.ndarray:
+    """
+    Find the insertion points for many targets at once (vectorized binary_search).
     
-    while left < right:
-        mid = (left + right) // 2  # Python uses // for integer division
+    Args:
+        arr: A sorted list or array
+        targets: The values to find the insertion points for (array-like)
+        bisect_type: The type of bisection (LEFT or RIGHT)
         
-        if bisect_type == BisectTypeEnum.LEFT:
-            if arr[mid] >= target:
-                right = mid
-            else:
-                left = mid + 1
-        else:  # RIGHT
-            if arr[mid] > target:
-                right = mid
-            else:
-                left = mid + 1
-                
-    return left
+    Returns:
+        An index array with the same shape as targets. Each index is what
+        binary_search would return for the corresponding target (nan is placed at the end).
+    """
+    return np.searchsorted(arr, targets, side=bisect_type.value)
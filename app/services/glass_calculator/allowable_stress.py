@@ -1,7 +1,102 @@
+import re
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+import numpy as np
+
+from app.services.binary_search import binary_search
+from app.services.binary_search.binary_search import BisectTypeEnum
 from app.services.glass_calculator.glass_layer import GlassLayer
 from app.services.glass_calculator.contracts.dataclasses import AllowableStressTerms, FractureStrength, IAllowableStress, StressLimits
 from app.services.glass_calculator.contracts.enums import GlassTypeEnum
 
+# 板厚の区分のキー（下限・上限は省略可、"t>20" は下限のみ）
+THICKNESS_RANGE_PATTERN = re.compile(
+    r"^(?:(?P<lower>[\d.]+)(?P<lower_op><=|<))?t(?:(?P<upper_op><=|>)(?P<upper>[\d.]+))?$"
+)
+
+
+@dataclass(frozen=True)
+class AllowableStressTable:
+    """
+    ガラスの種類ごとの板厚区分（上限の昇順）と許容応力値
+    """
+    upper: np.ndarray # 区分の上限（含む）
+    lower: np.ndarray # 区分の下限
+    lower_inclusive: np.ndarray # 下限を含む区分
+    stresses: Tuple[IAllowableStress, ...] # 区分ごとの許容応力値
+    short_term: np.ndarray # 区分ごとの短期許容応力（面内）
+    long_term: np.ndarray # 区分ごとの長期許容応力（面内）
+
+    def lookup(self, outer_thickness: np.ndarray) -> np.ndarray:
+        """
+        板厚の配列から区分の添字を求める
+
+        Returns:
+            np.ndarray: 区分の添字（どの区分にも入らない板厚、nanは-1）
+        """
+        index = binary_search.search_many(self.upper, outer_thickness, BisectTypeEnum.LEFT)
+        clipped = np.minimum(index, len(self.upper) - 1)
+        lower = self.lower[clipped]
+        above_lower = np.where(self.lower_inclusive[clipped], outer_thickness >= lower, outer_thickness > lower)
+        return np.where((index < len(self.upper)) & above_lower, clipped, -1)
+
+    @classmethod
+    def compile(cls, ranges: Dict[str, dict]) -> "AllowableStressTable":
+        """
+        allowable_stress_db の1種類分を配列に変換する
+        """
+        rows = []
+        for key, stress in ranges.items():
+            match = THICKNESS_RANGE_PATTERN.match(key)
+            if match is None:
+                raise ValueError(f"無効な板厚の区分: {key}")
+            lower, lower_inclusive, upper = -np.inf, False, np.inf
+            if match["lower"] is not None:
+                lower, lower_inclusive = float(match["lower"]), match["lower_op"] == "<="
+            if match["upper_op"] == "<=":
+                upper = float(match["upper"])
+            elif match["upper_op"] == ">":
+                lower, lower_inclusive = float(match["upper"]), False
+            rows.append((upper, lower, lower_inclusive, _to_allowable_stress(stress)))
+        rows.sort(key=lambda row: row[0])
+
+        def frozen_array(values, dtype):
+            array = np.array(values, dtype=dtype)
+            array.setflags(write=False)
+            return array
+
+        stresses = tuple(row[3] for row in rows)
+        return cls(
+            upper=frozen_array([row[0] for row in rows], np.float64),
+            lower=frozen_array([row[1] for row in rows], np.float64),
+            lower_inclusive=frozen_array([row[2] for row in rows], bool),
+            stresses=stresses,
+            short_term=frozen_array([stress.allowableStress.shortTerm.inplane for stress in stresses], np.float64),
+            long_term=frozen_array([stress.allowableStress.longTerm.inplane for stress in stresses], np.float64),
+        )
+
+
+def _to_allowable_stress(allowable_stress: dict) -> IAllowableStress:
+    # 辞書からIAllowableStressオブジェクトに変換
+    return IAllowableStress(
+        fracturesStrength=FractureStrength(
+            inplane=allowable_stress["fracturesStrength"]["inplane"],
+            edge=allowable_stress["fracturesStrength"]["edge"],
+        ),
+        allowableStress=AllowableStressTerms(
+            shortTerm=StressLimits(
+                inplane=allowable_stress["allowableStress"]["shortTerm"]["inplane"],
+                edge=allowable_stress["allowableStress"]["shortTerm"]["edge"],
+            ),
+            longTerm=StressLimits(
+                inplane=allowable_stress["allowableStress"]["longTerm"]["inplane"],
+                edge=allowable_stress["allowableStress"]["longTerm"]["edge"],
+            ),
+        ),
+    )
+
+
 class GlassAllowableUnitStress:
     def __init__(self, glass_layer: GlassLayer, glass_type: GlassTypeEnum):
         self.glass_layer = glass_layer
@@ -9,6 +104,7 @@ class GlassAllowableUnitStress:
         self.allowable_stress = self.calculate_allowable_stress()
     
     # データベースは大規模なので、クラス変数として定義
+    # キーは板厚の区分（"t<=8", "8<t<=12", "6<=t<=10", "t>20" の形式）
     allowable_stress_db = {
         GlassTypeEnum.FLOAT: {
             "t<=8": {
@@ -150,73 +246,25 @@ class GlassAllowableUnitStress:
         },
     }
 
+    # 板厚の区分を配列に変換したもの（ガラスの種類ごとに1回だけ作成する）
+    compiled_allowable_stress: Dict[GlassTypeEnum, "AllowableStressTable"] = {}
+
     def calculate_allowable_stress(self) -> IAllowableStress:
         """
         ガラスの許容応力値を計算する
         
         Returns:
-            IAllowableStress: 許容応力値のオブジェクト
+            IAllowableStress: 許容応力値のオブジェクト（同じ板厚区分では同一のオブジェクト）
         
         Raises:
             ValueError: 無効なガラスタイプまたは厚さの場合
         """
         outer_thickness = min(self.glass_layer.get_outer_layer_thickness())
-        allowable_stress = None
-
-        if self.glass_type == GlassTypeEnum.FLOAT:
-            if outer_thickness <= 8:
-                allowable_stress = self.allowable_stress_db[GlassTypeEnum.FLOAT]["t<=8"]
-            elif 8 < outer_thickness <= 12:
-                allowable_stress = self.allowable_stress_db[GlassTypeEnum.FLOAT]["8<t<=12"]
-            elif 12 < outer_thickness <= 20:
-                allowable_stress = self.allowable_stress_db[GlassTypeEnum.FLOAT]["12<t<=20"]
-            elif outer_thickness > 20:
-                allowable_stress = self.allowable_stress_db[GlassTypeEnum.FLOAT]["t>20"]
-                
-        elif self.glass_type == GlassTypeEnum.WIRED:
-            if 6 <= outer_thickness <= 10:
-                allowable_stress = self.allowable_stress_db[GlassTypeEnum.WIRED]["6<=t<=10"]
-            else:
-                raise ValueError(f"無効なガラスタイプまたは厚さ: {self.glass_type}, {outer_thickness}")
-                
-        elif self.glass_type == GlassTypeEnum.WIRE_PATTERNED:
-            if 6 <= outer_thickness <= 8:
-                allowable_stress = self.allowable_stress_db[GlassTypeEnum.WIRE_PATTERNED]["6<=t<=8"]
-                
-        elif self.glass_type == GlassTypeEnum.TEMPERED:
-            if 4 <= outer_thickness <= 19:
-                allowable_stress = self.allowable_stress_db[GlassTypeEnum.TEMPERED]["4<=t<=19"]
-                
-        elif self.glass_type == GlassTypeEnum.DOUBLE:
-            if 6 <= outer_thickness <= 12:
-                allowable_stress = self.allowable_stress_db[GlassTypeEnum.DOUBLE]["6<=t<=12"]
-                
-        if allowable_stress is None:
+        table = self.compiled_allowable_stress.get(self.glass_type)
+        index = -1 if table is None else int(table.lookup(np.array([outer_thickness], dtype=np.float64))[0])
+        if index < 0:
             raise ValueError(f"無効なガラスタイプまたは厚さ: {self.glass_type}, {outer_thickness}")
-            
-        # 辞書からIAllowableStressオブジェクトに変換
-        fracturesStrength = FractureStrength(
-            inplane=allowable_stress["fracturesStrength"]["inplane"],
-            edge=allowable_stress["fracturesStrength"]["edge"]
-        )
-        
-        shortTerm = StressLimits(
-            inplane=allowable_stress["allowableStress"]["shortTerm"]["inplane"],
-            edge=allowable_stress["allowableStress"]["shortTerm"]["edge"]
-        )
-        
-        longTerm = StressLimits(
-            inplane=allowable_stress["allowableStress"]["longTerm"]["inplane"],
-            edge=allowable_stress["allowableStress"]["longTerm"]["edge"]
-        )
-        
-        return IAllowableStress(
-            fracturesStrength=fracturesStrength,
-            allowableStress=AllowableStressTerms(
-                shortTerm=shortTerm,
-                longTerm=longTerm
-            )
-        )
+        return table.stresses[index]  # type: ignore
 
     def check_stress(self, stress: float) -> float:
         """
@@ -234,4 +282,38 @@ class GlassAllowableUnitStress:
         if stress < 0:
             raise ValueError("圧縮応力のチェックは許可されていません")
         else:
-            return stress
\ No newline at end of file
+            return stress
+
+    @classmethod
+    def get_allowable_stress_batch(cls, glass_type: GlassTypeEnum, outer_thickness: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        外側の板厚（小さい方）の配列に対する面内の許容応力を一括で求める
+
+        Args:
+            glass_type: ガラスの種類
+            outer_thickness: 外側の板厚の配列 [mm]
+
+        Returns:
+            Dict[str, np.ndarray]: shortTerm, longTerm（求まらない行はnan）と行ごとのエラーメッセージ error
+        """
+        outer_thickness = np.asarray(outer_thickness, dtype=np.float64)
+        short_term = np.full(outer_thickness.shape, np.nan)
+        long_term = np.full(outer_thickness.shape, np.nan)
+        error = np.full(outer_thickness.shape, None, dtype=object)
+
+        table = cls.compiled_allowable_stress.get(glass_type)
+        found = np.zeros(outer_thickness.shape, dtype=bool)
+        if table is not None:
+            index = table.lookup(outer_thickness)
+            found = index >= 0
+            short_term[found] = table.short_term[index[found]]
+            long_term[found] = table.long_term[index[found]]
+        for i in np.flatnonzero(~found & ~np.isnan(outer_thickness)):
+            error.flat[i] = f"無効なガラスタイプまたは厚さ: {glass_type}, {outer_thickness.flat[i]}"
+        return {"shortTerm": short_term, "longTerm": long_term, "error": error}
+
+
+GlassAllowableUnitStress.compiled_allowable_stress = {
+    glass_type: AllowableStressTable.compile(ranges)
+    for glass_type, ranges in GlassAllowableUnitStress.allowable_stress_db.items()
+}
@@ -0,0 +1,72 @@
+from typing import List
+
+import numpy as np
+
+from app.services.glass_calculator.allowable_stress import GlassAllowableUnitStress
+from app.services.glass_calculator.contracts.enums import InterlayerMaterialTypeEnum, SupportTypeEnum
+from app.services.glass_calculator.glass_calculator import CalculateStress
+from app.services.glass_calculator.glass_layer import GlassLayer
+
+
+class WindCapacity:
+    """
+    最大風圧（耐風圧性能）の計算クラス
+    全ての計算クラスの応力・変位は荷重wに比例するため、単位荷重（w=1）の結果から
+    許容応力・変位の制限値に達する風圧を直接求めます。
+    """
+
+    @staticmethod
+    def calculate_batch(panels) -> List[dict]:
+        """
+        パネルごとの最大風圧を一括で求める
+
+        Args:
+            panels: CapacityItemScheme のリスト
+
+        Returns:
+            List[dict]: 入力順の w_short_term, w_long_term, w_deflection, w_max, governing またはエラー
+        """
+        groups = {}
+        for index, panel in enumerate(panels):
+            groups.setdefault((SupportTypeEnum(panel.support), panel.glass_type), []).append(index)
+
+        results: List[dict] = [{}] * len(panels)
+        for (support, glass_type), indices in groups.items():
+            group = [panels[i] for i in indices]
+            for i, row in zip(indices, WindCapacity._calculate_group(support, glass_type, group)):
+                results[i] = row
+        return results
+
+    @staticmethod
+    def _calculate_group(support, glass_type, panels) -> List[dict]:
+        def column(name):
+            return np.array([np.nan if getattr(panel, name) is None else getattr(panel, name) for panel in panels], dtype=np.float64)
+
+        layers = [panel.t for panel in panels]
+        thickness = GlassLayer.get_equivalent_thickness_batch(layers, InterlayerMaterialTypeEnum.SG)
+        edges = {name: column(name) for name in ("a", "b", "a1", "b1")}
+        with np.errstate(divide="ignore", invalid="ignore"):
+            unit = CalculateStress.calculate_edges(support, edges, thickness, 1.0, column("E"))
+            outer_thickness = np.array([min(layer[0], layer[-1]) if layer else np.nan for layer in layers])
+            allowable = GlassAllowableUnitStress.get_allowable_stress_batch(glass_type, outer_thickness)
+
+            w_short_term = allowable["shortTerm"] / unit["sigma"]
+            w_long_term = allowable["longTerm"] / unit["sigma"]
+            w_deflection = column("deflection_limit") / unit["delta"]
+        w_max = np.fmin(w_short_term, w_deflection)
+        governing = np.where(w_deflection < w_short_term, "deflection", "short_term")
+
+        rows = []
+        for i, panel in enumerate(panels):
+            error = unit["error"][i] or (None if thickness[i] > 0 else "板厚が指定されていません") or allowable["error"][i]
+            if error is not None:
+                rows.append({"error": error})
+                continue
+            rows.append({
+                "w_short_term": float(w_short_term[i]),
+                "w_long_term": float(w_long_term[i]),
+                "w_deflection": None if np.isnan(w_deflection[i]) else float(w_deflection[i]),
+                "w_max": float(w_max[i]),
+                "governing": str(governing[i]),
+            })
+        return rows
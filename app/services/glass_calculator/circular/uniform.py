@@ -1,5 +1,12 @@
+from typing import Dict
+
+import numpy as np
+
+from app.services.glass_calculator.coefficient_tables import get_coefficient_table
+from app.services.glass_calculator.contracts.enums import SupportTypeEnum
 from app.services.glass_calculator.glass_material import GlassMaterial
 from app.services.glass_calculator.glass_layer import GlassLayer
+from app.services.glass_calculator.panel_batch import PanelBatch
 
 
 class CircleUniformLoadGlass:
@@ -7,6 +14,9 @@ class CircleUniformLoadGlass:
     CircleSupportedUniformLoadGlass class
     Calculates stress and displacement for a circular glass plate under uniform load.
     """
+
+    # Coefficient table (constant alpha, beta)
+    coefficient_table = get_coefficient_table(SupportTypeEnum.CIRCULAR_UNIFORM)
     
     def __init__(self, radius: float, layer: GlassLayer, w: float, material:GlassMaterial):
         """
@@ -30,9 +40,10 @@ class CircleUniformLoadGlass:
         Returns:
             float: Stress on the plate [N/mm²]
         """
-        thickness = self.layer.get_equivalent_thickness()
-        sigma = 1.212 * (self.w * self.radius**2) / thickness**2
-        print(f"1.212 * ({self.w} * {self.radius}**2) / {thickness}**2")
+        thickness = self.layer.get_stress_thickness()
+        beta = float(self.coefficient_table.values["beta"])
+        sigma = beta * (self.w * self.radius**2) / self.layer.get_stress_thickness_squared()
+        print(f"{beta} * ({self.w} * {self.radius}**2) / {thickness}**2")
         return sigma
     
     def calculate_displacement(self) -> float:
@@ -43,6 +54,48 @@ class CircleUniformLoadGlass:
             float: Displacement of the plate [mm]
         """
         e = self.constants.E
-        thickness = self.layer.get_equivalent_thickness()
-        delta = 0.756 * (self.w * self.radius**4) / (e * thickness**3)
+        alpha = float(self.coefficient_table.values["alpha"])
+        delta = alpha * (self.w * self.radius**4) / (e * self.layer.get_equivalent_thickness_cubed())
         return delta
+
+    @classmethod
+    def calculate_batch(
+        cls,
+        radius: np.ndarray,
+        thickness: np.ndarray,
+        w: np.ndarray,
+        E: np.ndarray,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate stress and displacement for many circular plates at once
+
+        Args:
+            radius: Radii of the circular plates [mm]
+            thickness: Equivalent thicknesses [mm]
+            w: Loads [N/mm²]
+            E: Young's moduli [N/mm²]
+
+        Returns:
+            Dict[str, np.ndarray]: sigma, delta and the per-row error message (always None)
+        """
+        r = np.asarray(radius, dtype=np.float64)
+        beta = cls.coefficient_table.values["beta"]
+        alpha = cls.coefficient_table.values["alpha"]
+        sigma = beta * (w * r**2) / thickness**2
+        delta = alpha * (w * r**4) / (E * thickness**3)
+        return {"sigma": sigma, "delta": delta, "error": np.full(r.shape, None, dtype=object)}
+
+    @classmethod
+    def calculate_panels(cls, panels: PanelBatch, thickness: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Calculate a PanelBatch of circular plates at once
+
+        Args:
+            panels: PanelBatch of circular plates (diameter column "D")
+            thickness: Equivalent thicknesses [mm]
+
+        Returns:
+            Dict[str, np.ndarray]: sigma, delta and the per-row error message (always None)
+        """
+        columns = panels.columns
+        return cls.calculate_batch(columns["D"] / 2, thickness, columns["w"], columns["E"])
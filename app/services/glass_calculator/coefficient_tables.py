@@ -0,0 +1,241 @@
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Mapping, Sequence
+
+import numpy as np
+
+from app.services.glass_calculator.contracts.enums import SupportTypeEnum
+
+
+@dataclass(frozen=True)
+class CoefficientTable:
+    """
+    応力・変位計算用の係数テーブル
+    軸（辺長比など）と係数（alpha, beta）は書き換え不可の連続した配列として保持します。
+    """
+    support: SupportTypeEnum # 支持条件
+    version: str # テーブルの版（値を変更した場合に更新する）
+    source: str # 出典・備考
+    axes: Mapping[str, np.ndarray] # 参照する軸（昇順）
+    values: Mapping[str, np.ndarray] # 係数（alpha, beta）
+
+    @property
+    def version_key(self) -> str:
+        """計算結果に付ける係数テーブルの版（支持条件:版）"""
+        return f"{self.support.value}:{self.version}"
+
+    def interpolate(self, axis: str, name: str, x):
+        """
+        軸に沿って係数を線形補間する
+
+        Args:
+            axis: 軸の名前
+            name: 係数の名前（alpha, beta）
+            x: 軸の値（スカラーまたは配列）
+
+        Returns:
+            補間した係数（軸の範囲外は端の値。無限大の軸点は直前の有限な軸点と同じ値のため除く）
+        """
+        xp = self.axes[axis]
+        finite = np.isfinite(xp)
+        return np.interp(x, xp[finite], self.values[name][finite])
+
+
+def _frozen_array(values) -> np.ndarray:
+    array = np.array(values, dtype=np.float64, order="C")
+    array.setflags(write=False)
+    return array
+
+
+def _pad(rows: Sequence) -> np.ndarray:
+    """行ごとに長さの異なる入れ子のリストを、最後の次元をnanで埋めた配列に変換する"""
+    if not isinstance(rows[0][0], (list, tuple)):
+        width = max(len(row) for row in rows)
+        return np.array([list(row) + [np.nan] * (width - len(row)) for row in rows], dtype=np.float64)
+    padded = [_pad(row) for row in rows]
+    width = max(array.shape[-1] for array in padded)
+    return np.stack([
+        np.pad(array, [(0, 0)] * (array.ndim - 1) + [(0, width - array.shape[-1])], constant_values=np.nan)
+        for array in padded
+    ])
+
+
+_tables: Dict[SupportTypeEnum, CoefficientTable] = {}
+
+
+def register_coefficient_table(
+    support: SupportTypeEnum,
+    version: str,
+    source: str,
+    axes: Dict[str, object],
+    values: Dict[str, object],
+) -> CoefficientTable:
+    """
+    係数テーブルを登録する（新しい係数テーブルはこの関数で追加する）
+
+    Args:
+        support: 支持条件
+        version: テーブルの版
+        source: 出典・備考
+        axes: 参照する軸（行ごとに長さの異なる軸はnanで埋める）
+        values: 係数（行ごとに長さの異なる係数はnanで埋める）
+
+    Returns:
+        CoefficientTable: 登録した係数テーブル
+
+    Raises:
+        ValueError: 同じ支持条件のテーブルが登録済みの場合
+    """
+    if support in _tables:
+        raise ValueError(f"係数テーブルは登録済みです: {support}")
+    table = CoefficientTable(
+        support=support,
+        version=version,
+        source=source,
+        axes=MappingProxyType({name: _frozen_array(axis) for name, axis in axes.items()}),
+        values=MappingProxyType({name: _frozen_array(value) for name, value in values.items()}),
+    )
+    _tables[support] = table
+    return table
+
+
+def get_coefficient_table(support: SupportTypeEnum) -> CoefficientTable:
+    """
+    支持条件の係数テーブルを返す
+
+    Raises:
+        ValueError: 係数テーブルが登録されていない場合
+    """
+    try:
+        return _tables[support]
+    except KeyError:
+        raise ValueError(f"係数テーブルがありません: {support}")
+
+
+def coefficient_versions() -> Dict[str, str]:
+    """登録済みの係数テーブルの版（支持条件ごと）"""
+    return {support.value: table.version for support, table in _tables.items()}
+
+
+# 四辺支持・等分布荷重（b/a ごと）
+register_coefficient_table(
+    SupportTypeEnum.FOUR_UNIFORM,
+    version="1",
+    source="四辺単純支持・等分布荷重の係数表",
+    axes={"b_by_a": [1, 1.2, 1.5, 2, 3, 4, 5]},
+    values={
+        "beta": [0.272, 0.362, 0.476, 0.603, 0.711, 0.74, 0.748],
+        "alpha": [0.047, 0.065, 0.088, 0.116, 0.139, 0.146, 0.148],
+    },
+)
+
+# 三辺支持・等分布荷重（固定辺/フリー辺 ごと）
+register_coefficient_table(
+    SupportTypeEnum.THREE_UNIFORM,
+    version="1",
+    source="三辺単純支持（一辺自由）・等分布荷重の係数表",
+    axes={"b_by_a": [0.1, 0.3, 0.5, 0.7, 1.0, 1.2, 1.5, 2, 3, float('inf')]},
+    values={
+        "beta": [0.071, 0.195, 0.350, 0.511, 0.661, 0.715, 0.758, 0.783, 0.791, 0.791],
+        "alpha": [0.005, 0.036, 0.076, 0.108, 0.139, 0.150, 0.158, 0.164, 0.165, 0.165],
+    },
+)
+
+# 二辺支持・等分布荷重（固定辺/フリー辺 ごと）
+register_coefficient_table(
+    SupportTypeEnum.TWO_UNIFORM,
+    version="1",
+    source="二辺単純支持（二辺自由）・等分布荷重の係数表",
+    axes={"b_by_a": [0.5, 1, 2, float('inf')]},
+    values={
+        "beta": [0.765, 0.782, 0.791, 0.791],
+        "alpha": [0.160, 0.163, 0.165, 0.165],
+    },
+)
+
+# 円形周辺支持・等分布荷重（軸なしの定数）
+register_coefficient_table(
+    SupportTypeEnum.CIRCULAR_UNIFORM,
+    version="1",
+    source="円形周辺単純支持・等分布荷重の係数",
+    axes={},
+    values={"beta": 1.212, "alpha": 0.756},
+)
+
+# 四辺支持・部分等分布荷重（b/a, a'/a, b'/a ごと）
+# b'/a の軸は b/a ごとに異なり、b/a=1.4 の行は4点のみ（欠損はnan）
+register_coefficient_table(
+    SupportTypeEnum.FOUR_PARTIAL,
+    # 2: 表の行の値（step）の b'/a 方向の添字を b'/a から求めるように修正（保存した計算結果を使わないため更新）
+    version="2",
+    source="四辺単純支持・部分等分布荷重の係数表",
+    axes={
+        "b_by_a": [1, 1.4, 2],
+        "a1_by_a": [0.01, 0.2, 0.4, 0.6, 0.8, 1],
+        "b1_by_a": _pad([
+            [0.01, 0.2, 0.4, 0.6, 0.8, 1],
+            [0.01, 0.4, 0.8, 1.2],
+            [0.01, 0.4, 0.8, 1.2, 1.6, 2],
+        ]),
+    },
+    values={
+        "beta": _pad([
+            # b/a = 1（a'/a = 0.01, 0.2, 0.4, 0.6, 0.8, 1）
+            [
+                [2.988, 1.72, 1.322, 1.075, 0.888, 0.732],
+                [1.72, 1.206, 1.024, 0.866, 0.729, 0.603],
+                [1.322, 1.024, 0.801, 0.694, 0.592, 0.492],
+                [1.075, 0.866, 0.694, 0.563, 0.483, 0.403],
+                [0.888, 0.729, 0.592, 0.483, 0.397, 0.331],
+                [0.732, 0.603, 0.492, 0.403, 0.331, 0.272],
+            ],
+            # b/a = 1.4
+            [
+                [3.158, 1.501, 1.087, 0.824],
+                [1.683, 1.2, 0.925, 0.713],
+                [1.286, 0.968, 0.778, 0.61],
+                [1.042, 0.794, 0.654, 0.517],
+                [0.86, 0.656, 0.546, 0.435],
+                [0.708, 0.54, 0.451, 0.36],
+            ],
+            # b/a = 2
+            [
+                [3.226, 1.587, 1.184, 0.942, 0.767, 0.628],
+                [1.636, 1.288, 1.023, 0.831, 0.683, 0.561],
+                [1.23, 1.051, 0.872, 0.721, 0.598, 0.492],
+                [1.01, 0.87, 0.739, 0.62, 0.517, 0.426],
+                [0.831, 0.723, 0.622, 0.525, 0.439, 0.363],
+                [0.684, 0.596, 0.515, 0.436, 0.365, 0.302],
+            ],
+        ]),
+        "alpha": _pad([
+            # b/a = 1
+            [
+                [0.132, 0.128, 0.118, 0.106, 0.092, 0.077],
+                [0.128, 0.124, 0.115, 0.103, 0.09, 0.075],
+                [0.118, 0.115, 0.107, 0.097, 0.084, 0.07],
+                [0.106, 0.103, 0.097, 0.087, 0.076, 0.064],
+                [0.092, 0.09, 0.084, 0.076, 0.066, 0.056],
+                [0.077, 0.075, 0.07, 0.064, 0.056, 0.047],
+            ],
+            # b/a = 1.4
+            [
+                [0.169, 0.156, 0.133, 0.107],
+                [0.164, 0.153, 0.13, 0.105],
+                [0.153, 0.143, 0.122, 0.099],
+                [0.138, 0.129, 0.111, 0.09],
+                [0.12, 0.113, 0.097, 0.079],
+                [0.101, 0.095, 0.082, 0.066],
+            ],
+            # b/a = 2
+            [
+                [0.188, 0.176, 0.155, 0.133, 0.112, 0.093],
+                [0.183, 0.172, 0.152, 0.13, 0.11, 0.091],
+                [0.171, 0.161, 0.143, 0.123, 0.104, 0.086],
+                [0.154, 0.146, 0.13, 0.112, 0.095, 0.079],
+                [0.134, 0.128, 0.114, 0.098, 0.083, 0.069],
+                [0.113, 0.107, 0.096, 0.083, 0.07, 0.058],
+            ],
+        ]),
+    },
+)
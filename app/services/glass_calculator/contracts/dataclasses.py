@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(frozen=True)
 class FractureStrength:
     """
     破壊応力
@@ -8,7 +8,7 @@ class FractureStrength:
     inplane: float
     edge: float
 
-@dataclass
+@dataclass(frozen=True)
 class StressLimits:
     """
     面内、エッジ許容応力
@@ -16,7 +16,7 @@ class StressLimits:
     inplane: float
     edge: float
 
-@dataclass
+@dataclass(frozen=True)
 class AllowableStressTerms:
     """
     長期、短期許容応力
@@ -24,7 +24,7 @@ class AllowableStressTerms:
     shortTerm: StressLimits
     longTerm: StressLimits
 
-@dataclass
+@dataclass(frozen=True)
 class IAllowableStress:
     fracturesStrength: FractureStrength
     allowableStress: AllowableStressTerms
\ No newline at end of file
@@ -11,4 +11,40 @@ class GlassTypeEnum(Enum):
 class InterlayerMaterialTypeEnum(Enum):
     SG = "sg"
     PVB = "pvb"
-    EVA = "eva"
\ No newline at end of file
+    EVA = "eva"
+
+class LoadDurationEnum(Enum):
+    GUST = "3s" # 突風（風圧）
+    MINUTE = "1min" # 数分程度（人の荷重など）
+    HOUR = "1h" # 数時間程度
+    DAY = "1day" # 1日程度
+    MONTH = "1month" # 1か月程度（積雪）
+    PERMANENT = "50year" # 長期（自重）
+
+class SupportTypeEnum(Enum):
+    FOUR_UNIFORM = "four-uniform"
+    FOUR_PARTIAL = "four-partial"
+    THREE_UNIFORM = "three-uniform"
+    TWO_UNIFORM = "two-uniform"
+    CIRCULAR_UNIFORM = "circular-uniform"
+
+class LookupModeEnum(Enum):
+    STEP = "step" # 辺長比以上で最も近い表の行の係数（従来の方法）
+    LINEAR = "linear" # 表の行の間を線形補間した係数
+
+class SolverEnum(Enum):
+    TABLE = "table" # 係数表による計算（従来の方法）
+    FEM = "fem" # 板のFEMによる計算
+    AUTO = "auto" # 係数表の範囲外の場合のみFEMで計算
+    NONLINEAR = "nonlinear" # 大たわみ（幾何学的非線形）を考慮したFEMによる計算
+
+class EdgeConditionEnum(Enum):
+    SIMPLE = "simple" # 単純支持
+    CLAMPED = "clamped" # 固定
+    FREE = "free" # 自由
+
+class LoadCaseTypeEnum(Enum):
+    WIND = "wind" # 風圧
+    SELF_WEIGHT = "self_weight" # 自重（傾斜したガラスの面外方向の成分）
+    SNOW = "snow" # 積雪
+    MAINTENANCE = "maintenance" # 点検・清掃時の人の荷重
@@ -0,0 +1,610 @@
+import functools
+import math
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.services.glass_calculator.contracts.enums import EdgeConditionEnum, SupportTypeEnum
+from app.services.glass_calculator.glass_layer import GlassLayer
+from app.services.glass_calculator.glass_material import GlassMaterial
+
+if TYPE_CHECKING:
+    from app.services.glass_calculator.panel_batch import PanelBatch
+
+# 短辺方向の要素分割数の既定値
+DEFAULT_DIVISIONS = 16
+
+# 要素数の上限（細長い板で分割が多くなりすぎないようにする）
+MAX_ELEMENTS = 40000
+
+# 支持条件ごとの辺の条件（下辺 y=0, 右辺 x=lx, 上辺 y=ly, 左辺 x=0 の順）
+# 三辺・二辺支持はフリー辺（x方向）が支持辺間のスパン、固定辺（y方向）が支持辺の長さ
+SUPPORT_EDGES = {
+    SupportTypeEnum.FOUR_UNIFORM: (EdgeConditionEnum.SIMPLE,) * 4,
+    SupportTypeEnum.FOUR_PARTIAL: (EdgeConditionEnum.SIMPLE,) * 4,
+    SupportTypeEnum.THREE_UNIFORM: (
+        EdgeConditionEnum.SIMPLE, EdgeConditionEnum.SIMPLE, EdgeConditionEnum.FREE, EdgeConditionEnum.SIMPLE,
+    ),
+    SupportTypeEnum.TWO_UNIFORM: (
+        EdgeConditionEnum.FREE, EdgeConditionEnum.SIMPLE, EdgeConditionEnum.FREE, EdgeConditionEnum.SIMPLE,
+    ),
+}
+
+# ACM要素（12自由度の長方形板要素）の多項式の次数（ξ^p η^q）
+_ACM_TERMS = ((0, 0), (1, 0), (0, 1), (2, 0), (1, 1), (0, 2), (3, 0), (2, 1), (1, 2), (0, 3), (3, 1), (1, 3))
+
+# 要素の節点（局所座標、反時計回り）
+_ELEMENT_CORNERS = ((0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0))
+
+# 3点ガウス積分（区間0〜1）
+_GAUSS_POINTS = (0.5 - math.sqrt(0.15), 0.5, 0.5 + math.sqrt(0.15))
+_GAUSS_WEIGHTS = (5 / 18, 8 / 18, 5 / 18)
+
+
+def _monomials(xi: float, eta: float, dxi: int = 0, deta: int = 0) -> np.ndarray:
+    """ACM要素の多項式（またはその偏微分）の値"""
+    values = np.zeros(len(_ACM_TERMS))
+    for k, (p, q) in enumerate(_ACM_TERMS):
+        if p < dxi or q < deta:
+            continue
+        coefficient = math.perm(p, dxi) * math.perm(q, deta)
+        values[k] = coefficient * xi ** (p - dxi) * eta ** (q - deta)
+    return values
+
+
+@functools.lru_cache(maxsize=64)
+def _acm_shape(hx: float, hy: float) -> np.ndarray:
+    """ACM要素の節点自由度から多項式の係数を求める行列 (12, 12)"""
+    nodal = []
+    for xi, eta in _ELEMENT_CORNERS:
+        nodal.append(_monomials(xi, eta))
+        nodal.append(_monomials(xi, eta, 1, 0) / hx)
+        nodal.append(_monomials(xi, eta, 0, 1) / hy)
+    return np.linalg.inv(np.array(nodal))
+
+
+@functools.lru_cache(maxsize=64)
+def acm_gradients(hx: float, hy: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    ACM要素の傾き (∂w/∂x, ∂w/∂y) を求める行列（大たわみ解析の膜ひずみに使う）
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: ガウス点の行列 (9, 2, 12)、ガウス点の重み（面積を含む） (9,)、
+        節点の行列 (4, 2, 12)
+    """
+    shape = _acm_shape(hx, hy)
+
+    def gradient(xi, eta):
+        return np.array([_monomials(xi, eta, 1, 0) / hx, _monomials(xi, eta, 0, 1) / hy]) @ shape
+
+    points = [(xi, eta) for xi in _GAUSS_POINTS for eta in _GAUSS_POINTS]
+    weights = np.array([wx * wy * hx * hy for wx in _GAUSS_WEIGHTS for wy in _GAUSS_WEIGHTS])
+    return (
+        np.array([gradient(xi, eta) for xi, eta in points]),
+        weights,
+        np.array([gradient(xi, eta) for xi, eta in _ELEMENT_CORNERS]),
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _acm_element(hx: float, hy: float, nu: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    ACM要素の要素剛性（曲げ剛性D=1）、単位荷重の等価節点力、節点での曲率を求める行列
+
+    節点の自由度は (w, ∂w/∂x, ∂w/∂y)。曲率は (∂²w/∂x², ∂²w/∂y², 2∂²w/∂x∂y)。
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: 要素剛性 (12, 12)、等価節点力 (12,)、節点の曲率 (4, 3, 12)
+    """
+    shape = _acm_shape(hx, hy)
+
+    def curvature(xi, eta):
+        return np.array([
+            _monomials(xi, eta, 2, 0) / hx ** 2,
+            _monomials(xi, eta, 0, 2) / hy ** 2,
+            2 * _monomials(xi, eta, 1, 1) / (hx * hy),
+        ]) @ shape
+
+    rigidity = np.array([[1, nu, 0], [nu, 1, 0], [0, 0, (1 - nu) / 2]])
+    stiffness = np.zeros((12, 12))
+    load = np.zeros(12)
+    for xi, weight_xi in zip(_GAUSS_POINTS, _GAUSS_WEIGHTS):
+        for eta, weight_eta in zip(_GAUSS_POINTS, _GAUSS_WEIGHTS):
+            weight = weight_xi * weight_eta * hx * hy
+            b = curvature(xi, eta)
+            stiffness += weight * b.T @ rigidity @ b
+            load += weight * _monomials(xi, eta) @ shape
+    corners = np.array([curvature(xi, eta) for xi, eta in _ELEMENT_CORNERS])
+    return stiffness, load, corners
+
+
+class RectangularPlateFEM:
+    """
+    長方形板の線形FEM（Kirchhoff板、ACM要素）
+    要素は等間隔の格子で、全要素の要素剛性は同じため1回だけ計算し、疎行列に一括で組み立てます。
+    剛性行列は曲げ剛性D=1で組み立てて分解し（板厚・ヤング係数によらない）、変位は荷重/Dを解いて求めます。
+    同じ形状・辺の条件・分割数のモデルは get で共有するため、荷重（w、部分荷重、組み合わせ）や板厚だけが
+    異なる板は、分解済みの行列に対する前進・後退代入だけで計算できます。
+    """
+
+    def __init__(
+        self,
+        lx: float,
+        ly: float,
+        nu: float,
+        edges: Sequence[EdgeConditionEnum],
+        divisions: int = DEFAULT_DIVISIONS,
+    ):
+        """
+        コンストラクタ
+
+        Args:
+            lx: x方向の辺長 [mm]
+            ly: y方向の辺長 [mm]
+            nu: ポアソン比
+            edges: 辺の条件（下辺 y=0, 右辺 x=lx, 上辺 y=ly, 左辺 x=0 の順）
+            divisions: 短辺方向の要素分割数
+
+        Raises:
+            ValueError: 寸法・分割数が不正な場合、支持が不足する場合、要素数が上限を超える場合
+        """
+        if not (lx > 0 and ly > 0):
+            raise ValueError("FEM: 寸法は正の数値を入力してください")
+        if divisions < 1:
+            raise ValueError("FEM: 分割数は1以上を入力してください")
+        edges = tuple(EdgeConditionEnum(edge) for edge in edges)
+        if len(edges) != 4:
+            raise ValueError("FEM: 辺の条件は4辺分を指定してください")
+        supported = sum(edge != EdgeConditionEnum.FREE for edge in edges)
+        if EdgeConditionEnum.CLAMPED not in edges and supported < 2:
+            raise ValueError("FEM: 支持が不足しています（単純支持は2辺以上、または固定辺が必要です）")
+
+        size = min(lx, ly) / divisions
+        self.nx = max(int(math.ceil(lx / size - 1e-9)), 1)
+        self.ny = max(int(math.ceil(ly / size - 1e-9)), 1)
+        if self.nx * self.ny > MAX_ELEMENTS:
+            raise ValueError(f"FEM: 要素数が{MAX_ELEMENTS}を超えています。分割数を小さくしてください")
+
+        self.lx = lx
+        self.ly = ly
+        self.nu = nu
+        self.edges = edges
+        self.divisions = divisions
+        self.hx = lx / self.nx
+        self.hy = ly / self.ny
+
+        # 要素の節点番号（節点番号は j*(nx+1)+i）と自由度番号
+        i, j = np.meshgrid(np.arange(self.nx), np.arange(self.ny), indexing="xy")
+        first = (j * (self.nx + 1) + i).ravel()
+        self.element_nodes = np.stack([first, first + 1, first + self.nx + 2, first + self.nx + 1], axis=1)
+        self.element_dofs = (3 * self.element_nodes[:, :, None] + np.arange(3)).reshape(-1, 12)
+        self.node_count = (self.nx + 1) * (self.ny + 1)
+        self.dof_count = 3 * self.node_count
+        self.free_dofs = np.setdiff1d(np.arange(self.dof_count), self._constrained_dofs())
+
+        self.element_stiffness, self.element_load, self.element_curvature = _acm_element(self.hx, self.hy, nu)
+        self.stiffness = self._assemble()
+        self._factorization = None
+        self._factorization_lock = threading.Lock()
+        self._unit_loads: Dict[Optional[Tuple[float, float]], np.ndarray] = {}
+        self.moment_operators = self._assemble_moment_operators()
+
+    @staticmethod
+    def signature(
+        lx: float, ly: float, nu: float, edges: Sequence[EdgeConditionEnum], divisions: int = DEFAULT_DIVISIONS
+    ) -> tuple:
+        """モデル（剛性行列）を共有できる入力の組（寸法、ポアソン比、辺の条件、分割数）"""
+        return (float(lx), float(ly), float(nu), tuple(EdgeConditionEnum(edge) for edge in edges), int(divisions))
+
+    @classmethod
+    def get(
+        cls, lx: float, ly: float, nu: float, edges: Sequence[EdgeConditionEnum], divisions: int = DEFAULT_DIVISIONS
+    ) -> "RectangularPlateFEM":
+        """
+        モデルを返す（同じ signature のモデルは分解済みの剛性行列ごと再利用する）
+
+        Raises:
+            ValueError: モデルを生成できない場合（コンストラクタと同じ）
+        """
+        key = cls.signature(lx, ly, nu, edges, divisions)
+        with _models_lock:
+            model = _models.get(key)
+            if model is not None:
+                _models.move_to_end(key)
+                _model_stats["hits"] += 1
+                return model
+            _model_stats["misses"] += 1
+        model = cls(*key)
+        with _models_lock:
+            model = _models.setdefault(key, model)
+            _models.move_to_end(key)
+            while len(_models) > MODEL_CACHE_SIZE:
+                _models.popitem(last=False)
+                _model_stats["evictions"] += 1
+        return model
+
+    def _constrained_dofs(self) -> np.ndarray:
+        # 単純支持は w と辺方向の傾き、固定は w と両方向の傾きを拘束する
+        node = np.arange(self.node_count).reshape(self.ny + 1, self.nx + 1)
+        edge_nodes = (node[0, :], node[:, -1], node[-1, :], node[:, 0])
+        tangent = (1, 2, 1, 2)  # 下辺・上辺は ∂w/∂x、右辺・左辺は ∂w/∂y
+        constrained = []
+        for edge, nodes, tangent_dof in zip(self.edges, edge_nodes, tangent):
+            if edge == EdgeConditionEnum.SIMPLE:
+                constrained += [3 * nodes, 3 * nodes + tangent_dof]
+            elif edge == EdgeConditionEnum.CLAMPED:
+                constrained += [3 * nodes, 3 * nodes + 1, 3 * nodes + 2]
+        return np.unique(np.concatenate(constrained))
+
+    def _assemble(self):
+        # 拘束していない自由度の剛性行列（D=1、CSC形式）
+        from scipy import sparse
+
+        rows = np.repeat(self.element_dofs, 12, axis=1).ravel()
+        cols = np.tile(self.element_dofs, (1, 12)).ravel()
+        values = np.tile(self.element_stiffness.ravel(), len(self.element_dofs))
+        stiffness = sparse.coo_matrix((values, (rows, cols)), shape=(self.dof_count, self.dof_count)).tocsc()
+        return stiffness[self.free_dofs][:, self.free_dofs]
+
+    def _assemble_moment_operators(self):
+        # 変位（全自由度）から節点の曲げモーメント（D=1。要素の節点での値の平均）を求める疎行列（Mx, My, Mxy）
+        from scipy import sparse
+
+        count = np.bincount(self.element_nodes.ravel(), minlength=self.node_count)
+        kxx, kyy, kxy = self.element_curvature[:, 0], self.element_curvature[:, 1], self.element_curvature[:, 2] / 2
+        rows = np.repeat(self.element_nodes, 12, axis=1).ravel()
+        cols = np.repeat(self.element_dofs[:, None, :], 4, axis=1).ravel()
+        weight = np.repeat(1 / count[self.element_nodes], 12, axis=1).ravel()
+        operators = []
+        for coefficient in (kxx + self.nu * kyy, kyy + self.nu * kxx, (1 - self.nu) * kxy):
+            values = np.tile(coefficient.ravel(), len(self.element_nodes)) * weight
+            operators.append(
+                sparse.coo_matrix((values, (rows, cols)), shape=(self.node_count, self.dof_count)).tocsr()
+            )
+        return operators
+
+    @staticmethod
+    def rigidity(thickness, E, nu) -> np.ndarray:
+        """曲げ剛性 D = E t³ / 12(1-ν²) [N·mm]"""
+        return np.asarray(E) * np.asarray(thickness) ** 3 / (12 * (1 - nu ** 2))
+
+    def load_vector(self, w: float, patch: Optional[Tuple[float, float]] = None) -> np.ndarray:
+        """
+        等分布荷重の荷重ベクトル（拘束していない自由度）
+        荷重ケースを組み合わせる場合は荷重ベクトルを足し合わせます（線形のため）。
+
+        Args:
+            w: 荷重 [N/mm²]
+            patch: 部分荷重の範囲（x方向, y方向の長さ）[mm]。板の中央に載荷する。Noneの場合は全面
+
+        Returns:
+            np.ndarray: 荷重ベクトル
+        """
+        key = None if patch is None else (float(patch[0]), float(patch[1]))
+        unit = self._unit_loads.get(key)
+        if unit is None:
+            if patch is None:
+                intensity = np.ones(len(self.element_dofs))
+            else:
+                # 要素と載荷範囲の重なりの面積比で荷重を配分する
+                def overlap(length, count, size, loaded):
+                    lower = np.arange(count) * size
+                    start, stop = (length - loaded) / 2, (length + loaded) / 2
+                    return np.clip(np.minimum(lower + size, stop) - np.maximum(lower, start), 0, None) / size
+
+                intensity = np.outer(
+                    overlap(self.ly, self.ny, self.hy, patch[1]), overlap(self.lx, self.nx, self.hx, patch[0])
+                ).ravel()
+            load = np.zeros(self.dof_count)
+            np.add.at(load, self.element_dofs, intensity[:, None] * self.element_load)
+            unit = self._unit_loads.setdefault(key, load[self.free_dofs])
+        return w * unit
+
+    def factorize(self):
+        """剛性行列のLU分解（初回のみ分解し、以降は分解済みのものを返す）"""
+        with self._factorization_lock:
+            if self._factorization is None:
+                from scipy.sparse.linalg import splu
+
+                try:
+                    self._factorization = splu(self.stiffness)
+                except RuntimeError:
+                    raise ValueError("FEM: 剛性行列が特異です。辺の条件を確認してください")
+            return self._factorization
+
+    def solve(self, loads: np.ndarray, rigidity) -> np.ndarray:
+        """
+        荷重ベクトルに対する変位（全自由度）を求める
+
+        Args:
+            loads: 荷重ベクトル (自由度,) または荷重ベクトルを列に並べた行列 (自由度, 荷重ケース数)
+            rigidity: 曲げ剛性 [N·mm]（荷重ケースごとに指定する場合は (荷重ケース数,)）
+
+        Returns:
+            np.ndarray: 変位 (全自由度,) または (全自由度, 荷重ケース数)
+
+        Raises:
+            ValueError: 剛性行列が特異な場合（支持が不足する場合）
+        """
+        solution = self.factorize().solve(np.asarray(loads, dtype=np.float64)) / rigidity
+        if not np.all(np.isfinite(solution)):
+            raise ValueError("FEM: 剛性行列が特異です。辺の条件を確認してください")
+        displacement = np.zeros((self.dof_count,) + solution.shape[1:])
+        displacement[self.free_dofs] = solution
+        return displacement
+
+    def evaluate(self, displacement: np.ndarray, thickness, rigidity) -> Dict[str, np.ndarray]:
+        """
+        変位から最大応力（主曲げ応力の絶対値の最大）と最大たわみを求める
+        曲げモーメントは要素の節点での値を節点ごとに平均します。
+
+        Args:
+            displacement: 変位 (全自由度,) または (全自由度, 荷重ケース数)
+            thickness: 板厚 [mm]
+            rigidity: 曲げ剛性 [N·mm]
+
+        Returns:
+            Dict[str, np.ndarray]: sigma [N/mm²], delta [mm]（荷重ケースごと）
+        """
+        displacement = displacement.reshape(self.dof_count, -1)
+        mx, my, mxy = (operator @ displacement for operator in self.moment_operators)
+        radius = np.sqrt(((mx - my) / 2) ** 2 + mxy ** 2)
+        moment = rigidity * np.max(np.abs((mx + my) / 2) + radius, axis=0)
+
+        return {
+            "sigma": 6 * moment / np.asarray(thickness) ** 2,
+            "delta": np.max(np.abs(displacement[0::3]), axis=0),
+        }
+
+
+# 分解済みの剛性行列を持つモデルのキャッシュ（signature ごと）
+MODEL_CACHE_SIZE = 32
+_models: "OrderedDict[tuple, RectangularPlateFEM]" = OrderedDict()
+_models_lock = threading.Lock()
+_model_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def model_cache_stats() -> dict:
+    """FEMのモデル（分解済みの剛性行列）のキャッシュの件数（ヒット、ミス、削除）"""
+    with _models_lock:
+        return {"size": len(_models), "max_size": MODEL_CACHE_SIZE, **_model_stats}
+
+
+class FEMPlateGlass:
+    """
+    FEMによるガラス板の応力・変位計算クラス
+    係数表の範囲外（辺長比、部分荷重の範囲）の板も計算できます。
+    """
+
+    # 係数表を使わないため版は無い
+    coefficient_table = None
+
+    def __init__(
+        self,
+        lx: float,
+        ly: float,
+        layer: GlassLayer,
+        w: float,
+        material: GlassMaterial,
+        edges: Sequence[EdgeConditionEnum],
+        patch: Optional[Tuple[float, float]] = None,
+        divisions: int = DEFAULT_DIVISIONS,
+    ):
+        """
+        コンストラクタ
+
+        Args:
+            lx: x方向の辺長 [mm]
+            ly: y方向の辺長 [mm]
+            layer: ガラス層オブジェクト
+            w: 荷重 [N/mm²]
+            material: マテリアルクラス
+            edges: 辺の条件（下辺 y=0, 右辺 x=lx, 上辺 y=ly, 左辺 x=0 の順）
+            patch: 部分荷重の範囲（x方向, y方向の長さ）[mm]。Noneの場合は全面
+            divisions: 短辺方向の要素分割数
+
+        Raises:
+            ValueError: FEMで計算できない場合
+        """
+        _require_scipy()
+        thickness = layer.get_equivalent_thickness()
+        if not thickness > 0:
+            raise ValueError("板厚が指定されていません")
+        _validate_patch(lx, ly, patch)
+
+        self.layer = layer
+        self.w = w
+        self.material = material
+        self.plate = RectangularPlateFEM.get(lx, ly, material.nu, edges, divisions)
+        rigidity = RectangularPlateFEM.rigidity(thickness, material.E, material.nu)
+        # 応力は応力用の有効板厚で求める（合わせガラスのPVB, EVAはたわみ用と異なる）
+        displacement = self.plate.solve(self.plate.load_vector(w, patch), rigidity)
+        result = self.plate.evaluate(displacement, layer.get_stress_thickness(), rigidity)
+        self.sigma = float(result["sigma"][0])
+        self.delta = float(result["delta"][0])
+
+    def calculate_stress(self) -> float:
+        """
+        ガラス板の応力を計算
+
+        Returns:
+            float: 板の応力 [N/mm²]
+        """
+        return self.sigma
+
+    def calculate_displacement(self) -> float:
+        """
+        ガラス板の変位を計算
+
+        Returns:
+            float: 板の変位 [mm]
+        """
+        return self.delta
+
+    @staticmethod
+    def geometry(
+        support: SupportTypeEnum, edges_by_name: Dict[str, float], edges: Optional[Sequence[EdgeConditionEnum]] = None
+    ) -> Tuple[float, float, Sequence[EdgeConditionEnum], Optional[Tuple[float, float]]]:
+        """
+        支持条件と入力の寸法（a, b, a1, b1 または free, fix）をFEMの寸法・辺の条件・載荷範囲に変換する
+
+        Args:
+            support: 支持条件
+            edges_by_name: 入力の寸法（四辺支持は a, b（, a1, b1）、三辺・二辺支持は free, fix）
+            edges: 辺の条件（Noneの場合は支持条件の既定値）
+
+        Returns:
+            Tuple: x方向の辺長、y方向の辺長、辺の条件、部分荷重の範囲（全面の場合はNone）
+
+        Raises:
+            ValueError: FEMで計算できない支持条件の場合
+        """
+        if support not in SUPPORT_EDGES:
+            raise ValueError(f"FEMで計算できない支持条件です: {support.value}")
+        if edges is None:
+            edges = SUPPORT_EDGES[support]
+        if support in (SupportTypeEnum.THREE_UNIFORM, SupportTypeEnum.TWO_UNIFORM):
+            lx, ly = edges_by_name["free"], edges_by_name["fix"]
+        else:
+            lx, ly = edges_by_name["a"], edges_by_name["b"]
+        patch = None
+        if support == SupportTypeEnum.FOUR_PARTIAL:
+            patch = (edges_by_name["a1"], edges_by_name["b1"])
+        return lx, ly, edges, patch
+
+    @staticmethod
+    def from_support(
+        support: SupportTypeEnum,
+        edges_by_name: Dict[str, float],
+        layer: GlassLayer,
+        w: float,
+        material: GlassMaterial,
+        edges: Optional[Sequence[EdgeConditionEnum]] = None,
+        divisions: int = DEFAULT_DIVISIONS,
+    ) -> "FEMPlateGlass":
+        """
+        支持条件と入力の寸法（a, b, a1, b1 または free, fix）からFEMの計算クラスを生成する
+
+        Args:
+            support: 支持条件
+            edges_by_name: 入力の寸法（四辺支持は a, b（, a1, b1）、三辺・二辺支持は free, fix）
+            layer: ガラス層オブジェクト
+            w: 荷重 [N/mm²]
+            material: マテリアルクラス
+            edges: 辺の条件（Noneの場合は支持条件の既定値）
+            divisions: 短辺方向の要素分割数
+
+        Raises:
+            ValueError: FEMで計算できない支持条件の場合
+        """
+        lx, ly, edges, patch = FEMPlateGlass.geometry(support, edges_by_name, edges)
+        return FEMPlateGlass(lx, ly, layer, w, material, edges, patch, divisions)
+
+    @staticmethod
+    def calculate_batch(
+        support: SupportTypeEnum,
+        edges_by_name: List[Dict[str, float]],
+        thickness: np.ndarray,
+        w: np.ndarray,
+        E: np.ndarray,
+        nu: np.ndarray,
+        edges: List[Optional[Sequence[EdgeConditionEnum]]],
+        divisions: List[int],
+        stress_thickness: Optional[np.ndarray] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        複数の板をFEMで一括計算する
+        モデル（寸法、ポアソン比、辺の条件、分割数）が同じ板は荷重ベクトルを列に並べ、
+        分解済みの剛性行列に対して1回の前進・後退代入で解きます。
+
+        Args:
+            support: 支持条件
+            edges_by_name: 板ごとの入力の寸法
+            thickness: 等価板厚の配列 [mm]
+            w: 荷重の配列 [N/mm²]
+            E: ヤング係数の配列 [N/mm²]
+            nu: ポアソン比の配列
+            edges: 板ごとの辺の条件（Noneの場合は支持条件の既定値）
+            divisions: 板ごとの短辺方向の要素分割数
+            stress_thickness: 応力用の有効板厚の配列 [mm]（Noneの場合は等価板厚）
+
+        Returns:
+            Dict[str, np.ndarray]: sigma, delta（エラー行はnan）と行ごとのエラーメッセージ error
+        """
+        count = len(edges_by_name)
+        if stress_thickness is None:
+            stress_thickness = thickness
+        sigma = np.full(count, np.nan)
+        delta = np.full(count, np.nan)
+        error = np.full(count, None, dtype=object)
+
+        groups: Dict[tuple, list] = {}
+        patches: List[Optional[Tuple[float, float]]] = [None] * count
+        for i in range(count):
+            try:
+                _require_scipy()
+                if not thickness[i] > 0:
+                    raise ValueError("板厚が指定されていません")
+                lx, ly, row_edges, patches[i] = FEMPlateGlass.geometry(support, edges_by_name[i], edges[i])
+                _validate_patch(lx, ly, patches[i])
+                key = RectangularPlateFEM.signature(lx, ly, nu[i], row_edges, divisions[i])
+            except ValueError as e:
+                error[i] = str(e)
+                continue
+            groups.setdefault(key, []).append(i)
+
+        for key, rows in groups.items():
+            try:
+                plate = RectangularPlateFEM.get(*key)
+                rigidity = RectangularPlateFEM.rigidity(thickness[rows], E[rows], key[2])
+                loads = np.stack([plate.load_vector(w[i], patches[i]) for i in rows], axis=1)
+                result = plate.evaluate(plate.solve(loads, rigidity), stress_thickness[rows], rigidity)
+            except ValueError as e:
+                error[rows] = str(e)
+                continue
+            sigma[rows] = result["sigma"]
+            delta[rows] = result["delta"]
+        return {"sigma": sigma, "delta": delta, "error": error}
+
+    @staticmethod
+    def calculate_panels(
+        panels: "PanelBatch", thickness: np.ndarray, stress_thickness: Optional[np.ndarray] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        PanelBatch をFEMで一括計算する（辺の条件・分割数は fem_edges, fem_divisions の列。無い場合は既定値）
+
+        Args:
+            panels: PanelBatch
+            thickness: 等価板厚の配列 [mm]
+            stress_thickness: 応力用の有効板厚の配列 [mm]（Noneの場合は等価板厚）
+
+        Returns:
+            Dict[str, np.ndarray]: sigma, delta（エラー行はnan）と行ごとのエラーメッセージ error
+        """
+        count = len(panels)
+        geometry = panels.geometry
+        return FEMPlateGlass.calculate_batch(
+            panels.support,
+            [dict(zip(geometry, values)) for values in zip(*(column.tolist() for column in geometry.values()))],
+            thickness,
+            panels.columns["w"],
+            panels.columns["E"],
+            panels.columns["nu"],
+            [None] * count if panels.fem_edges is None else list(panels.fem_edges),
+            [DEFAULT_DIVISIONS] * count if panels.fem_divisions is None else panels.fem_divisions.tolist(),
+            stress_thickness,
+        )
+
+
+def _require_scipy() -> None:
+    try:
+        import scipy  # noqa: F401
+    except ImportError:
+        raise ValueError("FEMの計算にはscipyが必要です")
+
+
+def _validate_patch(lx: float, ly: float, patch: Optional[Tuple[float, float]]) -> None:
+    if patch is not None and not (0 < patch[0] <= lx and 0 < patch[1] <= ly):
+        raise ValueError("FEM: 部分荷重の範囲は板の寸法以下の正の数値を入力してください")
@@ -1,11 +1,21 @@
 from typing import Dict, List
 
+import numpy as np
+
+from app.services.glass_calculator.coefficient_tables import get_coefficient_table
+from app.services.glass_calculator.contracts.enums import LookupModeEnum, SupportTypeEnum
 from app.services.glass_calculator.glass_material import GlassMaterial
 from app.services.glass_calculator.glass_layer import GlassLayer
+from app.services.glass_calculator.panel_batch import PanelBatch
 from app.services.glass_calculator.contracts.interfaces import  IPlate
 from app.services.binary_search import binary_search
 from app.services.binary_search.binary_search import BisectTypeEnum
 
+def _table_value(value: float):
+    """係数テーブルの軸の値を表の表記（整数は整数）に戻す"""
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
 class FourSidePartialLoadGlass(IPlate):
     """
     FourEdgeSupportedPartialUniformLoadGlass クラス
@@ -22,7 +32,8 @@ class FourSidePartialLoadGlass(IPlate):
         w: float,
         a1: float,
         b1: float,
-        material: GlassMaterial
+        material: GlassMaterial,
+        lookup_mode: LookupModeEnum = LookupModeEnum.STEP,
     ):
         """
         コンストラクタ
@@ -35,6 +46,7 @@ class FourSidePartialLoadGlass(IPlate):
             a1: 短辺方向の荷重負荷長 [mm]
             b1: 長辺方向の荷重負荷長 [mm]
             material: マテリアルクラス
+            lookup_mode: 係数の求め方（step: 表の行の値、linear: 3重線形補間）
             
         Raises:
             ValueError: 短辺が長辺より大きい場合、または辺長比が範囲外の場合
@@ -49,115 +61,16 @@ class FourSidePartialLoadGlass(IPlate):
         self.a1 = a1
         self.b1 = b1
         self.material = material
+        self.lookup_mode = lookup_mode
         
         coeff_result = self._calculate_coeff()
         self.alpha = coeff_result["alpha"]
         self.beta = coeff_result["beta"]
         
-        # 係数テーブルの定義（クラス変数として定義）
-    
-    # 係数テーブルをクラス変数として定義
-    coeff = [
-        # bByA: 1
-        [
-            # a'/a = 0.01
-            {
-                "beta": [2.988, 1.72, 1.322, 1.075, 0.888, 0.732],
-                "alpha": [0.132, 0.128, 0.118, 0.106, 0.092, 0.077],
-            },
-            # a'/a = 0.2
-            {
-                "beta": [1.72, 1.206, 1.024, 0.866, 0.729, 0.603],
-                "alpha": [0.128, 0.124, 0.115, 0.103, 0.09, 0.075],
-            },
-            # a'/a = 0.4
-            {
-                "beta": [1.322, 1.024, 0.801, 0.694, 0.592, 0.492],
-                "alpha": [0.118, 0.115, 0.107, 0.097, 0.084, 0.07],
-            },
-            # a'/a = 0.6
-            {
-                "beta": [1.075, 0.866, 0.694, 0.563, 0.483, 0.403],
-                "alpha": [0.106, 0.103, 0.097, 0.087, 0.076, 0.064],
-            },
-            # a'/a = 0.8
-            {
-                "beta": [0.888, 0.729, 0.592, 0.483, 0.397, 0.331],
-                "alpha": [0.092, 0.09, 0.084, 0.076, 0.066, 0.056],
-            },
-            # a'/a = 1
-            {
-                "beta": [0.732, 0.603, 0.492, 0.403, 0.331, 0.272],
-                "alpha": [0.077, 0.075, 0.07, 0.064, 0.056, 0.047],
-            },
-        ],
-        # bByA: 1.4
-        [
-            # a'/a = 0.01
-            {
-                "beta": [3.158, 1.501, 1.087, 0.824],
-                "alpha": [0.169, 0.156, 0.133, 0.107],
-            },
-            # a'/a = 0.2
-            {
-                "beta": [1.683, 1.2, 0.925, 0.713],
-                "alpha": [0.164, 0.153, 0.13, 0.105],
-            },
-            # a'/a = 0.4
-            {
-                "beta": [1.286, 0.968, 0.778, 0.61],
-                "alpha": [0.153, 0.143, 0.122, 0.099],
-            },
-            # a'/a = 0.6
-            {
-                "beta": [1.042, 0.794, 0.654, 0.517],
-                "alpha": [0.138, 0.129, 0.111, 0.09],
-            },
-            # a'/a = 0.8
-            {
-                "beta": [0.86, 0.656, 0.546, 0.435],
-                "alpha": [0.12, 0.113, 0.097, 0.079],
-            },
-            # a'/a = 1
-            {
-                "beta": [0.708, 0.54, 0.451, 0.36],
-                "alpha": [0.101, 0.095, 0.082, 0.066],
-            },
-        ],
-        # bByA: 2
-        [
-            # a'/a = 0.01
-            {
-                "beta": [3.226, 1.587, 1.184, 0.942, 0.767, 0.628],
-                "alpha": [0.188, 0.176, 0.155, 0.133, 0.112, 0.093],
-            },
-            # a'/a = 0.2
-            {
-                "beta": [1.636, 1.288, 1.023, 0.831, 0.683, 0.561],
-                "alpha": [0.183, 0.172, 0.152, 0.13, 0.11, 0.091],
-            },
-            # a'/a = 0.4
-            {
-                "beta": [1.23, 1.051, 0.872, 0.721, 0.598, 0.492],
-                "alpha": [0.171, 0.161, 0.143, 0.123, 0.104, 0.086],
-            },
-            # a'/a = 0.6
-            {
-                "beta": [1.01, 0.87, 0.739, 0.62, 0.517, 0.426],
-                "alpha": [0.154, 0.146, 0.13, 0.112, 0.095, 0.079],
-            },
-            # a'/a = 0.8
-            {
-                "beta": [0.831, 0.723, 0.622, 0.525, 0.439, 0.363],
-                "alpha": [0.134, 0.128, 0.114, 0.098, 0.083, 0.069],
-            },
-            # a'/a = 1
-            {
-                "beta": [0.684, 0.596, 0.515, 0.436, 0.365, 0.302],
-                "alpha": [0.113, 0.107, 0.096, 0.083, 0.07, 0.058],
-            },
-        ],
-    ]
+    # 係数テーブル（b/a, a'/a, b'/a ごとの alpha, beta。b'/a の軸は b/a ごとに異なり、欠損はnan）
+    coefficient_table = get_coefficient_table(SupportTypeEnum.FOUR_PARTIAL)
+    # b/a の行ごとの b'/a の軸点の数（係数が存在する範囲）
+    b1_count = np.count_nonzero(~np.isnan(coefficient_table.axes["b1_by_a"]), axis=1)
 
     def _validate_edge_length(self, a: float, b: float) -> None:
         """
@@ -219,34 +132,35 @@ class FourSidePartialLoadGlass(IPlate):
         Raises:
             ValueError: 係数テーブルの適用範囲外の場合
         """
+        coeff = self.coefficient_table
         b_by_a = self.edge_length_ratio
         a1_by_a = self.a1 / self.a
         b1_by_a = self.b1 / self.a
-        tmp_bby_a_list = [1, 1.4, 2]
-        tmp_a1by_a_list = [0.01, 0.2, 0.4, 0.6, 0.8, 1]
-        tmp_b1by_a_list1 = [0.01, 0.2, 0.4, 0.6, 0.8, 1]
-        tmp_b1by_a_list2 = [0.01, 0.4, 0.8, 1.2]
-        tmp_b1by_a_list3 = [0.01, 0.4, 0.8, 1.2, 1.6, 2]
-
-        index_bby_a = binary_search.binary_search(tmp_bby_a_list, b_by_a, BisectTypeEnum.LEFT)
-
-        if index_bby_a == 0:
-            tmp_b1by_a_list = tmp_b1by_a_list1
-        elif index_bby_a == 1:
-            tmp_b1by_a_list = tmp_b1by_a_list2
-        elif index_bby_a == 2:
-            tmp_b1by_a_list = tmp_b1by_a_list3
-        else:
+
+        if self.lookup_mode == LookupModeEnum.LINEAR:
+            self._validate_a1_by_a(a1_by_a)
+            interpolated = self._interpolate_coeff(np.array([b_by_a]), np.array([a1_by_a]), np.array([b1_by_a]))
+            if interpolated["error"][0] is not None:
+                raise ValueError(interpolated["error"][0])
+            return {"alpha": float(interpolated["alpha"][0]), "beta": float(interpolated["beta"][0])}
+
+        index_bby_a = binary_search.binary_search(coeff.axes["b_by_a"], b_by_a, BisectTypeEnum.LEFT)
+        if index_bby_a >= len(coeff.axes["b_by_a"]):
             raise ValueError("Invalid b/a ratio")
+        b1by_a_axis = coeff.axes["b1_by_a"][index_bby_a]
+        tmp_b1by_a_list = [_table_value(value) for value in b1by_a_axis[~np.isnan(b1by_a_axis)]]
 
         self._validate_a1_by_a(a1_by_a)
         self._validate_b1_by_a(b1_by_a, tmp_b1by_a_list)
 
-        index_a1by_a = binary_search.binary_search(tmp_a1by_a_list, a1_by_a, BisectTypeEnum.LEFT)
-        index_b1by_a = binary_search.binary_search(tmp_b1by_a_list1, a1_by_a, BisectTypeEnum.LEFT)
+        # b'/a 方向の添字は b/a の行の b'/a の軸から求める
+        index_a1by_a = binary_search.binary_search(coeff.axes["a1_by_a"], a1_by_a, BisectTypeEnum.LEFT)
+        index_b1by_a = binary_search.binary_search(tmp_b1by_a_list, b1_by_a, BisectTypeEnum.LEFT)
 
-        beta = self.coeff[index_bby_a][index_a1by_a]["beta"][index_b1by_a]
-        alpha = self.coeff[index_bby_a][index_a1by_a]["alpha"][index_b1by_a]
+        beta = float(coeff.values["beta"][index_bby_a, index_a1by_a, index_b1by_a])
+        alpha = float(coeff.values["alpha"][index_bby_a, index_a1by_a, index_b1by_a])
+        if np.isnan(beta):
+            raise ValueError("b1/a is out of the coefficient table. use FEM instead")
         return {"alpha": alpha, "beta": beta}
 
     def calculate_stress(self) -> float:
@@ -256,8 +170,7 @@ class FourSidePartialLoadGlass(IPlate):
         Returns:
             float: 板の応力 [N/mm2]
         """
-        thickness = self.layer.get_equivalent_thickness()
-        sigma = (self.beta * (self.w * self.a1 * self.b1)) / thickness ** 2
+        sigma = (self.beta * (self.w * self.a1 * self.b1)) / self.layer.get_stress_thickness_squared()
         return sigma
 
     def calculate_displacement(self) -> float:
@@ -267,7 +180,160 @@ class FourSidePartialLoadGlass(IPlate):
         Returns:
             float: 板の変位 [mm]
         """
-        thickness = self.layer.get_equivalent_thickness()
         e = self.material.E
-        delta = (self.alpha * (self.w * self.a1 * self.b1 * self.a ** 2)) / (thickness ** 3 * e)
+        delta = (self.alpha * (self.w * self.a1 * self.b1 * self.a ** 2)) / (self.layer.get_equivalent_thickness_cubed() * e)
         return delta
+
+    @classmethod
+    def _interpolate_coeff(cls, b_by_a: np.ndarray, a1_by_a: np.ndarray, b1_by_a: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        (b/a, a'/a, b'/a) で係数を3重線形補間する
+        b'/a の軸は b/a の行ごとに異なるため、b/a の前後の行それぞれで (a'/a, b'/a) を双線形補間してから
+        b/a 方向に線形補間します。b'/a は補間に使う行の軸の範囲内である必要があります。
+
+        Args:
+            b_by_a: b/a の配列（1〜2）
+            a1_by_a: a'/a の配列（0.01〜1）
+            b1_by_a: b'/a の配列
+
+        Returns:
+            Dict[str, np.ndarray]: alpha, beta と、b'/a が範囲外の行のエラーメッセージ error
+        """
+        coeff = cls.coefficient_table
+        axis_b1 = coeff.axes["b1_by_a"]
+
+        def bracket(axis, x):
+            # x を挟む軸点の添字（下側）と、区間内の位置（0〜1）
+            lower = np.clip(binary_search.search_many(axis, x, BisectTypeEnum.RIGHT) - 1, 0, len(axis) - 2)
+            return lower, np.clip((x - axis[lower]) / (axis[lower + 1] - axis[lower]), 0, 1)
+
+        index_bby_a, t = bracket(coeff.axes["b_by_a"], b_by_a)
+        index_a1by_a, u = bracket(coeff.axes["a1_by_a"], a1_by_a)
+
+        result = {"alpha": np.zeros(b_by_a.shape), "beta": np.zeros(b_by_a.shape)}
+        lower_limit = np.full(b_by_a.shape, -np.inf)
+        upper_limit = np.full(b_by_a.shape, np.inf)
+        for row, weight in ((index_bby_a, 1 - t), (index_bby_a + 1, t)):
+            # 重みが0の行は使わない（表の行ちょうどの b/a では隣の行の b'/a の範囲を問わない）
+            used = weight > 0
+            row_axis = axis_b1[row]
+            count = cls.b1_count[row]
+            index_b1by_a = np.clip(np.sum(row_axis <= b1_by_a[:, None], axis=1) - 1, 0, count - 2)
+            b1_lower = np.take_along_axis(row_axis, index_b1by_a[:, None], axis=1)[:, 0]
+            b1_upper = np.take_along_axis(row_axis, index_b1by_a[:, None] + 1, axis=1)[:, 0]
+            v = np.clip((b1_by_a - b1_lower) / (b1_upper - b1_lower), 0, 1)
+            row_max = np.take_along_axis(row_axis, count[:, None] - 1, axis=1)[:, 0]
+            lower_limit = np.where(used, np.maximum(lower_limit, row_axis[:, 0]), lower_limit)
+            upper_limit = np.where(used, np.minimum(upper_limit, row_max), upper_limit)
+
+            for name in ("alpha", "beta"):
+                values = coeff.values[name]
+                plane = (
+                    values[row, index_a1by_a, index_b1by_a] * (1 - u) * (1 - v)
+                    + values[row, index_a1by_a + 1, index_b1by_a] * u * (1 - v)
+                    + values[row, index_a1by_a, index_b1by_a + 1] * (1 - u) * v
+                    + values[row, index_a1by_a + 1, index_b1by_a + 1] * u * v
+                )
+                result[name] = result[name] + np.where(used, weight * plane, 0)
+
+        error = np.full(b_by_a.shape, None, dtype=object)
+        for i in np.flatnonzero((b1_by_a < lower_limit) | (b1_by_a > upper_limit)):
+            list_min, list_max = _table_value(lower_limit[i]), _table_value(upper_limit[i])
+            error[i] = f"b1/a is smaller than {list_min} or greater than {list_max}. use FEM instead"
+        return {**result, "error": error}
+
+    @classmethod
+    def calculate_batch(
+        cls,
+        a: np.ndarray,
+        b: np.ndarray,
+        thickness: np.ndarray,
+        w: np.ndarray,
+        a1: np.ndarray,
+        b1: np.ndarray,
+        E: np.ndarray,
+        lookup_mode: LookupModeEnum = LookupModeEnum.STEP,
+    ) -> Dict[str, np.ndarray]:
+        """
+        一括計算
+
+        Args:
+            a: 短辺の長さの配列 [mm]
+            b: 長辺の長さの配列 [mm]
+            thickness: 等価板厚の配列 [mm]
+            w: 荷重の配列 [N/mm2]
+            a1: 短辺方向の荷重負荷長の配列 [mm]
+            b1: 長辺方向の荷重負荷長の配列 [mm]
+            E: ヤング係数の配列 [N/mm2]
+            lookup_mode: 係数の求め方（step: 表の行の値、linear: 3重線形補間）
+
+        Returns:
+            Dict[str, np.ndarray]: sigma, delta（エラー行はnan）と行ごとのエラーメッセージ error
+        """
+        a = np.asarray(a, dtype=np.float64)
+        b_by_a = np.asarray(b, dtype=np.float64) / a
+        a1_by_a = a1 / a
+        b1_by_a = b1 / a
+
+        if lookup_mode == LookupModeEnum.LINEAR:
+            with np.errstate(invalid="ignore"):
+                interpolated = cls._interpolate_coeff(b_by_a, np.asarray(a1_by_a), np.asarray(b1_by_a))
+            error = interpolated["error"]
+            error[(a1_by_a < 0.01) | (a1_by_a > 1)] = "a is greater than 1 or smaller than 0.01. use FEM instead"
+            error[(b_by_a < 1) | (b_by_a > 2)] = "b/a is smaller than 1 or greater than 2. use FEM instead"
+            valid = np.equal(error, None)
+            beta = np.where(valid, interpolated["beta"], np.nan)
+            alpha = np.where(valid, interpolated["alpha"], np.nan)
+            sigma = (beta * (w * a1 * b1)) / thickness ** 2
+            delta = (alpha * (w * a1 * b1 * a ** 2)) / (thickness ** 3 * E)
+            return {"sigma": sigma, "delta": delta, "error": error}
+
+        # _calculate_coeffと同じ順序でチェックし、最初に該当したメッセージを残す
+        coeff = cls.coefficient_table
+        error = np.full(a.shape, None, dtype=object)
+        index_bby_a = binary_search.search_many(coeff.axes["b_by_a"], b_by_a, BisectTypeEnum.LEFT)
+        index_bby_a = np.minimum(index_bby_a, len(coeff.axes["b_by_a"]) - 1)
+        for i, b1by_a_axis in enumerate(coeff.axes["b1_by_a"]):
+            list_min, list_max = _table_value(np.nanmin(b1by_a_axis)), _table_value(np.nanmax(b1by_a_axis))
+            out_of_b1 = (index_bby_a == i) & ((b1_by_a < list_min) | (b1_by_a > list_max))
+            error[out_of_b1] = f"b1/a is smaller than {list_min} or greater than {list_max}. use FEM instead"
+        error[(a1_by_a < 0.01) | (a1_by_a > 1)] = "a is greater than 1 or smaller than 0.01. use FEM instead"
+        error[(b_by_a < 1) | (b_by_a > 2)] = "b/a is smaller than 1 or greater than 2. use FEM instead"
+
+        # b1/a方向の添字は1枚ずつの計算（_calculate_coeff）と同じく b/a の行の b'/a の軸から求める
+        index_a1by_a = binary_search.search_many(coeff.axes["a1_by_a"], a1_by_a, BisectTypeEnum.LEFT)
+        index_a1by_a = np.minimum(index_a1by_a, len(coeff.axes["a1_by_a"]) - 1)
+        index_b1by_a = np.zeros(a.shape, dtype=np.intp)
+        for i, b1by_a_axis in enumerate(coeff.axes["b1_by_a"]):
+            rows = index_bby_a == i
+            index_b1by_a[rows] = binary_search.search_many(b1by_a_axis, b1_by_a[rows], BisectTypeEnum.LEFT)
+        index_b1by_a = np.minimum(index_b1by_a, coeff.axes["b1_by_a"].shape[1] - 1)
+        beta = coeff.values["beta"][index_bby_a, index_a1by_a, index_b1by_a]
+        alpha = coeff.values["alpha"][index_bby_a, index_a1by_a, index_b1by_a]
+        error[np.equal(error, None) & np.isnan(beta)] = "b1/a is out of the coefficient table. use FEM instead"
+        valid = np.equal(error, None)
+        beta = np.where(valid, beta, np.nan)
+        alpha = np.where(valid, alpha, np.nan)
+
+        sigma = (beta * (w * a1 * b1)) / thickness ** 2
+        delta = (alpha * (w * a1 * b1 * a ** 2)) / (thickness ** 3 * E)
+        return {"sigma": sigma, "delta": delta, "error": error}
+
+    @classmethod
+    def calculate_panels(cls, panels: PanelBatch, thickness: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        四辺支持板（部分荷重）の PanelBatch を一括で計算（係数の求め方が混在する場合は求め方ごとに計算）
+
+        Args:
+            panels: 四辺支持板（部分荷重）の PanelBatch
+            thickness: 等価板厚の配列 [mm]
+
+        Returns:
+            Dict[str, np.ndarray]: sigma, delta（エラー行はnan）と行ごとのエラーメッセージ error
+        """
+        return panels.calculate_by_lookup_mode(
+            thickness,
+            lambda columns, thickness, lookup_mode: cls.calculate_batch(
+                columns["a"], columns["b"], thickness, columns["w"], columns["a1"], columns["b1"], columns["E"], lookup_mode
+            ),
+        )
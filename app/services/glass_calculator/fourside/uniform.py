@@ -1,13 +1,23 @@
+from typing import Dict
+
+import numpy as np
+
+from app.services.glass_calculator.coefficient_tables import get_coefficient_table
+from app.services.glass_calculator.contracts.enums import LookupModeEnum, SupportTypeEnum
 from app.services.glass_calculator.glass_material import GlassMaterial
 from app.services.glass_calculator.glass_layer import GlassLayer
+from app.services.glass_calculator.panel_batch import PanelBatch
 from app.services.glass_calculator.contracts.interfaces import  IPlate
 from app.services.binary_search import binary_search
 from app.services.binary_search.binary_search import BisectTypeEnum
 
 class FourSideUniformLoadGlass(IPlate):
     """四辺支持ガラスの応力・変位計算クラス"""
+
+    # 係数テーブル（b/a ごとの alpha, beta）
+    coefficient_table = get_coefficient_table(SupportTypeEnum.FOUR_UNIFORM)
     
-    def __init__(self, short_edge: float, long_edge: float, layer: GlassLayer, w: float, material:GlassMaterial):
+    def __init__(self, short_edge: float, long_edge: float, layer: GlassLayer, w: float, material:GlassMaterial, lookup_mode: LookupModeEnum = LookupModeEnum.STEP):
         """
         四辺支持された均一荷重下のガラス板の初期化
         
@@ -17,6 +27,7 @@ class FourSideUniformLoadGlass(IPlate):
             layer: ガラス層オブジェクト
             w: 均一荷重 [N/mm²]
             material: 材質クラス 
+            lookup_mode: 係数の求め方（step: 表の行の値、linear: 線形補間）
             
         Raises:
             ValueError: 短辺が長辺より長い場合、または辺長比が5を超える場合
@@ -37,18 +48,22 @@ class FourSideUniformLoadGlass(IPlate):
         self.layer = layer
         self.w = w
         self.material = material
+        self.lookup_mode = lookup_mode
+
+        coeff = self._calculate_coeff()
+        self.alpha = coeff["alpha"]
+        self.beta = coeff["beta"]
 
     def _calculate_coeff(self):
         """応力・変位計算用の補間係数を計算"""
-        coeff = {
-            "b_by_a": [1, 1.2, 1.5, 2, 3, 4, 5],
-            "beta": [0.272, 0.362, 0.476, 0.603, 0.711, 0.74, 0.748],
-            "alpha": [0.047, 0.065, 0.088, 0.116, 0.139, 0.146, 0.148],
-        }
-
-        index = binary_search.binary_search(coeff["b_by_a"], self.edge_length_ratio, BisectTypeEnum.LEFT)
-        alpha = coeff["alpha"][index]
-        beta = coeff["beta"][index]
+        coeff = self.coefficient_table
+        if self.lookup_mode == LookupModeEnum.LINEAR:
+            alpha = float(coeff.interpolate("b_by_a", "alpha", self.edge_length_ratio))
+            beta = float(coeff.interpolate("b_by_a", "beta", self.edge_length_ratio))
+            return {"alpha": alpha, "beta": beta}
+        index = binary_search.binary_search(coeff.axes["b_by_a"], self.edge_length_ratio, BisectTypeEnum.LEFT)
+        alpha = float(coeff.values["alpha"][index])
+        beta = float(coeff.values["beta"][index])
         return {"alpha": alpha, "beta": beta}
 
     def calculate_stress(self) -> float:
@@ -58,10 +73,8 @@ class FourSideUniformLoadGlass(IPlate):
         Returns:
             float: 板の応力 [N/mm²]
         """
-        coeff = self._calculate_coeff()
-        beta = coeff["beta"]
-        layer = self.layer.get_equivalent_thickness()
-        sigma = (beta * (self.w * self.a ** 2)) / layer ** 2
+        beta = self.beta
+        sigma = (beta * (self.w * self.a ** 2)) / self.layer.get_stress_thickness_squared()
         
         return sigma
 
@@ -72,9 +85,74 @@ class FourSideUniformLoadGlass(IPlate):
         Returns:
             float: 板の変位 [mm]
         """
-        coeff = self._calculate_coeff()
-        alpha = coeff["alpha"]
+        alpha = self.alpha
         E = self.material.E
-        layer = self.layer.get_equivalent_thickness()
-        delta = (alpha * (self.w * self.a ** 4)) / (layer ** 3 * E)
+        delta = (alpha * (self.w * self.a ** 4)) / (self.layer.get_equivalent_thickness_cubed() * E)
         return delta
+
+    @classmethod
+    def calculate_batch(
+        cls,
+        short_edge: np.ndarray,
+        long_edge: np.ndarray,
+        thickness: np.ndarray,
+        w: np.ndarray,
+        E: np.ndarray,
+        lookup_mode: LookupModeEnum = LookupModeEnum.STEP,
+    ) -> Dict[str, np.ndarray]:
+        """
+        複数のガラス板の応力・変位を一括で計算
+
+        Args:
+            short_edge: 短辺長さ (a) の配列 [mm]
+            long_edge: 長辺長さ (b) の配列 [mm]
+            thickness: 等価板厚の配列 [mm]
+            w: 均一荷重の配列 [N/mm²]
+            E: ヤング係数の配列 [N/mm²]
+            lookup_mode: 係数の求め方（step: 表の行の値、linear: 線形補間）
+
+        Returns:
+            Dict[str, np.ndarray]: sigma, delta（エラー行はnan）と行ごとのエラーメッセージ error
+        """
+        a = np.asarray(short_edge, dtype=np.float64)
+        b = np.asarray(long_edge, dtype=np.float64)
+        edge_length_ratio = b / a
+
+        # コンストラクタと同じ順序でチェックし、行ごとにメッセージを割り当てる
+        error = np.full(a.shape, None, dtype=object)
+        error[edge_length_ratio > 5] = "b/aが5を超えています。代わりにFEMを使用してください"
+        error[a > b] = "短辺が長辺より長くなることはできません"
+        valid = np.equal(error, None)
+
+        coeff = cls.coefficient_table
+        if lookup_mode == LookupModeEnum.LINEAR:
+            alpha = np.where(valid, coeff.interpolate("b_by_a", "alpha", edge_length_ratio), np.nan)
+            beta = np.where(valid, coeff.interpolate("b_by_a", "beta", edge_length_ratio), np.nan)
+        else:
+            index = binary_search.search_many(coeff.axes["b_by_a"], edge_length_ratio, BisectTypeEnum.LEFT)
+            index = np.minimum(index, len(coeff.axes["b_by_a"]) - 1)
+            alpha = np.where(valid, coeff.values["alpha"][index], np.nan)
+            beta = np.where(valid, coeff.values["beta"][index], np.nan)
+
+        sigma = (beta * (w * a ** 2)) / thickness ** 2
+        delta = (alpha * (w * a ** 4)) / (thickness ** 3 * E)
+        return {"sigma": sigma, "delta": delta, "error": error}
+
+    @classmethod
+    def calculate_panels(cls, panels: PanelBatch, thickness: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        四辺支持板の PanelBatch を一括で計算（係数の求め方が混在する場合は求め方ごとに計算）
+
+        Args:
+            panels: 四辺支持板の PanelBatch
+            thickness: 等価板厚の配列 [mm]
+
+        Returns:
+            Dict[str, np.ndarray]: sigma, delta（エラー行はnan）と行ごとのエラーメッセージ error
+        """
+        return panels.calculate_by_lookup_mode(
+            thickness,
+            lambda columns, thickness, lookup_mode: cls.calculate_batch(
+                columns["a"], columns["b"], thickness, columns["w"], columns["E"], lookup_mode
+            ),
+        )
@@ -1,6 +1,8 @@
 import math
 
-from app.services.glass_calculator.contracts.enums import InterlayerMaterialTypeEnum, GlassTypeEnum
+import numpy as np
+
+from app.services.glass_calculator.contracts.enums import InterlayerMaterialTypeEnum, GlassTypeEnum, LookupModeEnum, SolverEnum, SupportTypeEnum
 
 from app.services.glass_calculator.glass_material import GlassMaterial
 from app.services.glass_calculator.glass_layer import GlassLayer
@@ -9,12 +11,20 @@ from app.services.glass_calculator.threeside.uniform import ThreeSideUniformLoad
 from app.services.glass_calculator.twoside.uniform import TwoSideUniformLoadGlass
 from app.services.glass_calculator.fourside.partial import FourSidePartialLoadGlass
 from app.services.glass_calculator.fourside.uniform import FourSideUniformLoadGlass
+from app.services.glass_calculator.fem.nonlinear import LargeDeflectionPlateGlass
+from app.services.glass_calculator.fem.plate import FEMPlateGlass
 from app.services.glass_calculator.allowable_stress import GlassAllowableUnitStress
+from app.services.glass_calculator.panel_batch import GEOMETRY_COLUMNS, PanelBatch
+from app.services.glass_calculator.coefficient_tables import get_coefficient_table
+from app.services.result_cache.result_cache import cached_result, canonical_key, get_cached_results, put_cached_results
 from typing import Sequence
 class CalculateStress:
 
     @staticmethod
+    @cached_result(SupportTypeEnum.FOUR_UNIFORM)
     def calculate_fourside_uniform(data):
+        if data.solver in (SolverEnum.FEM, SolverEnum.NONLINEAR):
+            return CalculateStress.calculate_fem(SupportTypeEnum.FOUR_UNIFORM, data)
         try:
             # 四辺支持板の計算式
             a = data.a  # mm
@@ -26,22 +36,301 @@ class CalculateStress:
             #inter_layer_material = data.interlayer_material  # InterlayerMaterialTypeEnum
 
             glass_material = GlassMaterial(E, nu)
-            glass_layer = GlassLayer(glass_layer_thicknesses, InterlayerMaterialTypeEnum.SG) # type: ignore
-            calculator = FourSideUniformLoadGlass(a, b, glass_layer, w, glass_material)
+            glass_layer = CalculateStress._glass_layer(SupportTypeEnum.FOUR_UNIFORM, data)
+            calculator = FourSideUniformLoadGlass(a, b, glass_layer, w, glass_material, data.lookup_mode)
             sigma = calculator.calculate_stress()
             delta = calculator.calculate_displacement()
+        except ValueError as e:
+            if data.solver == SolverEnum.AUTO:
+                return CalculateStress.calculate_fem(SupportTypeEnum.FOUR_UNIFORM, data)
+            return {"error": str(e)}
+
+        return CalculateStress._to_result(sigma, delta, glass_layer, data.glass_type, calculator.coefficient_table)
+
+    @staticmethod
+    def _to_result(sigma, delta, glass_layer, glass_type, coefficient_table, solver=SolverEnum.TABLE):
+        # 応力・変位と、許容応力（面内）に対する応力の比（検定比）、使用した係数テーブルの版（FEMはNone）と計算方法
+        # （許容応力が求まらない場合はエラー。FEMに切り替えても同じエラーとなるため、計算の例外とは分ける）
+        try:
+            allowable_stress = GlassAllowableUnitStress(glass_layer, glass_type).allowable_stress.allowableStress
+        except ValueError as e:
+            return {"error": str(e)}
+        return {
+            "sigma": round(sigma, 2),
+            "delta": round(delta, 2),
+            "utilization_short_term": round(sigma / allowable_stress.shortTerm.inplane, 3),
+            "utilization_long_term": round(sigma / allowable_stress.longTerm.inplane, 3),
+            "coefficient_version": None if coefficient_table is None else coefficient_table.version_key,
+            "solver": solver.value,
+        }
 
-            # 許容応力度の計算
-            glass_type = GlassTypeEnum.FLOAT  # ガラスの種類を指定
-            allowabe_stress_calculator = GlassAllowableUnitStress(glass_layer, glass_type)
-            #print(f"allowable_stress: {allowabe_stress_calculator.allowable_stress.allowableStress.shortTerm.edge}")
+    @staticmethod
+    def calculate_fem(support, data):
+        try:
+            # FEMによる計算（係数表の範囲外の形状も計算できる。nonlinearの場合は大たわみを考慮する）
+            solver = SolverEnum.NONLINEAR if data.solver == SolverEnum.NONLINEAR else SolverEnum.FEM
+            calculator = CalculateStress._fem_calculator(support, data, solver)
+            sigma = calculator.calculate_stress()
+            delta = calculator.calculate_displacement()
 
-            return {"sigma": round(sigma, 2), "delta": round(delta, 2)}
+            return CalculateStress._to_result(
+                sigma, delta, calculator.layer, data.glass_type, calculator.coefficient_table, solver
+            )
         except ValueError as e:
             return {"error": str(e)}
 
     @staticmethod
+    def _fem_calculator(support, data, solver=SolverEnum.FEM):
+        # 入力モデルの寸法・FEMの設定からFEM（線形または大たわみ）の計算クラスを生成する
+        material = GlassMaterial(data.E, data.nu)
+        layer = CalculateStress._glass_layer(support, data)
+        edges = {name: getattr(data, name) for name in CalculateStress.geometry_columns[support]}
+        if solver == SolverEnum.NONLINEAR:
+            return LargeDeflectionPlateGlass(
+                support, edges, layer, data.w, material, data.fem.edges, data.fem.divisions, data.fem.load_steps
+            )
+        return FEMPlateGlass.from_support(support, edges, layer, data.w, material, data.fem.edges, data.fem.divisions)
+
+    @staticmethod
+    def _glass_layer(support, data):
+        # 入力モデルの積層構成・中間膜の条件からガラス層を生成する（スパンは合わせガラスのせん断結合に使う）
+        span = CalculateStress.laminate_span(
+            support, {name: getattr(data, name) for name in CalculateStress.geometry_columns[support]}
+        )
+        return GlassLayer(
+            data.t, data.interlayer, data.interlayer_thickness, data.load_duration, data.temperature, float(span), data.E
+        )
+
+    @staticmethod
+    def laminate_span(support, columns):
+        # 合わせガラスのせん断結合を計算するスパン（四辺支持は短辺、三辺支持は短い方の辺、二辺支持は支持辺間、円形は直径）
+        if support in (SupportTypeEnum.FOUR_UNIFORM, SupportTypeEnum.FOUR_PARTIAL):
+            return np.minimum(columns["a"], columns["b"])
+        if support == SupportTypeEnum.THREE_UNIFORM:
+            return np.minimum(columns["free"], columns["fix"])
+        if support == SupportTypeEnum.TWO_UNIFORM:
+            return np.asarray(columns["free"])
+        return np.asarray(columns["D"])
+
+    @staticmethod
+    def calculate_fourside_uniform_batch(data):
+        # 四辺支持板の一括計算（1パネルずつオブジェクトを生成せず配列で計算する）
+        return {"results": CalculateStress._calculate_rows(data.panels, [SupportTypeEnum.FOUR_UNIFORM] * len(data.panels))}
+
+    @staticmethod
+    def calculate_batch(data):
+        # 支持条件の混在した一括計算
+        return {"results": CalculateStress.calculate_batch_rows(data.panels)}
+
+    @staticmethod
+    def calculate_batch_rows(panels):
+        # 支持条件ごとにまとめて配列で計算し、入力順の結果リストに戻す
+        return CalculateStress._calculate_rows(panels, [SupportTypeEnum(panel.support) for panel in panels])
+
+    @staticmethod
+    def _calculate_rows(panels, supports):
+        # キャッシュ（メモリ、永続キャッシュ）に無いパネルだけを支持条件ごとに計算し、計算結果をキャッシュする
+        keys = [canonical_key("batch", support, panel) for panel, support in zip(panels, supports)]
+        results = get_cached_results(keys)
+
+        groups = {}
+        for index, (support, result) in enumerate(zip(supports, results)):
+            if result is None:
+                groups.setdefault(support, []).append(index)
+
+        calculated = {}
+        for support, indices in groups.items():
+            result, thickness, allowable = CalculateStress._calculate_group(support, [panels[i] for i in indices])
+            for i, row in zip(indices, CalculateStress._to_batch_results(support, result, thickness, allowable)):
+                calculated[keys[i]] = row
+                results[i] = row
+        put_cached_results(calculated)
+        return results
+
+    @staticmethod
+    def _calculate_group(support, panels):
+        # 同じ支持条件のパネルを列（PanelBatch）にまとめて計算する
+        batch = PanelBatch.from_panels(support, panels)
+        result, thickness, allowable = CalculateStress.calculate_panels(batch)
+
+        # 大たわみの行は荷重に対して非線形のため1行ずつ解く（同じ形状の収束解を次の行の初期値に使う）
+        for i in np.flatnonzero(batch.categories["solver"] == SolverEnum.NONLINEAR):
+            try:
+                calculator = CalculateStress._fem_calculator(support, panels[i], SolverEnum.NONLINEAR)
+                result["sigma"][i] = calculator.calculate_stress()
+                result["delta"][i] = calculator.calculate_displacement()
+                result["error"][i] = None
+            except ValueError as e:
+                result["error"][i] = str(e)
+        return result, thickness, allowable
+
+    @staticmethod
+    def calculate_panels(panels: PanelBatch):
+        """
+        PanelBatch（同じ支持条件のパネルの列）を一括で計算する
+        大たわみ（nonlinear）の行は solver のみ設定し、計算は呼び出し側で行います。
+
+        Returns:
+            Tuple[dict, np.ndarray, dict]: 行ごとの sigma, delta, error, solver の配列、たわみ用の有効板厚、
+                許容応力（面内）の列
+        """
+        support = panels.support
+        calculator = CalculateStress.calculators[support]
+        # 有効板厚（SGは合計板厚、PVB, EVAはせん断結合を考慮したたわみ用・応力用の有効板厚）
+        laminate = panels.effective_thickness(CalculateStress.laminate_span(support, panels.columns))
+        thickness, stress_thickness = laminate["deflection"], laminate["stress"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = calculator.calculate_panels(panels, thickness)
+            # 応力用の有効板厚が異なる行（PVB, EVA）は応力だけを応力用の有効板厚で計算し直す
+            laminated = stress_thickness != thickness
+            if laminated.any():
+                stress = calculator.calculate_panels(panels.take(laminated), stress_thickness[laminated])
+                result["sigma"][laminated] = stress["sigma"]
+
+        # FEMを指定した行と、係数表の範囲外でFEMに切り替える（auto）行はFEMで計算する
+        # （形状が同じでwや板厚だけが異なる行は、分解済みの剛性行列に対して一括で解く）
+        solvers = panels.categories["solver"]
+        result["solver"] = np.full(len(panels), SolverEnum.TABLE, dtype=object)
+        fem_rows = np.flatnonzero(
+            (solvers == SolverEnum.FEM) | ((solvers == SolverEnum.AUTO) & ~np.equal(result["error"], None))
+        )
+        if len(fem_rows):
+            fem = FEMPlateGlass.calculate_panels(panels.take(fem_rows), thickness[fem_rows], stress_thickness[fem_rows])
+            for name in ("sigma", "delta", "error"):
+                result[name][fem_rows] = fem[name]
+            result["solver"][fem_rows] = SolverEnum.FEM
+        result["solver"][solvers == SolverEnum.NONLINEAR] = SolverEnum.NONLINEAR
+        return result, thickness, CalculateStress.allowable_stress_panels(panels)
+
+    @staticmethod
+    def _allowable_stress_columns(panels):
+        # 入力モデルのリストの外側の板厚（小さい方）から許容応力（面内）を一括で求める
+        outer_thickness = np.array([min(panel.t[0], panel.t[-1]) if panel.t else np.nan for panel in panels])
+        glass_types = np.array([panel.glass_type for panel in panels], dtype=object)
+        return CalculateStress._allowable_stress_by_type(glass_types, outer_thickness)
+
+    @staticmethod
+    def allowable_stress_panels(panels: PanelBatch):
+        """
+        PanelBatch の外側の板厚（小さい方）とガラスの種類から許容応力（面内）を一括で求める
+
+        Returns:
+            Dict[str, np.ndarray]: shortTerm, longTerm（求まらない行はnan）と行ごとのエラーメッセージ error
+        """
+        return CalculateStress._allowable_stress_by_type(panels.categories["glass_type"], panels.outer_thickness())
+
+    @staticmethod
+    def _allowable_stress_by_type(glass_types, outer_thickness):
+        # ガラスの種類ごとに許容応力（面内）を一括で求める
+        allowable = {
+            "shortTerm": np.full(len(glass_types), np.nan),
+            "longTerm": np.full(len(glass_types), np.nan),
+            "error": np.full(len(glass_types), None, dtype=object),
+        }
+        for glass_type in set(glass_types):
+            rows = glass_types == glass_type
+            result = GlassAllowableUnitStress.get_allowable_stress_batch(glass_type, outer_thickness[rows])
+            for name, values in result.items():
+                allowable[name][rows] = values
+        return allowable
+
+    # 支持条件ごとに一括計算で必要となる形状の列
+    geometry_columns = GEOMETRY_COLUMNS
+
+    # 支持条件ごとの計算クラス（PanelBatch の一括計算 calculate_panels を持つ）
+    calculators = {
+        SupportTypeEnum.FOUR_UNIFORM: FourSideUniformLoadGlass,
+        SupportTypeEnum.FOUR_PARTIAL: FourSidePartialLoadGlass,
+        SupportTypeEnum.THREE_UNIFORM: ThreeSideUniformLoadGlass,
+        SupportTypeEnum.TWO_UNIFORM: TwoSideUniformLoadGlass,
+        SupportTypeEnum.CIRCULAR_UNIFORM: CircleUniformLoadGlass,
+    }
+
+    @staticmethod
+    def calculate_columns(support, columns, thickness, lookup_mode=LookupModeEnum.STEP):
+        # 列ごとの配列（geometry_columnsの列とw, E）を計算クラスの一括計算に渡す（lookup_modeは円形以外）
+        w = columns["w"]
+        E = columns["E"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if support == SupportTypeEnum.FOUR_UNIFORM:
+                return FourSideUniformLoadGlass.calculate_batch(columns["a"], columns["b"], thickness, w, E, lookup_mode)
+            elif support == SupportTypeEnum.FOUR_PARTIAL:
+                return FourSidePartialLoadGlass.calculate_batch(
+                    columns["a"], columns["b"], thickness, w, columns["a1"], columns["b1"], E, lookup_mode
+                )
+            elif support == SupportTypeEnum.THREE_UNIFORM:
+                return ThreeSideUniformLoadGlass.calculate_batch(columns["free"], columns["fix"], thickness, w, E, lookup_mode)
+            elif support == SupportTypeEnum.TWO_UNIFORM:
+                return TwoSideUniformLoadGlass.calculate_batch(columns["free"], columns["fix"], thickness, w, E, lookup_mode)
+            elif support == SupportTypeEnum.CIRCULAR_UNIFORM:
+                return CircleUniformLoadGlass.calculate_batch(columns["D"] / 2, thickness, w, E)
+        raise ValueError(f"無効な支持条件: {support}")
+
+    # 形状を a, b（, a1, b1）で指定する入力（最適化・逆算）の、支持条件ごとの列への対応
+    edge_columns = {
+        SupportTypeEnum.FOUR_UNIFORM: {"a": "a", "b": "b"},
+        SupportTypeEnum.FOUR_PARTIAL: {"a": "a", "b": "b", "a1": "a1", "b1": "b1"},
+        SupportTypeEnum.THREE_UNIFORM: {"free": "a", "fix": "b"},
+        SupportTypeEnum.TWO_UNIFORM: {"free": "a", "fix": "b"},
+        SupportTypeEnum.CIRCULAR_UNIFORM: {"D": "a"},
+    }
+
+    @staticmethod
+    def calculate_edges(support, edges, thickness, w, E):
+        # a, b（, a1, b1）で形状を指定して一括計算する（w=1 とすれば単位荷重の結果。応力・変位はwに比例する）
+        thickness = np.asarray(thickness, dtype=np.float64)
+        error = np.full(thickness.shape, None, dtype=object)
+        columns = {
+            "w": np.broadcast_to(np.asarray(w, dtype=np.float64), thickness.shape),
+            "E": np.broadcast_to(np.asarray(E, dtype=np.float64), thickness.shape),
+        }
+        for name, edge in CalculateStress.edge_columns[support].items():
+            values = np.broadcast_to(
+                np.asarray(np.nan if edges.get(edge) is None else edges[edge], dtype=np.float64), thickness.shape
+            )
+            error[np.equal(error, None) & np.isnan(values)] = f"{edge}: 値を入力してください"
+            columns[name] = values
+
+        result = CalculateStress.calculate_columns(support, columns, thickness)
+        error[np.equal(error, None)] = result["error"][np.equal(error, None)]
+        valid = np.equal(error, None)
+        return {
+            "sigma": np.where(valid, result["sigma"], np.nan),
+            "delta": np.where(valid, result["delta"], np.nan),
+            "error": error,
+        }
+
+    @staticmethod
+    def _to_batch_results(support, result, thickness, allowable):
+        # 一括計算の配列を行ごとの結果に変換する（エラーの順序は1枚ずつの計算と同じ）
+        version = get_coefficient_table(support).version_key
+        rows = []
+        for sigma, delta, error, solver, t, short_term, long_term, allowable_error in zip(
+            result["sigma"], result["delta"], result["error"], result["solver"], thickness,
+            allowable["shortTerm"], allowable["longTerm"], allowable["error"],
+        ):
+            if error is None and not t > 0:
+                error = "板厚が指定されていません"
+            if error is None:
+                error = allowable_error
+            if error is not None:
+                rows.append({"error": error})
+            else:
+                rows.append({
+                    "sigma": round(float(sigma), 2),
+                    "delta": round(float(delta), 2),
+                    "utilization_short_term": round(float(sigma / short_term), 3),
+                    "utilization_long_term": round(float(sigma / long_term), 3),
+                    "coefficient_version": version if solver == SolverEnum.TABLE else None,
+                    "solver": solver.value,
+                })
+        return rows
+
+    @staticmethod
+    @cached_result(SupportTypeEnum.FOUR_PARTIAL)
     def calculate_fourside_partial(data):
+        if data.solver in (SolverEnum.FEM, SolverEnum.NONLINEAR):
+            return CalculateStress.calculate_fem(SupportTypeEnum.FOUR_PARTIAL, data)
         try:
             # 四辺支持部分荷重板の計算式
             a = data.a  # mm
@@ -53,17 +342,22 @@ class CalculateStress:
             E = data.E
             nu = data.nu
             material = GlassMaterial(E, nu)
-            layer = GlassLayer(glass_layer_thicknesses, InterlayerMaterialTypeEnum.SG) # type: ignore
-            calculator = FourSidePartialLoadGlass(a, b, layer, w, a1, b1, material)
+            layer = CalculateStress._glass_layer(SupportTypeEnum.FOUR_PARTIAL, data)
+            calculator = FourSidePartialLoadGlass(a, b, layer, w, a1, b1, material, data.lookup_mode)
             sigma = calculator.calculate_stress()
             delta = calculator.calculate_displacement()
-
-            return {"sigma": round(sigma, 2), "delta": round(delta, 2)}
         except ValueError as e:
+            if data.solver == SolverEnum.AUTO:
+                return CalculateStress.calculate_fem(SupportTypeEnum.FOUR_PARTIAL, data)
             return {"error": str(e)}
 
+        return CalculateStress._to_result(sigma, delta, layer, data.glass_type, calculator.coefficient_table)
+
     @staticmethod
+    @cached_result(SupportTypeEnum.THREE_UNIFORM)
     def calculate_threeside_uniform(data):
+        if data.solver in (SolverEnum.FEM, SolverEnum.NONLINEAR):
+            return CalculateStress.calculate_fem(SupportTypeEnum.THREE_UNIFORM, data)
         try:
             # 三辺支持板の計算式
             a = data.free  # mm
@@ -73,17 +367,22 @@ class CalculateStress:
             nu = data.nu
             E = data.E
             material = GlassMaterial(E, nu)
-            layer = GlassLayer(glass_layer_thicknesses, InterlayerMaterialTypeEnum.SG) # type: ignore
-            calculator = ThreeSideUniformLoadGlass(a, b, layer, w, material)
+            layer = CalculateStress._glass_layer(SupportTypeEnum.THREE_UNIFORM, data)
+            calculator = ThreeSideUniformLoadGlass(a, b, layer, w, material, data.lookup_mode)
             sigma = calculator.calculate_stress()
             delta = calculator.calculate_displacement()
-
-            return {"sigma": round(sigma, 2), "delta": round(delta, 2)}
         except ValueError as e:
+            if data.solver == SolverEnum.AUTO:
+                return CalculateStress.calculate_fem(SupportTypeEnum.THREE_UNIFORM, data)
             return {"error": str(e)}
 
+        return CalculateStress._to_result(sigma, delta, layer, data.glass_type, calculator.coefficient_table)
+
     @staticmethod
+    @cached_result(SupportTypeEnum.TWO_UNIFORM)
     def calculate_twoside_uniform(data):
+        if data.solver in (SolverEnum.FEM, SolverEnum.NONLINEAR):
+            return CalculateStress.calculate_fem(SupportTypeEnum.TWO_UNIFORM, data)
         try:
             # 二辺支持板の計算式
             a = data.free  # mm
@@ -93,17 +392,22 @@ class CalculateStress:
             nu = data.nu
             E = data.E
             material = GlassMaterial(E, nu)
-            layer = GlassLayer(glass_layer_thicknesses, InterlayerMaterialTypeEnum.SG) # type: ignore
-            calculator = TwoSideUniformLoadGlass(a, b, layer, w, material)
+            layer = CalculateStress._glass_layer(SupportTypeEnum.TWO_UNIFORM, data)
+            calculator = TwoSideUniformLoadGlass(a, b, layer, w, material, data.lookup_mode)
             sigma = calculator.calculate_stress()
             delta = calculator.calculate_displacement()
-
-            return {"sigma": round(sigma, 2), "delta": round(delta, 2)}
         except ValueError as e:
+            if data.solver == SolverEnum.AUTO:
+                return CalculateStress.calculate_fem(SupportTypeEnum.TWO_UNIFORM, data)
             return {"error": str(e)}
 
+        return CalculateStress._to_result(sigma, delta, layer, data.glass_type, calculator.coefficient_table)
+
     @staticmethod
+    @cached_result(SupportTypeEnum.CIRCULAR_UNIFORM)
     def calculate_circular_uniform(data):
+        if data.solver in (SolverEnum.FEM, SolverEnum.NONLINEAR):
+            return CalculateStress.calculate_fem(SupportTypeEnum.CIRCULAR_UNIFORM, data)
         try:
             # 円形支持板の計算式
             r = data.D / 2  # mm
@@ -112,11 +416,11 @@ class CalculateStress:
             nu = data.nu
             E = data.E
             material = GlassMaterial(E, nu)
-            layer = GlassLayer(glass_layer_thicknesses, InterlayerMaterialTypeEnum.SG) # type: ignore
+            layer = CalculateStress._glass_layer(SupportTypeEnum.CIRCULAR_UNIFORM, data)
             calculator = CircleUniformLoadGlass(r, layer, w, material)
             sigma = calculator.calculate_stress()
             delta = calculator.calculate_displacement()
-
-            return {"sigma": round(sigma, 2), "delta": round(delta, 2)}
         except ValueError as e:
             return {"error": str(e)}
+
+        return CalculateStress._to_result(sigma, delta, layer, data.glass_type, calculator.coefficient_table)
@@ -1,26 +1,226 @@
-from enum import Enum
-from typing import Sequence
-from app.services.glass_calculator.contracts.enums import InterlayerMaterialTypeEnum
+import functools
+from itertools import chain
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.services.glass_calculator.contracts.enums import InterlayerMaterialTypeEnum, LoadDurationEnum
+from app.services.glass_calculator.laminate import (
+    DEFAULT_E,
+    DEFAULT_INTERLAYER_THICKNESS,
+    DEFAULT_TEMPERATURE,
+    effective_thickness,
+    effective_thickness_batch,
+)
+
+# 共有する GlassLayer の件数の上限
+LAYER_CACHE_SIZE = 4096
+
+
 class GlassLayer:
-    def __init__(self, layers: Sequence[float], interlayer_material: InterlayerMaterialTypeEnum):
-        self.layers = layers
-        self.interlayer_material = interlayer_material
-    
-    def get_outer_layer_thickness(self) -> Sequence[float]:
+    """
+    ガラス層（積層構成）
+    変更できない値オブジェクトで、同じ積層構成・中間膜の条件の GlassLayer は1つのオブジェクトを共有します。
+    有効板厚とその2乗・3乗は生成時に1回だけ計算します。
+    SG・単板では中間膜の条件（interlayer_thickness 〜 E）を使わないため、既定値に揃えて共有します。
+    """
+
+    __slots__ = (
+        "layers",
+        "interlayer_material",
+        "interlayer_thickness",
+        "load_duration",
+        "temperature",
+        "span",
+        "E",
+        "_outer_layer_thickness",
+        "_equivalent_thickness",
+        "_stress_thickness",
+        "_stress_thickness_squared",
+        "_equivalent_thickness_cubed",
+    )
+
+    def __new__(
+        cls,
+        layers: Sequence[float],
+        interlayer_material: InterlayerMaterialTypeEnum,
+        interlayer_thickness: float = DEFAULT_INTERLAYER_THICKNESS,
+        load_duration: LoadDurationEnum = LoadDurationEnum.GUST,
+        temperature: float = DEFAULT_TEMPERATURE,
+        span: Optional[float] = None,
+        E: float = DEFAULT_E,
+    ) -> "GlassLayer":
+        """
+        ガラス層（積層構成）
+
+        Args:
+            layers: ガラスの板厚のリスト [mm]
+            interlayer_material: 中間膜の種類
+            interlayer_thickness: 中間膜1層の厚さ [mm]（PVB, EVAのみ使用）
+            load_duration: 荷重の継続時間（PVB, EVAのみ使用）
+            temperature: 中間膜の温度 [℃]（PVB, EVAのみ使用）
+            span: せん断結合を計算する板のスパン [mm]（PVB, EVAのみ使用。Noneの場合はせん断結合なしとする）
+            E: ガラスのヤング係数 [N/mm²]（PVB, EVAのみ使用）
+
+        Raises:
+            ValueError: せん断弾性係数の表が無い中間膜の場合
+        """
+        layers = tuple(float(layer) for layer in layers)
+        if interlayer_material == InterlayerMaterialTypeEnum.SG or len(layers) < 2:
+            return _intern_layer(layers, interlayer_material)
+        return _intern_layer(
+            layers,
+            interlayer_material,
+            float(interlayer_thickness),
+            load_duration,
+            float(temperature),
+            None if span is None else float(span),
+            float(E),
+        )
+
+    def _initialize(self, key: tuple) -> None:
+        # 属性と導出値を設定する（_intern_layer から1回だけ呼ぶ）
+        for name, value in zip(self.__slots__, key):
+            object.__setattr__(self, name, value)
+        layers = self.layers
+        if self.interlayer_material == InterlayerMaterialTypeEnum.SG or len(layers) < 2:
+            equivalent = stress = sum(layers)
+        else:
+            equivalent, stress = effective_thickness(
+                layers,
+                self.interlayer_material,
+                self.interlayer_thickness,
+                self.load_duration,
+                self.temperature,
+                0.0 if self.span is None else self.span,
+                self.E,
+            )
+        object.__setattr__(self, "_outer_layer_thickness", (layers[0], layers[-1]) if layers else None)
+        object.__setattr__(self, "_equivalent_thickness", equivalent)
+        object.__setattr__(self, "_stress_thickness", stress)
+        object.__setattr__(self, "_stress_thickness_squared", stress ** 2)
+        object.__setattr__(self, "_equivalent_thickness_cubed", equivalent ** 3)
+
+    def _key(self) -> tuple:
+        return (
+            self.layers, self.interlayer_material, self.interlayer_thickness, self.load_duration,
+            self.temperature, self.span, self.E,
+        )
+
+    def __setattr__(self, name, value):
+        raise AttributeError("GlassLayer は変更できません")
+
+    def __delattr__(self, name):
+        raise AttributeError("GlassLayer は変更できません")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, GlassLayer):
+            return NotImplemented
+        return self is other or self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __reduce__(self):
+        return GlassLayer, self._key()
+
+    def __repr__(self) -> str:
+        return f"GlassLayer(layers={list(self.layers)}, interlayer_material={self.interlayer_material})"
+
+    def get_outer_layer_thickness(self) -> Tuple[float, float]:
         """外側レイヤーの厚さを返す"""
-        outer_layer1 = self.layers[0]
-        outer_layer2 = self.layers[-1]
-        return [outer_layer1, outer_layer2]
-    
+        if self._outer_layer_thickness is None:
+            raise IndexError("板厚が指定されていません")
+        return self._outer_layer_thickness
+
     def get_equivalent_thickness(self) -> float:
-        """等価厚さを計算して返す"""
-        total_thickness = sum(self.layers)
-        
-        # Todo: SG以外の実装を行う。
-        if self.interlayer_material == InterlayerMaterialTypeEnum.SG:
-            return total_thickness
-        
-        # SG以外は等価板厚を計算
-        else:
-            equivalent_thickness = 0.866 * total_thickness - 0.268
-            return equivalent_thickness
\ No newline at end of file
+        """等価厚さ（たわみ用の有効板厚）を返す"""
+        return self._equivalent_thickness
+
+    def get_stress_thickness(self) -> float:
+        """応力用の有効板厚を返す（SGは等価厚さと同じ）"""
+        return self._stress_thickness
+
+    def get_stress_thickness_squared(self) -> float:
+        """応力用の有効板厚の2乗を返す"""
+        return self._stress_thickness_squared
+
+    def get_equivalent_thickness_cubed(self) -> float:
+        """等価厚さの3乗を返す"""
+        return self._equivalent_thickness_cubed
+
+    @staticmethod
+    def get_equivalent_thickness_batch(
+        layers: Sequence[Sequence[float]], interlayer_material: InterlayerMaterialTypeEnum
+    ) -> np.ndarray:
+        """
+        複数の積層構成の等価厚さを一括で計算して返す
+
+        Args:
+            layers: 積層構成（板厚のリスト）のリスト
+            interlayer_material: 中間膜の種類（PVB, EVAはせん断結合なしの有効板厚）
+
+        Returns:
+            np.ndarray: 等価厚さの配列（板厚が空の構成は0）
+        """
+        if interlayer_material != InterlayerMaterialTypeEnum.SG:
+            return GlassLayer.get_effective_thickness_batch(layers, interlayer_material)["deflection"]
+
+        counts = np.fromiter((len(layer) for layer in layers), dtype=np.intp, count=len(layers))
+        values = np.fromiter(chain.from_iterable(layers), dtype=np.float64, count=int(counts.sum()))
+        total_thickness = np.zeros(len(layers), dtype=np.float64)
+        filled = counts > 0
+        if filled.any():
+            offsets = (np.cumsum(counts) - counts)[filled]
+            total_thickness[filled] = np.add.reduceat(values, offsets)
+        return total_thickness
+
+    @staticmethod
+    def get_effective_thickness_batch(
+        layers: Sequence[Sequence[float]],
+        interlayer_material,
+        interlayer_thickness=DEFAULT_INTERLAYER_THICKNESS,
+        load_duration=LoadDurationEnum.GUST,
+        temperature=DEFAULT_TEMPERATURE,
+        span=0.0,
+        E=DEFAULT_E,
+    ) -> Dict[str, np.ndarray]:
+        """
+        複数の積層構成の有効板厚（たわみ用、応力用）を一括で計算して返す
+
+        Args:
+            layers: 積層構成（板厚のリスト）のリスト
+            interlayer_material: 中間膜の種類（全行共通または行ごとのリスト）
+            interlayer_thickness: 中間膜1層の厚さ [mm]
+            load_duration: 荷重の継続時間（全行共通または行ごとのリスト）
+            temperature: 中間膜の温度 [℃]
+            span: せん断結合を計算する板のスパン [mm]（0の場合はせん断結合なし）
+            E: ガラスのヤング係数 [N/mm²]
+
+        Returns:
+            Dict[str, np.ndarray]: deflection（たわみ用）, stress（応力用）の有効板厚（板厚が空の構成は0）
+        """
+        count = len(layers)
+        if isinstance(interlayer_material, InterlayerMaterialTypeEnum):
+            interlayer_material = [interlayer_material] * count
+        if isinstance(load_duration, LoadDurationEnum):
+            load_duration = [load_duration] * count
+        return effective_thickness_batch(
+            layers, interlayer_material, interlayer_thickness, load_duration, temperature, span, E
+        )
+
+
+@functools.lru_cache(maxsize=LAYER_CACHE_SIZE)
+def _intern_layer(
+    layers: Tuple[float, ...],
+    interlayer_material: InterlayerMaterialTypeEnum,
+    interlayer_thickness: float = DEFAULT_INTERLAYER_THICKNESS,
+    load_duration: LoadDurationEnum = LoadDurationEnum.GUST,
+    temperature: float = DEFAULT_TEMPERATURE,
+    span: Optional[float] = None,
+    E: float = DEFAULT_E,
+) -> GlassLayer:
+    # 同じ条件の GlassLayer を共有する（上限を超えた場合は最も古いものから共有をやめる）
+    layer = object.__new__(GlassLayer)
+    layer._initialize((layers, interlayer_material, interlayer_thickness, load_duration, temperature, span, E))
+    return layer
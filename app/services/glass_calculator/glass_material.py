@@ -1,7 +1,45 @@
+import functools
+
+# 共有する GlassMaterial の件数の上限
+MATERIAL_CACHE_SIZE = 256
+
+
 class GlassMaterial():
     """
     ガラス材料の定数クラス
+    変更できない値オブジェクトで、同じ定数の GlassMaterial は1つのオブジェクトを共有します。
     """
-    def __init__(self,E:float = 71600, nu:float = 0.3):
-        self.E = 71600
-        self.nu = 0.3
\ No newline at end of file
+
+    __slots__ = ("E", "nu")
+
+    def __new__(cls, E: float = 71600, nu: float = 0.3) -> "GlassMaterial":
+        return _intern_material(float(E), float(nu))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("GlassMaterial は変更できません")
+
+    def __delattr__(self, name):
+        raise AttributeError("GlassMaterial は変更できません")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, GlassMaterial):
+            return NotImplemented
+        return (self.E, self.nu) == (other.E, other.nu)
+
+    def __hash__(self) -> int:
+        return hash((self.E, self.nu))
+
+    def __reduce__(self):
+        return GlassMaterial, (self.E, self.nu)
+
+    def __repr__(self) -> str:
+        return f"GlassMaterial(E={self.E}, nu={self.nu})"
+
+
+@functools.lru_cache(maxsize=MATERIAL_CACHE_SIZE)
+def _intern_material(E: float, nu: float) -> GlassMaterial:
+    # 同じ定数の GlassMaterial を共有する
+    material = object.__new__(GlassMaterial)
+    object.__setattr__(material, "E", E)
+    object.__setattr__(material, "nu", nu)
+    return material
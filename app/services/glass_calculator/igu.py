@@ -0,0 +1,206 @@
+from typing import Dict, List
+
+import numpy as np
+
+from app.services.glass_calculator.contracts.enums import SupportTypeEnum
+from app.services.glass_calculator.glass_calculator import CalculateStress
+from app.services.glass_calculator.glass_layer import GlassLayer
+
+# たわみの体積係数（平均たわみ/最大たわみ）
+# 四辺支持はNavier解の第1項（(2/π)²）、二辺支持は単純梁、円形は周辺単純支持の理論解（ν=0.22）
+VOLUME_FACTORS = {
+    SupportTypeEnum.FOUR_UNIFORM: 4 / np.pi ** 2,
+    SupportTypeEnum.TWO_UNIFORM: 0.64,
+    SupportTypeEnum.CIRCULAR_UNIFORM: 0.5 - (1 + 0.22) / (6 * (5 + 0.22)),
+}
+
+# 標高差による気圧の変化 [N/mm² / m]（0.012 kPa/m）
+ALTITUDE_PRESSURE_GRADIENT = 0.012e-3
+
+# 絶対温度への換算 [K]
+ABSOLUTE_ZERO = 273.15
+
+# 不動点反復（Newton法）の反復回数の上限と収束判定（中空層の圧力の修正量 [N/mm²]）
+MAX_ITERATIONS = 50
+PRESSURE_TOLERANCE = 1e-12
+
+
+class InsulatingGlassUnit:
+    """
+    複層ガラス（IGU）の荷重分担の計算クラス
+    外側・内側のガラスの単位荷重（w=1）あたりの応力・変位を既存の計算クラスで求め、中空層の気体の状態方程式
+    （製造時の気体の量が一定）と、たわみによる中空層の体積の変化との釣り合いを、全ユニットまとめて反復して解きます。
+    気温・気圧・標高の変化による中空層の圧力（等容圧力）も同じ式で考慮します。
+    """
+
+    @staticmethod
+    def calculate_batch(units) -> List[dict]:
+        """
+        複層ガラスの荷重分担を一括で計算する
+
+        Args:
+            units: IGUInputScheme のリスト
+
+        Returns:
+            List[dict]: 入力順の outer, inner（ガラスごとの応力・変位・荷重・検定比）、cavity_pressure,
+                isochore_pressure, iterations またはエラー
+        """
+        count = len(units)
+
+        def column(name):
+            return np.array([np.nan if getattr(unit, name) is None else getattr(unit, name) for unit in units], dtype=np.float64)
+
+        a, b, E = column("a"), column("b"), column("E")
+        error = np.full(count, None, dtype=object)
+        # ガラスごとの単位荷重あたりの応力・変位（外側: 0〜count-1、内側: count〜2count-1）
+        unit_sigma = np.full(2 * count, np.nan)
+        unit_delta = np.full(2 * count, np.nan)
+        area = np.full(count, np.nan)
+        volume_factor = np.full(count, np.nan)
+
+        supports = np.array([SupportTypeEnum(unit.support) for unit in units], dtype=object)
+        for support in set(supports):
+            rows = np.flatnonzero(supports == support)
+            if support not in VOLUME_FACTORS:
+                error[rows] = f"複層ガラスの計算に対応していない支持条件です: {support.value}"
+                continue
+            pane_rows = np.concatenate([rows, rows + count])
+            result = InsulatingGlassUnit._unit_panes(support, [units[i] for i in rows], a[rows], b[rows], E[rows])
+            unit_sigma[pane_rows] = result["sigma"]
+            unit_delta[pane_rows] = result["delta"]
+            pane_error = result["error"].reshape(2, -1)
+            error[rows] = np.where(np.equal(pane_error[0], None), pane_error[1], pane_error[0])
+            if support == SupportTypeEnum.CIRCULAR_UNIFORM:
+                area[rows] = np.pi * a[rows] ** 2 / 4
+            else:
+                area[rows] = a[rows] * b[rows]
+            volume_factor[rows] = VOLUME_FACTORS[support]
+
+        # 単位荷重あたりの中空層の体積の変化 [mm³ / (N/mm²)]
+        outer_volume = volume_factor * area * unit_delta[:count]
+        inner_volume = volume_factor * area * unit_delta[count:]
+        solved = InsulatingGlassUnit.solve_cavity_pressure(
+            column("w"),
+            area * column("cavity"),
+            outer_volume,
+            inner_volume,
+            column("production_pressure") * 1e-3,
+            column("production_temperature") + ABSOLUTE_ZERO,
+            column("delta_temperature"),
+            column("delta_pressure") * 1e-3,
+            column("altitude_difference"),
+        )
+        valid = np.equal(error, None)
+        error[valid & ~solved["converged"]] = "複層ガラスの荷重分担が収束しませんでした"
+
+        # ガラスごとの荷重（外側は外から中空層へ向かう向き、内側は中空層から室内へ向かう向きを正）
+        load = np.concatenate([column("w") - solved["cavity_pressure"], solved["cavity_pressure"]])
+        sigma = unit_sigma * np.abs(load)
+        delta = unit_delta * np.abs(load)
+        allowable = CalculateStress._allowable_stress_columns([unit.outer for unit in units] + [unit.inner for unit in units])
+
+        results: List[dict] = []
+        for i in range(count):
+            if error[i] is None:
+                error[i] = allowable["error"][i] or allowable["error"][i + count]
+            if error[i] is not None:
+                results.append({"error": error[i]})
+                continue
+            panes = {}
+            for name, j in (("outer", i), ("inner", i + count)):
+                panes[name] = {
+                    "sigma": round(float(sigma[j]), 2),
+                    "delta": round(float(delta[j]), 2),
+                    "load": float(load[j]),
+                    "utilization_short_term": round(float(sigma[j] / allowable["shortTerm"][j]), 3),
+                    "utilization_long_term": round(float(sigma[j] / allowable["longTerm"][j]), 3),
+                }
+            results.append({
+                **panes,
+                "cavity_pressure": float(solved["cavity_pressure"][i]),
+                "isochore_pressure": float(solved["isochore_pressure"][i]),
+                "iterations": int(solved["iterations"][i]),
+            })
+        return results
+
+    @staticmethod
+    def _unit_panes(support, units, a, b, E) -> Dict[str, np.ndarray]:
+        # 外側・内側のガラスを並べ、単位荷重（w=1）の応力・変位を一括で求める（応力は応力用の有効板厚に換算する）
+        panes = [unit.outer for unit in units] + [unit.inner for unit in units]
+        a2, b2, E2 = np.concatenate([a, a]), np.concatenate([b, b]), np.concatenate([E, E])
+        edges = {"a": a2, "b": b2}
+        columns = {name: edges[edge] for name, edge in CalculateStress.edge_columns[support].items()}
+        laminate = GlassLayer.get_effective_thickness_batch(
+            [pane.t for pane in panes],
+            [pane.interlayer for pane in panes],
+            np.array([pane.interlayer_thickness for pane in panes], dtype=np.float64),
+            [unit.load_duration for unit in units] * 2,
+            np.array([unit.temperature for unit in units] * 2, dtype=np.float64),
+            CalculateStress.laminate_span(support, columns),
+            E2,
+        )
+        thickness = laminate["deflection"]
+        result = CalculateStress.calculate_edges(support, edges, thickness, 1.0, E2)
+        error = result["error"]
+        error[np.equal(error, None) & ~(thickness > 0)] = "板厚が指定されていません"
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sigma = result["sigma"] * (thickness / laminate["stress"]) ** 2
+        return {"sigma": sigma, "delta": result["delta"], "error": error}
+
+    @staticmethod
+    def solve_cavity_pressure(
+        w, volume, outer_volume, inner_volume, production_pressure, production_temperature,
+        delta_temperature, delta_pressure, altitude_difference,
+    ) -> Dict[str, np.ndarray]:
+        """
+        中空層の圧力（外気圧との差）を全ユニットまとめて解く
+
+        中空層の気体の量は製造時から一定（p V / T が一定）とし、
+        (p_a + Δp) (V0 - v1 (w - Δp) + v2 Δp) = p_P V0 T / T_P
+        を満たす Δp を不動点反復（Newton法）で求めます。収束したユニットから反復の対象を外します。
+
+        Args:
+            w: 外側のガラスに作用する荷重 [N/mm²]（外から中空層へ向かう向きを正）
+            volume: 中空層の体積 V0 [mm³]
+            outer_volume: 外側のガラスの単位荷重あたりの体積の変化 v1 [mm³ / (N/mm²)]
+            inner_volume: 内側のガラスの単位荷重あたりの体積の変化 v2 [mm³ / (N/mm²)]
+            production_pressure: 製造時の気圧 p_P [N/mm²]
+            production_temperature: 製造時の温度 T_P [K]
+            delta_temperature: 製造時からの中空層の温度の上昇 [K]
+            delta_pressure: 製造時からの気圧の低下 [N/mm²]
+            altitude_difference: 製造地からの標高差 [m]
+
+        Returns:
+            Dict[str, np.ndarray]: cavity_pressure（Δp）, isochore_pressure（ガラスが変形しない場合のΔp）[N/mm²]、
+                iterations（反復回数）, converged（収束したか）
+        """
+        outside = production_pressure - delta_pressure - ALTITUDE_PRESSURE_GRADIENT * altitude_difference
+        # 製造時の気体の量（p_P V0 T / T_P）
+        gas = production_pressure * volume * (production_temperature + delta_temperature) / production_temperature
+        isochore = gas / volume - outside
+
+        count = len(w)
+        pressure = np.zeros(count)
+        iterations = np.zeros(count, dtype=np.intp)
+        active = np.isfinite(gas) & np.isfinite(outer_volume) & np.isfinite(inner_volume)
+        converged = np.zeros(count, dtype=bool)
+        for _ in range(MAX_ITERATIONS):
+            if not active.any():
+                break
+            p = pressure[active]
+            current = volume[active] - outer_volume[active] * (w[active] - p) + inner_volume[active] * p
+            residual = (outside[active] + p) * current - gas[active]
+            slope = current + (outside[active] + p) * (outer_volume[active] + inner_volume[active])
+            step = residual / slope
+            pressure[active] = p - step
+            iterations[active] += 1
+            done = np.abs(step) <= PRESSURE_TOLERANCE
+            index = np.flatnonzero(active)
+            converged[index[done]] = True
+            active[index[done]] = False
+        return {
+            "cavity_pressure": pressure,
+            "isochore_pressure": isochore,
+            "iterations": iterations,
+            "converged": converged,
+        }
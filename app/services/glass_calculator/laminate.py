@@ -0,0 +1,360 @@
+import functools
+from dataclasses import dataclass
+from itertools import chain
+from types import MappingProxyType
+from typing import Dict, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from app.services.glass_calculator.contracts.enums import InterlayerMaterialTypeEnum, LoadDurationEnum
+
+# 中間膜1層の厚さの既定値 [mm]
+DEFAULT_INTERLAYER_THICKNESS = 0.76
+
+# 中間膜の温度の既定値 [℃]
+DEFAULT_TEMPERATURE = 20.0
+
+# ガラスのヤング係数の既定値 [N/mm²]
+DEFAULT_E = 71600.0
+
+# 荷重の継続時間 [s]
+LOAD_DURATION_SECONDS: Mapping[LoadDurationEnum, float] = MappingProxyType({
+    LoadDurationEnum.GUST: 3.0,
+    LoadDurationEnum.MINUTE: 60.0,
+    LoadDurationEnum.HOUR: 3600.0,
+    LoadDurationEnum.DAY: 86400.0,
+    LoadDurationEnum.MONTH: 2592000.0,
+    LoadDurationEnum.PERMANENT: 50 * 365 * 86400.0,
+})
+
+# 有効板厚のメモ化の件数の上限
+EFFECTIVE_THICKNESS_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class ShearModulusTable:
+    """
+    中間膜のせん断弾性係数の表
+    荷重の継続時間（対数）と温度の2軸で線形補間し、表の範囲外は端の値とします。
+    """
+    interlayer: InterlayerMaterialTypeEnum # 中間膜の種類
+    version: str # 表の版（値を変更した場合に更新する）
+    source: str # 出典・備考
+    durations: np.ndarray # 荷重の継続時間 [s]（昇順）
+    temperatures: np.ndarray # 温度 [℃]（昇順）
+    values: np.ndarray # せん断弾性係数 [N/mm²]（温度, 継続時間）
+
+    @property
+    def version_key(self) -> str:
+        """計算結果に付ける表の版（中間膜:版）"""
+        return f"{self.interlayer.value}:{self.version}"
+
+    def interpolate(self, duration, temperature) -> np.ndarray:
+        """
+        せん断弾性係数を補間する
+
+        Args:
+            duration: 荷重の継続時間 [s]（スカラーまたは配列）
+            temperature: 温度 [℃]（スカラーまたは配列）
+
+        Returns:
+            np.ndarray: せん断弾性係数 [N/mm²]
+        """
+        duration, temperature = np.broadcast_arrays(
+            np.asarray(duration, dtype=np.float64), np.asarray(temperature, dtype=np.float64)
+        )
+        log_axis = np.log10(self.durations)
+        x = np.clip(np.log10(duration), log_axis[0], log_axis[-1])
+        y = np.clip(temperature, self.temperatures[0], self.temperatures[-1])
+        i = np.clip(np.searchsorted(log_axis, x, side="right") - 1, 0, len(log_axis) - 2)
+        j = np.clip(np.searchsorted(self.temperatures, y, side="right") - 1, 0, len(self.temperatures) - 2)
+        u = (x - log_axis[i]) / (log_axis[i + 1] - log_axis[i])
+        v = (y - self.temperatures[j]) / (self.temperatures[j + 1] - self.temperatures[j])
+        # せん断弾性係数は桁で変わるため対数で補間する
+        log_values = np.log10(self.values)
+        value = (
+            (1 - u) * (1 - v) * log_values[j, i] + u * (1 - v) * log_values[j, i + 1]
+            + (1 - u) * v * log_values[j + 1, i] + u * v * log_values[j + 1, i + 1]
+        )
+        return 10 ** value
+
+
+_tables: Dict[InterlayerMaterialTypeEnum, ShearModulusTable] = {}
+
+
+def register_shear_modulus_table(
+    interlayer: InterlayerMaterialTypeEnum,
+    version: str,
+    source: str,
+    durations: Sequence[float],
+    temperatures: Sequence[float],
+    values: Sequence[Sequence[float]],
+) -> ShearModulusTable:
+    """
+    中間膜のせん断弾性係数の表を登録する（製品の値を使う場合はこの関数で差し替える表を追加する）
+
+    Args:
+        interlayer: 中間膜の種類
+        version: 表の版
+        source: 出典・備考
+        durations: 荷重の継続時間 [s]
+        temperatures: 温度 [℃]
+        values: せん断弾性係数 [N/mm²]（温度ごとに継続時間の順）
+
+    Returns:
+        ShearModulusTable: 登録した表
+
+    Raises:
+        ValueError: 同じ中間膜の表が登録済みの場合
+    """
+    if interlayer in _tables:
+        raise ValueError(f"せん断弾性係数の表は登録済みです: {interlayer}")
+
+    def frozen(array):
+        array = np.array(array, dtype=np.float64, order="C")
+        array.setflags(write=False)
+        return array
+
+    table = ShearModulusTable(
+        interlayer=interlayer,
+        version=version,
+        source=source,
+        durations=frozen(durations),
+        temperatures=frozen(temperatures),
+        values=frozen(values),
+    )
+    _tables[interlayer] = table
+    return table
+
+
+def get_shear_modulus_table(interlayer: InterlayerMaterialTypeEnum) -> ShearModulusTable:
+    """
+    中間膜のせん断弾性係数の表を返す
+
+    Raises:
+        ValueError: 表が登録されていない場合
+    """
+    try:
+        return _tables[interlayer]
+    except KeyError:
+        raise ValueError(f"せん断弾性係数の表がありません: {interlayer}")
+
+
+def shear_modulus_versions() -> Dict[str, str]:
+    """登録済みのせん断弾性係数の表の版（中間膜ごと）"""
+    return {interlayer.value: table.version for interlayer, table in _tables.items()}
+
+
+@functools.lru_cache(maxsize=256)
+def shear_modulus(interlayer: InterlayerMaterialTypeEnum, load_duration: LoadDurationEnum, temperature: float) -> float:
+    """
+    荷重の継続時間・温度に応じた中間膜のせん断弾性係数 [N/mm²]
+
+    Raises:
+        ValueError: 表が登録されていない場合
+    """
+    table = get_shear_modulus_table(interlayer)
+    return float(table.interpolate(LOAD_DURATION_SECONDS[load_duration], temperature))
+
+
+def effective_thickness_batch(
+    layers: Sequence[Sequence[float]],
+    interlayer: Sequence[InterlayerMaterialTypeEnum],
+    interlayer_thickness,
+    load_duration: Sequence[LoadDurationEnum],
+    temperature,
+    span,
+    E,
+) -> Dict[str, np.ndarray]:
+    """
+    合わせガラスの有効板厚（たわみ用、応力用）を一括で計算する
+
+    PVB, EVAはWölfel–Bennisonの方法（せん断結合係数Γ）で計算します。
+    3層以上は、各層の図心から積層全体の図心までの距離で断面2次モーメントを求め、中間膜の合計厚さで
+    Γを計算します（2層の場合はEN 16612の式と同じ）。
+    SGは従来どおり合計板厚（完全一体）とし、PVB, EVAの有効板厚も合計板厚を上限とします。
+
+    Args:
+        layers: 積層構成（板厚のリスト）のリスト
+        interlayer: 中間膜の種類（行ごと）
+        interlayer_thickness: 中間膜1層の厚さ [mm]
+        load_duration: 荷重の継続時間（行ごと）
+        temperature: 中間膜の温度 [℃]
+        span: せん断結合を計算する板のスパン（短辺など）[mm]
+        E: ガラスのヤング係数 [N/mm²]
+
+    Returns:
+        Dict[str, np.ndarray]: deflection（たわみ用）, stress（応力用）の有効板厚（板厚が空の構成は0）
+
+    Raises:
+        ValueError: せん断弾性係数の表が無い中間膜の場合
+    """
+    counts = np.fromiter((len(layer) for layer in layers), dtype=np.intp, count=len(layers))
+    values = np.fromiter(chain.from_iterable(layers), dtype=np.float64, count=int(counts.sum()))
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    return effective_thickness_packed(
+        offsets, values, interlayer, interlayer_thickness, load_duration, temperature, span, E
+    )
+
+
+def effective_thickness_packed(
+    offsets: np.ndarray,
+    values: np.ndarray,
+    interlayer: Sequence[InterlayerMaterialTypeEnum],
+    interlayer_thickness,
+    load_duration: Sequence[LoadDurationEnum],
+    temperature,
+    span,
+    E,
+) -> Dict[str, np.ndarray]:
+    """
+    offsets と values で表した積層構成（行 i の板厚は values[offsets[i]:offsets[i + 1]]）の有効板厚を一括で計算する
+    引数・戻り値は effective_thickness_batch と同じです。
+    """
+    offsets = np.asarray(offsets, dtype=np.intp)
+    values = np.asarray(values, dtype=np.float64)
+    count = len(offsets) - 1
+    counts = np.diff(offsets)
+    starts = offsets[:-1]
+    interlayer = np.asarray(interlayer, dtype=object).reshape(count)
+    load_duration = np.asarray(load_duration, dtype=object).reshape(count)
+    hv, temperature, span, E = (
+        np.broadcast_to(np.asarray(value, dtype=np.float64), (count,))
+        for value in (interlayer_thickness, temperature, span, E)
+    )
+
+    # 積層構成を (行, 層) の配列に並べる（層の無い位置は0）
+    width = int(counts.max()) if count else 0
+    rows = np.repeat(np.arange(count), counts)
+    position = np.arange(len(values)) - np.repeat(starts, counts)
+    h = np.zeros((count, width))
+    h[rows, position] = values
+
+    filled = counts > 0
+    total = np.zeros(count)
+    if filled.any():
+        # 1枚ずつの計算（sum）と同じく先頭の層から順に足し合わせる
+        total[filled] = np.add.reduceat(values, starts[filled])
+    G = np.full(count, np.inf)
+    for key in set(zip(interlayer, load_duration, temperature)):
+        if key[0] == InterlayerMaterialTypeEnum.SG:
+            continue
+        selected = (interlayer == key[0]) & (load_duration == key[1]) & (temperature == key[2])
+        G[selected] = shear_modulus(*key)
+    laminated = effective_thickness_matrix(h, counts, G, hv, span, E)
+    deflection, stress = laminated["deflection"], laminated["stress"]
+
+    sg = interlayer == InterlayerMaterialTypeEnum.SG
+    return {
+        "deflection": np.where(sg | ~filled, total, deflection),
+        "stress": np.where(sg | ~filled, total, stress),
+    }
+
+
+def effective_thickness_matrix(h: np.ndarray, counts, G, interlayer_thickness, span, E) -> Dict[str, np.ndarray]:
+    """
+    (行, 層) の配列に並べた積層構成の有効板厚（たわみ用、応力用）をWölfel–Bennisonの方法で計算する
+    各行の層の数・せん断弾性係数が決まっている場合（板厚のばらつきの標本など）に、積層構成のリストを
+    作らずに計算するための関数です。SG（完全一体）・空の構成の扱いは呼び出し側で行います。
+
+    Args:
+        h: 板厚の配列 (行, 層)（層の無い位置は0）[mm]
+        counts: 行ごとの層の数
+        G: 中間膜のせん断弾性係数 [N/mm²]
+        interlayer_thickness: 中間膜1層の厚さ [mm]
+        span: せん断結合を計算する板のスパン（短辺など）[mm]
+        E: ガラスのヤング係数 [N/mm²]
+
+    Returns:
+        Dict[str, np.ndarray]: deflection（たわみ用）, stress（応力用）の有効板厚（合計板厚を上限とする）
+    """
+    count, width = h.shape
+    if width == 0:
+        # 全ての行が空の構成の場合は層の位置を参照できないため、板厚0を返す（エラーは呼び出し側で判定する）
+        return {"deflection": np.zeros(count), "stress": np.zeros(count)}
+    counts = np.broadcast_to(np.asarray(counts, dtype=np.intp), (count,))
+    hv, G, span, E = (
+        np.broadcast_to(np.asarray(value, dtype=np.float64), (count,))
+        for value in (interlayer_thickness, G, span, E)
+    )
+    present = np.arange(width)[None, :] < counts[:, None]
+    total = h.sum(axis=1)
+    # 各層の図心の位置（下面から）と積層全体（ガラスのみ）の図心からの距離
+    center = np.cumsum(h, axis=1) - h / 2 + hv[:, None] * np.arange(width)[None, :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        centroid = np.where(total > 0, (h * center).sum(axis=1) / total, 0.0)
+        distance = np.where(present, np.abs(center - centroid[:, None]), 0.0)
+        steiner = (h * distance ** 2).sum(axis=1)
+        last = np.take_along_axis(center, np.maximum(counts - 1, 0)[:, None], axis=1)[:, 0]
+        lever = np.where(counts > 1, last - center[:, 0], 0.0)
+
+        shear = 9.6 * E * steiner * hv * np.maximum(counts - 1, 0) / (G * lever ** 2 * span ** 2)
+        gamma = np.where(counts > 1, 1 / (1 + shear), 1.0)
+        cube = (h ** 3).sum(axis=1) + 12 * gamma * steiner
+        deflection = np.cbrt(cube)
+        ply_stress = np.sqrt(cube[:, None] / (h + 2 * gamma[:, None] * distance))
+        stress = np.where(present, ply_stress, np.inf).min(axis=1, initial=np.inf)
+
+    # 中間膜の厚さを図心間の距離に含めるため、せん断結合が強い場合は合計板厚を超えることがある。
+    # SG（完全一体）より剛な評価にならないよう、合計板厚（一体の板）を上限とする
+    return {"deflection": np.minimum(deflection, total), "stress": np.minimum(stress, total)}
+
+
+@functools.lru_cache(maxsize=EFFECTIVE_THICKNESS_CACHE_SIZE)
+def effective_thickness(
+    layers: Tuple[float, ...],
+    interlayer: InterlayerMaterialTypeEnum,
+    interlayer_thickness: float,
+    load_duration: LoadDurationEnum,
+    temperature: float,
+    span: float,
+    E: float,
+) -> Tuple[float, float]:
+    """
+    1つの積層構成の有効板厚（たわみ用、応力用）
+    同じ積層構成・中間膜・継続時間・温度（とスパン、ヤング係数）の組はメモ化した値を返します。
+
+    Raises:
+        ValueError: せん断弾性係数の表が無い中間膜の場合
+    """
+    result = effective_thickness_batch(
+        [layers], [interlayer], interlayer_thickness, [load_duration], temperature, span, E
+    )
+    return float(result["deflection"][0]), float(result["stress"][0])
+
+
+# PVB（標準的な建築用PVB）の代表値
+register_shear_modulus_table(
+    InterlayerMaterialTypeEnum.PVB,
+    version="1",
+    source="建築用PVB中間膜のせん断弾性係数の代表値（製品の値がある場合は差し替える）",
+    durations=[3, 60, 3600, 86400, 2592000, 1576800000],
+    temperatures=[0, 10, 20, 30, 40, 50, 60],
+    values=[
+        [172.0, 111.0, 33.0, 9.0, 2.3, 0.8],
+        [74.4, 26.8, 6.4, 1.6, 0.42, 0.2],
+        [12.8, 2.91, 0.64, 0.34, 0.19, 0.05],
+        [1.54, 0.58, 0.3, 0.15, 0.08, 0.05],
+        [0.69, 0.39, 0.2, 0.09, 0.06, 0.05],
+        [0.44, 0.25, 0.11, 0.06, 0.05, 0.05],
+        [0.3, 0.15, 0.07, 0.05, 0.05, 0.05],
+    ],
+)
+
+# EVA（建築用EVA）の代表値
+register_shear_modulus_table(
+    InterlayerMaterialTypeEnum.EVA,
+    version="1",
+    source="建築用EVA中間膜のせん断弾性係数の代表値（製品の値がある場合は差し替える）",
+    durations=[3, 60, 3600, 86400, 2592000, 1576800000],
+    temperatures=[0, 10, 20, 30, 40, 50, 60],
+    values=[
+        [25.0, 21.0, 17.0, 14.0, 11.0, 8.0],
+        [12.0, 10.5, 8.5, 7.0, 5.5, 4.0],
+        [6.3, 5.5, 4.6, 4.0, 3.5, 3.0],
+        [3.6, 3.1, 2.6, 2.2, 1.9, 1.6],
+        [2.0, 1.7, 1.4, 1.2, 1.0, 0.8],
+        [1.2, 1.0, 0.85, 0.7, 0.6, 0.5],
+        [0.8, 0.65, 0.55, 0.45, 0.4, 0.35],
+    ],
+)
@@ -0,0 +1,211 @@
+import itertools
+import math
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
+
+import numpy as np
+
+from app.services.glass_calculator.contracts.enums import LoadCaseTypeEnum, LoadDurationEnum, SupportTypeEnum
+from app.services.glass_calculator.glass_calculator import CalculateStress
+from app.services.glass_calculator.glass_layer import GlassLayer
+
+# 荷重の種類ごとの継続時間の既定値
+DEFAULT_DURATIONS: Mapping[LoadCaseTypeEnum, LoadDurationEnum] = MappingProxyType({
+    LoadCaseTypeEnum.WIND: LoadDurationEnum.GUST,
+    LoadCaseTypeEnum.SELF_WEIGHT: LoadDurationEnum.PERMANENT,
+    LoadCaseTypeEnum.SNOW: LoadDurationEnum.MONTH,
+    LoadCaseTypeEnum.MAINTENANCE: LoadDurationEnum.MINUTE,
+})
+
+# 長期許容応力で検定する継続時間（これ以外の荷重を含む組み合わせは短期許容応力で検定する）
+LONG_TERM_DURATIONS = frozenset({LoadDurationEnum.MONTH, LoadDurationEnum.PERMANENT})
+
+# ガラスの単位体積重量 [N/mm³]（25 kN/m³）
+GLASS_UNIT_WEIGHT = 2.5e-5
+
+
+class LoadCombination:
+    """
+    荷重の組み合わせの計算クラス
+    全ての計算クラスの応力・変位は荷重wに比例するため、荷重ケースごとに単位荷重（w=1）の結果を
+    継続時間に応じた有効板厚で一括で求め、組み合わせごとに荷重係数×荷重で重ね合わせます。
+    組み合わせに長期の荷重（積雪・自重）のみを含む場合は長期許容応力、それ以外は短期許容応力で検定し、
+    検定比が最大の組み合わせを返します。
+    """
+
+    @staticmethod
+    def calculate_batch(panels, details: bool = False) -> List[dict]:
+        """
+        パネルごとに全ての荷重の組み合わせを一括で計算する
+
+        Args:
+            panels: LoadCombinationPanelScheme のリスト
+            details: 全ての組み合わせの結果を返すか
+
+        Returns:
+            List[dict]: 入力順の governing（, combinations）またはエラー
+        """
+        errors: List[object] = [None] * len(panels)
+
+        # 荷重ケースを1列に並べる
+        case_panel, case_w, case_duration = [], [], []
+        case_offsets = []
+        for i, panel in enumerate(panels):
+            case_offsets.append(len(case_w))
+            for case in panel.cases:
+                duration = case.duration or DEFAULT_DURATIONS[case.kind]
+                w = case.w
+                if w is None and case.kind == LoadCaseTypeEnum.SELF_WEIGHT:
+                    # 自重の面外方向の成分（傾斜角90度（鉛直）は0）
+                    w = GLASS_UNIT_WEIGHT * sum(panel.t) * math.sin(math.radians(90 - panel.slope))
+                if w is None:
+                    errors[i] = errors[i] or f"荷重を入力してください: {case.name}"
+                case_panel.append(i)
+                case_w.append(np.nan if w is None else w)
+                case_duration.append(duration)
+
+        # 組み合わせを (組み合わせ, 荷重ケース, 荷重係数) の組に並べる
+        combination_panel: List[int] = []
+        combination_names: List[str] = []
+        terms_index, terms_case, terms_factor = [], [], []
+        for i, panel in enumerate(panels):
+            try:
+                combinations = LoadCombination.expand_combinations(panel)
+            except ValueError as e:
+                errors[i] = errors[i] or str(e)
+                continue
+            rows = {case.name: case_offsets[i] + j for j, case in enumerate(panel.cases)}
+            for name, factors in combinations:
+                for case_name, factor in factors.items():
+                    terms_index.append(len(combination_names))
+                    terms_case.append(rows[case_name])
+                    terms_factor.append(factor)
+                combination_panel.append(i)
+                combination_names.append(name)
+
+        # 荷重ケースごとの単位荷重の応力・変位（継続時間ごとの有効板厚）
+        case_panel_array = np.array(case_panel, dtype=np.intp)
+        unit_sigma = np.full(len(case_w), np.nan)
+        unit_delta = np.full(len(case_w), np.nan)
+        case_error = np.full(len(case_w), None, dtype=object)
+        supports = np.array([SupportTypeEnum(panels[i].support) for i in case_panel], dtype=object)
+        for support in set(supports):
+            rows = np.flatnonzero(supports == support)
+            result = LoadCombination._unit_cases(
+                support, [panels[i] for i in case_panel_array[rows]], [case_duration[j] for j in rows]
+            )
+            unit_sigma[rows] = result["sigma"]
+            unit_delta[rows] = result["delta"]
+            case_error[rows] = result["error"]
+
+        # 重ね合わせ（組み合わせごとに荷重係数×荷重×単位荷重の結果を足し合わせる）
+        count = len(combination_names)
+        index = np.array(terms_index, dtype=np.intp)
+        case = np.array(terms_case, dtype=np.intp)
+        load = np.array(terms_factor, dtype=np.float64) * np.array(case_w, dtype=np.float64)[case]
+        sigma = np.abs(np.bincount(index, weights=load * unit_sigma[case], minlength=count))
+        delta = np.abs(np.bincount(index, weights=load * unit_delta[case], minlength=count))
+        long_term_case = np.array([duration in LONG_TERM_DURATIONS for duration in case_duration], dtype=bool)
+        short_term = np.bincount(index, weights=~long_term_case[case], minlength=count) > 0
+
+        combination_panel_array = np.array(combination_panel, dtype=np.intp)
+        allowable = CalculateStress._allowable_stress_columns(panels)
+        limit = np.where(
+            short_term, allowable["shortTerm"][combination_panel_array], allowable["longTerm"][combination_panel_array]
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            utilization = sigma / limit
+
+        results: List[dict] = []
+        starts = np.searchsorted(combination_panel_array, np.arange(len(panels) + 1))
+        for i, panel in enumerate(panels):
+            error = errors[i]
+            if error is None:
+                offset = case_offsets[i]
+                error = next((e for e in case_error[offset:offset + len(panel.cases)] if e is not None), None)
+            if error is None and not sum(panel.t) > 0:
+                error = "板厚が指定されていません"
+            error = error or allowable["error"][i]
+            if error is not None:
+                results.append({"error": error})
+                continue
+            rows = [
+                {
+                    "name": combination_names[j],
+                    "sigma": round(float(sigma[j]), 2),
+                    "delta": round(float(delta[j]), 2),
+                    "term": "short_term" if short_term[j] else "long_term",
+                    "utilization": round(float(utilization[j]), 3),
+                }
+                for j in range(starts[i], starts[i + 1])
+            ]
+            governing = int(np.argmax(utilization[starts[i]:starts[i + 1]]))
+            row = {"governing": rows[governing]}
+            if details:
+                row["combinations"] = rows
+            results.append(row)
+        return results
+
+    @staticmethod
+    def expand_combinations(panel) -> List[Tuple[str, Dict[str, float]]]:
+        """
+        パネルの荷重の組み合わせ（名前と荷重ケースごとの荷重係数）を求める
+
+        組み合わせを指定しない場合は、自重を常に含め、自重以外の荷重は種類ごとに「含めない」か
+        いずれか1ケース（正圧・負圧など同じ種類のケースは同時に作用しない）を選ぶ全ての組み合わせとします。
+
+        Raises:
+            ValueError: 荷重ケースの名前が重複している、未定義の荷重ケースを参照している場合
+        """
+        names = [case.name for case in panel.cases]
+        duplicated = sorted({name for name in names if names.count(name) > 1})
+        if duplicated:
+            raise ValueError(f"荷重ケースの名前が重複しています: {', '.join(duplicated)}")
+
+        if panel.combinations is not None:
+            combinations = []
+            for combination in panel.combinations:
+                unknown = [name for name in combination.factors if name not in names]
+                if unknown:
+                    raise ValueError(f"未定義の荷重ケース: {', '.join(unknown)}")
+                name = combination.name or "+".join(
+                    case_name if factor == 1 else f"{factor:g}{case_name}"
+                    for case_name, factor in combination.factors.items()
+                )
+                combinations.append((name, dict(combination.factors)))
+            return combinations
+
+        permanent = [case.name for case in panel.cases if case.kind == LoadCaseTypeEnum.SELF_WEIGHT]
+        variable: Dict[LoadCaseTypeEnum, List[str]] = {}
+        for case in panel.cases:
+            if case.kind != LoadCaseTypeEnum.SELF_WEIGHT:
+                variable.setdefault(case.kind, []).append(case.name)
+        combinations = []
+        for choice in itertools.product(*([None] + cases for cases in variable.values())):
+            selected = permanent + [name for name in choice if name is not None]
+            if selected:
+                combinations.append(("+".join(selected), {name: 1.0 for name in selected}))
+        return combinations
+
+    @staticmethod
+    def _unit_cases(support, panels, durations) -> Dict[str, np.ndarray]:
+        # 荷重ケースごとの単位荷重（w=1）の応力（応力用の有効板厚）・変位（たわみ用の有効板厚）
+        def column(name):
+            return np.array([np.nan if getattr(panel, name) is None else getattr(panel, name) for panel in panels], dtype=np.float64)
+
+        edges = {name: column(name) for name in ("a", "b", "a1", "b1")}
+        E = column("E")
+        columns = {name: edges[edge] for name, edge in CalculateStress.edge_columns[support].items()}
+        laminate = GlassLayer.get_effective_thickness_batch(
+            [panel.t for panel in panels],
+            [panel.interlayer for panel in panels],
+            column("interlayer_thickness"),
+            durations,
+            column("temperature"),
+            CalculateStress.laminate_span(support, columns),
+            E,
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            stress = CalculateStress.calculate_edges(support, edges, laminate["stress"], 1.0, E)
+            deflection = CalculateStress.calculate_edges(support, edges, laminate["deflection"], 1.0, E)
+        return {"sigma": stress["sigma"], "delta": deflection["delta"], "error": deflection["error"]}
@@ -0,0 +1,142 @@
+import heapq
+from math import comb
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from app.services.glass_calculator.allowable_stress import GlassAllowableUnitStress
+from app.services.glass_calculator.contracts.enums import GlassTypeEnum, InterlayerMaterialTypeEnum, SupportTypeEnum
+from app.services.glass_calculator.glass_calculator import CalculateStress
+from app.services.glass_calculator.glass_layer import GlassLayer
+
+# 1回にまとめて計算する候補の数
+EVALUATION_CHUNK_SIZE = 64
+
+
+class ThicknessOptimizer:
+    """
+    最小板厚の探索クラス
+    使用できる板厚の組み合わせ（単板・合わせガラス）から、短期許容応力と変位の制限値を満たす
+    最も軽い積層構成を求めます。
+    応力は等価板厚の2乗、変位は3乗に反比例するため、単位荷重の結果から必要な等価板厚の下限を求め、
+    下限を下回る候補は計算せずに除外します。候補は軽い順に作り、条件を満たす候補が見つかった時点で
+    探索をやめるため、全ての組み合わせは作りません。
+    """
+
+    @staticmethod
+    def optimize(
+        support: SupportTypeEnum,
+        edges: Dict[str, Optional[float]],
+        w: float,
+        E: float,
+        glass_type: GlassTypeEnum,
+        catalog: Sequence[float],
+        max_plies: int,
+        deflection_limit: Optional[float] = None,
+    ) -> dict:
+        """
+        最も軽い積層構成を求める
+
+        Args:
+            support: 支持条件
+            edges: 形状（a, b, a1, b1）[mm]
+            w: 荷重 [N/mm2]
+            E: ヤング係数 [N/mm2]
+            glass_type: ガラスの種類
+            catalog: 使用できる板厚 [mm]
+            max_plies: 合わせガラスの最大枚数
+            deflection_limit: 変位の制限値 [mm]（Noneの場合は応力のみ）
+
+        Returns:
+            dict: 積層構成 t と sigma, delta, allowable_stress, 候補数（組み合わせの数）、評価数
+
+        Raises:
+            ValueError: 形状が係数テーブルの適用範囲外の場合
+        """
+        # 候補は板厚の昇順に並べる（外側の板厚の小さい方は最も薄い板）
+        plies = sorted(set(catalog))
+
+        # 単位荷重・単位板厚の結果から、必要な等価板厚の下限を求める
+        unit = CalculateStress.calculate_edges(support, edges, np.ones(1), 1.0, E)
+        if unit["error"][0] is not None:
+            raise ValueError(unit["error"][0])
+        max_allowable = GlassAllowableUnitStress.compiled_allowable_stress[glass_type].short_term.max()
+        required = np.sqrt(unit["sigma"][0] * w / max_allowable)
+        if deflection_limit is not None:
+            required = max(required, np.cbrt(unit["delta"][0] * w / deflection_limit))
+
+        # SGの等価板厚は合計板厚（重さ）のため、軽い順に下限以上の候補をまとめて計算し、
+        # 条件を満たす候補が見つかった時点で探索をやめる
+        evaluated = 0
+        best = None
+        chunk: List[List[float]] = []
+        for layup in ThicknessOptimizer.iter_layups(plies, max_plies):
+            # 丸め誤差で境界の候補を除外しないよう、わずかに緩めて枝刈りする
+            if sum(layup) < required * (1 - 1e-9):
+                continue
+            chunk.append(layup)
+            if len(chunk) == EVALUATION_CHUNK_SIZE:
+                best = ThicknessOptimizer._evaluate(support, edges, w, E, glass_type, chunk, deflection_limit)
+                evaluated += len(chunk)
+                chunk = []
+                if best is not None:
+                    break
+        if best is None and chunk:
+            best = ThicknessOptimizer._evaluate(support, edges, w, E, glass_type, chunk, deflection_limit)
+            evaluated += len(chunk)
+
+        summary = {
+            "candidates": sum(comb(len(plies) + count - 1, count) for count in range(1, max_plies + 1)),
+            "evaluated": evaluated,
+        }
+        if best is None:
+            return {**summary, "error": "条件を満たす積層構成がありません"}
+        return {**summary, **best}
+
+    @staticmethod
+    def iter_layups(plies: Sequence[float], max_plies: int) -> Iterator[List[float]]:
+        """
+        積層構成を重さ（合計板厚）の軽い順、同じ重さは枚数の少ない順に返す
+        全ての組み合わせを作らずに、ヒープで次に軽い構成を1つずつ求めます。
+
+        Args:
+            plies: 使用できる板厚（昇順）[mm]
+            max_plies: 合わせガラスの最大枚数
+
+        Returns:
+            Iterator[List[float]]: 板厚の昇順の積層構成
+        """
+        def entry(index, position):
+            return (sum(plies[i] for i in index), len(index), index, position)
+
+        # 各枚数の最も薄い構成から始め、位置 position 以前の板を1つずつ厚くした構成を追加する
+        # （右の位置から順に厚くするため、同じ構成は1回だけ現れる）
+        heap = [entry((0,) * count, count - 1) for count in range(1, max_plies + 1)] if plies else []
+        heapq.heapify(heap)
+        while heap:
+            _, count, index, position = heapq.heappop(heap)
+            yield [plies[i] for i in index]
+            for p in range(position + 1):
+                upper = index[p + 1] if p + 1 < count else len(plies) - 1
+                if index[p] < upper:
+                    heapq.heappush(heap, entry(index[:p] + (index[p] + 1,) + index[p + 1:], p))
+
+    @staticmethod
+    def _evaluate(support, edges, w, E, glass_type, layers, deflection_limit) -> Optional[dict]:
+        # 候補をまとめて計算し、最初に条件を満たす候補の結果を返す（無い場合はNone）
+        thickness = GlassLayer.get_equivalent_thickness_batch(layers, InterlayerMaterialTypeEnum.SG)
+        outer_thickness = np.array([layup[0] for layup in layers], dtype=np.float64)
+        result = CalculateStress.calculate_edges(support, edges, thickness, w, E)
+        allowable = GlassAllowableUnitStress.get_allowable_stress_batch(glass_type, outer_thickness)
+        passed = result["sigma"] <= allowable["shortTerm"]
+        if deflection_limit is not None:
+            passed &= result["delta"] <= deflection_limit
+        if not passed.any():
+            return None
+        best = int(np.argmax(passed))
+        return {
+            "t": layers[best],
+            "sigma": round(float(result["sigma"][best]), 2),
+            "delta": round(float(result["delta"][best]), 2),
+            "allowable_stress": float(allowable["shortTerm"][best]),
+        }
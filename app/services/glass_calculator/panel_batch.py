@@ -0,0 +1,238 @@
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Optional, Sequence
+
+import numpy as np
+
+from app.services.glass_calculator.contracts.enums import (
+    GlassTypeEnum,
+    InterlayerMaterialTypeEnum,
+    LoadDurationEnum,
+    LookupModeEnum,
+    SolverEnum,
+    SupportTypeEnum,
+)
+from app.services.glass_calculator.fem.plate import DEFAULT_DIVISIONS
+from app.services.glass_calculator.laminate import (
+    DEFAULT_E,
+    DEFAULT_INTERLAYER_THICKNESS,
+    DEFAULT_TEMPERATURE,
+    effective_thickness_packed,
+)
+
+# 支持条件ごとの形状の列
+GEOMETRY_COLUMNS: Mapping[SupportTypeEnum, tuple] = MappingProxyType({
+    SupportTypeEnum.FOUR_UNIFORM: ("a", "b"),
+    SupportTypeEnum.FOUR_PARTIAL: ("a", "b", "a1", "b1"),
+    SupportTypeEnum.THREE_UNIFORM: ("free", "fix"),
+    SupportTypeEnum.TWO_UNIFORM: ("free", "fix"),
+    SupportTypeEnum.CIRCULAR_UNIFORM: ("D",),
+})
+
+# 形状以外の数値の列と既定値
+NUMERIC_COLUMNS: Mapping[str, float] = MappingProxyType({
+    "w": np.nan,
+    "E": DEFAULT_E,
+    "nu": 0.22,
+    "interlayer_thickness": DEFAULT_INTERLAYER_THICKNESS,
+    "temperature": DEFAULT_TEMPERATURE,
+})
+
+# 種類を表す列（行ごとの値の種類は少ないため、値ごとに行をまとめて計算する）と既定値
+CATEGORY_COLUMNS: Mapping[str, object] = MappingProxyType({
+    "glass_type": GlassTypeEnum.FLOAT,
+    "interlayer": InterlayerMaterialTypeEnum.SG,
+    "load_duration": LoadDurationEnum.GUST,
+    "lookup_mode": LookupModeEnum.STEP,
+    "solver": SolverEnum.TABLE,
+})
+
+
+def _frozen(values, dtype) -> np.ndarray:
+    # 連続した読み取り専用の配列（入力の配列とはメモリを共有しない）
+    array = np.array(values, dtype=dtype)
+    array.setflags(write=False)
+    return array
+
+
+@dataclass(frozen=True)
+class PanelBatch:
+    """
+    同じ支持条件のパネルの列指向（structure of arrays）の表現
+    形状・荷重・材料は連続したfloat64の列、積層構成は offsets と values（行 i の板厚は
+    values[offsets[i]:offsets[i + 1]]）で持ち、パネルごとのオブジェクトを作らずに計算クラスへ渡します。
+    列は読み取り専用です。
+    """
+    support: SupportTypeEnum # 支持条件
+    columns: Mapping[str, np.ndarray] # 形状（GEOMETRY_COLUMNS）と NUMERIC_COLUMNS の列
+    layup_offsets: np.ndarray # 積層構成の開始位置（行数+1）
+    layup_values: np.ndarray # 積層構成の板厚を行順に並べた配列 [mm]
+    categories: Mapping[str, np.ndarray] = field(default_factory=dict) # CATEGORY_COLUMNS の列（object配列）
+    fem_edges: Optional[np.ndarray] = None # FEMの辺の条件（行ごと。Noneは支持条件の既定値）
+    fem_divisions: Optional[np.ndarray] = None # FEMの短辺方向の要素分割数（行ごと）
+
+    def __post_init__(self):
+        count = len(self.layup_offsets) - 1
+        columns = {}
+        for name in GEOMETRY_COLUMNS[self.support] + tuple(NUMERIC_COLUMNS):
+            value = self.columns.get(name, NUMERIC_COLUMNS.get(name, np.nan))
+            columns[name] = _frozen(np.broadcast_to(np.asarray(value, dtype=np.float64), (count,)), np.float64)
+        categories = {}
+        for name, default in CATEGORY_COLUMNS.items():
+            value = self.categories.get(name)
+            array = np.full(count, default, dtype=object)
+            if value is not None:
+                array[:] = value
+            array.setflags(write=False)
+            categories[name] = array
+        object.__setattr__(self, "columns", MappingProxyType(columns))
+        object.__setattr__(self, "categories", MappingProxyType(categories))
+        object.__setattr__(self, "layup_offsets", _frozen(self.layup_offsets, np.intp))
+        object.__setattr__(self, "layup_values", _frozen(self.layup_values, np.float64))
+
+    @classmethod
+    def from_panels(cls, support: SupportTypeEnum, panels: Sequence) -> "PanelBatch":
+        """
+        入力モデル（FourSideUniformInputScheme など）のリストから作成する
+        属性ごとに1回だけ走査し、列に詰めます。
+        """
+        count = len(panels)
+
+        def numeric(name, default):
+            return np.fromiter((getattr(panel, name, default) for panel in panels), dtype=np.float64, count=count)
+
+        def category(name, default):
+            array = np.empty(count, dtype=object)
+            array[:] = [getattr(panel, name, default) for panel in panels]
+            return array
+
+        counts = np.fromiter((len(panel.t) for panel in panels), dtype=np.intp, count=count)
+        values = np.fromiter((t for panel in panels for t in panel.t), dtype=np.float64, count=int(counts.sum()))
+        columns = {name: numeric(name, np.nan) for name in GEOMETRY_COLUMNS[support]}
+        columns.update({name: numeric(name, default) for name, default in NUMERIC_COLUMNS.items()})
+        fem = [getattr(panel, "fem", None) for panel in panels]
+        fem_edges = np.empty(count, dtype=object)
+        fem_edges[:] = [None if options is None else options.edges for options in fem]
+        return cls(
+            support=support,
+            columns=columns,
+            layup_offsets=np.concatenate([[0], np.cumsum(counts)]),
+            layup_values=values,
+            categories={name: category(name, default) for name, default in CATEGORY_COLUMNS.items()},
+            fem_edges=fem_edges,
+            fem_divisions=np.array([DEFAULT_DIVISIONS if options is None else options.divisions for options in fem], dtype=np.intp),
+        )
+
+    def __len__(self) -> int:
+        return len(self.layup_offsets) - 1
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        数値または種類の列
+        """
+        if name in self.columns:
+            return self.columns[name]
+        return self.categories[name]
+
+    @property
+    def geometry(self) -> Dict[str, np.ndarray]:
+        """
+        形状の列（GEOMETRY_COLUMNS の順）
+        """
+        return {name: self.columns[name] for name in GEOMETRY_COLUMNS[self.support]}
+
+    @property
+    def layup_counts(self) -> np.ndarray:
+        """
+        行ごとの層の数
+        """
+        return np.diff(self.layup_offsets)
+
+    def layup(self, row: int) -> np.ndarray:
+        """
+        1行の積層構成（板厚）
+        """
+        return self.layup_values[self.layup_offsets[row]:self.layup_offsets[row + 1]]
+
+    def total_thickness(self) -> np.ndarray:
+        """
+        行ごとの合計板厚（板厚が空の行は0）
+        """
+        total = np.zeros(len(self))
+        filled = self.layup_counts > 0
+        if filled.any():
+            total[filled] = np.add.reduceat(self.layup_values, self.layup_offsets[:-1][filled])
+        return total
+
+    def outer_thickness(self) -> np.ndarray:
+        """
+        行ごとの外側の板厚（先頭と末尾の層の小さい方。板厚が空の行はnan）
+        """
+        outer = np.full(len(self), np.nan)
+        filled = self.layup_counts > 0
+        if filled.any():
+            first = self.layup_values[self.layup_offsets[:-1][filled]]
+            last = self.layup_values[self.layup_offsets[1:][filled] - 1]
+            outer[filled] = np.minimum(first, last)
+        return outer
+
+    def effective_thickness(self, span) -> Dict[str, np.ndarray]:
+        """
+        行ごとの有効板厚（たわみ用、応力用。SGは合計板厚）
+
+        Args:
+            span: せん断結合を計算するスパン [mm]
+        """
+        return effective_thickness_packed(
+            self.layup_offsets,
+            self.layup_values,
+            self.categories["interlayer"],
+            self.columns["interlayer_thickness"],
+            self.categories["load_duration"],
+            self.columns["temperature"],
+            span,
+            self.columns["E"],
+        )
+
+    def take(self, rows) -> "PanelBatch":
+        """
+        行を選んだ PanelBatch（行の添字またはbool配列）
+        """
+        rows = np.flatnonzero(rows) if np.asarray(rows).dtype == bool else np.asarray(rows, dtype=np.intp)
+        counts = self.layup_counts[rows]
+        starts = self.layup_offsets[:-1][rows]
+        positions = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(int(counts.sum()))
+        return PanelBatch(
+            support=self.support,
+            columns={name: values[rows] for name, values in self.columns.items()},
+            layup_offsets=np.concatenate([[0], np.cumsum(counts)]),
+            layup_values=self.layup_values[positions],
+            categories={name: values[rows] for name, values in self.categories.items()},
+            fem_edges=None if self.fem_edges is None else self.fem_edges[rows],
+            fem_divisions=None if self.fem_divisions is None else self.fem_divisions[rows],
+        )
+
+    def calculate_by_lookup_mode(
+        self,
+        thickness: np.ndarray,
+        kernel: Callable[[Mapping[str, np.ndarray], np.ndarray, LookupModeEnum], Dict[str, np.ndarray]],
+    ) -> Dict[str, np.ndarray]:
+        """
+        係数の求め方ごとに行をまとめて kernel(列, 板厚, 係数の求め方) を計算し、行の順に戻す
+        （係数の求め方が1種類の場合は列をそのまま渡す）
+        """
+        lookup_modes = self.categories["lookup_mode"]
+        modes = set(lookup_modes)
+        if len(modes) <= 1:
+            return kernel(self.columns, thickness, modes.pop() if modes else LookupModeEnum.STEP)
+        result = {
+            "sigma": np.full(len(self), np.nan),
+            "delta": np.full(len(self), np.nan),
+            "error": np.full(len(self), None, dtype=object),
+        }
+        for lookup_mode in modes:
+            rows = lookup_modes == lookup_mode
+            part = kernel({name: values[rows] for name, values in self.columns.items()}, thickness[rows], lookup_mode)
+            for name, values in part.items():
+                result[name][rows] = values
+        return result
@@ -0,0 +1,105 @@
+from typing import Optional, Sequence
+
+import numpy as np
+
+from app.services.glass_calculator.allowable_stress import GlassAllowableUnitStress
+from app.services.glass_calculator.contracts.enums import GlassTypeEnum, InterlayerMaterialTypeEnum, SupportTypeEnum
+from app.services.glass_calculator.glass_calculator import CalculateStress
+from app.services.glass_calculator.glass_layer import GlassLayer
+
+# 最大寸法を求められる支持条件（等分布荷重で応力がa²、変位がa⁴に比例するもの）
+PANEL_SIZE_SUPPORTS = (SupportTypeEnum.FOUR_UNIFORM, SupportTypeEnum.THREE_UNIFORM, SupportTypeEnum.TWO_UNIFORM)
+
+# 許容応力・変位の制限値との比較で許す丸め誤差（相対）
+TOLERANCE = 1e-9
+
+
+class PanelSizeSolver:
+    """
+    最大寸法の計算クラス
+    辺長比 b/a を固定すると係数（alpha, beta）は一定となり、応力はaの2乗、変位はaの4乗に比例するため、
+    a=1 の結果から許容応力・変位の制限値に達するaを直接求めます。
+    ただし辺長比が係数テーブルの区切りに一致する場合、b=比×a から計算し直した b/a が丸め誤差で
+    次の区間に入ることがあるため、両側の区間の係数で求めたaを実際の寸法で検算し、満たす方の大きい値を採用します。
+    """
+
+    @staticmethod
+    def solve(
+        support: SupportTypeEnum,
+        ratio: Sequence[float],
+        layers: Sequence[float],
+        w: float,
+        E: float,
+        glass_type: GlassTypeEnum,
+        deflection_limit: Optional[float] = None,
+    ) -> dict:
+        """
+        辺長比ごとの最大寸法を一括で求める
+
+        Args:
+            support: 支持条件（四辺・三辺・二辺支持の等分布荷重）
+            ratio: 辺長比 b/a のリスト（三辺・二辺支持は 固定辺/フリー辺）
+            layers: 積層構成 [mm]
+            w: 荷重 [N/mm2]
+            E: ヤング係数 [N/mm2]
+            glass_type: ガラスの種類
+            deflection_limit: 変位の制限値 [mm]（Noneの場合は応力のみ）
+
+        Returns:
+            dict: 短期許容応力（面内）と、入力順の a, b, governing またはエラー
+
+        Raises:
+            ValueError: 支持条件が対象外、または積層構成から許容応力が求まらない場合
+        """
+        if support not in PANEL_SIZE_SUPPORTS:
+            raise ValueError(f"無効な支持条件: {support}")
+        thickness = GlassLayer.get_equivalent_thickness_batch([list(layers)], InterlayerMaterialTypeEnum.SG)[0]
+        if not thickness > 0:
+            raise ValueError("板厚が指定されていません")
+        allowable = GlassAllowableUnitStress.get_allowable_stress_batch(glass_type, np.array([min(layers[0], layers[-1])]))
+        if allowable["error"][0] is not None:
+            raise ValueError(allowable["error"][0])
+        allowable_stress = float(allowable["shortTerm"][0])
+
+        ratio = np.asarray(ratio, dtype=np.float64)
+        thickness = np.full(ratio.shape, thickness)
+        limit = np.nan if deflection_limit is None else deflection_limit
+
+        def limit_size(edge_ratio):
+            # a=1 の応力・変位から、許容応力・変位の制限値に達するaを求める
+            unit = CalculateStress.calculate_edges(support, {"a": 1.0, "b": edge_ratio}, thickness, w, E)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                a_stress = np.sqrt(allowable_stress / unit["sigma"])
+                a_deflection = (limit / unit["delta"]) ** 0.25
+            return np.fmin(a_stress, a_deflection), a_deflection < a_stress, unit["error"]
+
+        def passes(a):
+            result = CalculateStress.calculate_edges(support, {"a": a, "b": ratio * a}, thickness, w, E)
+            passed = result["sigma"] <= allowable_stress * (1 + TOLERANCE)
+            if deflection_limit is not None:
+                passed &= result["delta"] <= deflection_limit * (1 + TOLERANCE)
+            return passed
+
+        # 区間の上端（辺長比そのもの）と、丸め誤差で入りうる次の区間の係数で求めたa
+        a_lower, deflection_lower, error = limit_size(ratio)
+        a_upper, deflection_upper, _ = limit_size(np.nextafter(ratio, np.inf))
+        lower_passes = passes(np.where(np.isnan(a_lower), 1.0, a_lower))
+        upper_passes = passes(np.where(np.isnan(a_upper), 1.0, a_upper))
+        use_lower = lower_passes & ~(upper_passes & (a_upper > a_lower))
+        a = np.where(use_lower, a_lower, a_upper)
+        governs_deflection = np.where(use_lower, deflection_lower, deflection_upper)
+
+        results = []
+        for i in range(len(ratio)):
+            if error[i] is not None:
+                results.append({"ratio": float(ratio[i]), "error": error[i]})
+            elif not (lower_passes[i] or upper_passes[i]):
+                results.append({"ratio": float(ratio[i]), "error": "条件を満たす寸法が求まりません"})
+            else:
+                results.append({
+                    "ratio": float(ratio[i]),
+                    "a": float(a[i]),
+                    "b": float(ratio[i] * a[i]),
+                    "governing": "deflection" if governs_deflection[i] else "short_term",
+                })
+        return {"allowable_stress": allowable_stress, "results": results}
@@ -0,0 +1,346 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from statistics import NormalDist
+from types import MappingProxyType
+from typing import Iterator, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.services.glass_calculator.allowable_stress import GlassAllowableUnitStress
+from app.services.glass_calculator.contracts.enums import (
+    GlassTypeEnum,
+    InterlayerMaterialTypeEnum,
+    LookupModeEnum,
+    SolverEnum,
+    SupportTypeEnum,
+)
+from app.services.glass_calculator.glass_calculator import CalculateStress
+from app.services.glass_calculator.laminate import effective_thickness_matrix, shear_modulus
+
+# 1チャンクの標本数の上限（1チャンクの配列は1列あたり8MB程度）
+CHUNK_SIZE = 1_000_000
+
+# 板厚の許容差 [mm]（呼び厚さの上限と許容差の組。EN 572-2 / JIS R 3202 相当）
+THICKNESS_TOLERANCES: Tuple[Tuple[float, float], ...] = (
+    (6.0, 0.2),
+    (12.0, 0.3),
+    (15.0, 0.5),
+    (math.inf, 1.0),
+)
+
+# ガラスの種類ごとの表面強度のWeibull係数（形状母数）の代表値
+WEIBULL_SHAPES: Mapping[GlassTypeEnum, float] = MappingProxyType({
+    GlassTypeEnum.FLOAT: 7.0,
+    GlassTypeEnum.WIRED: 6.0,
+    GlassTypeEnum.WIRE_PATTERNED: 6.0,
+    GlassTypeEnum.TEMPERED: 25.0,
+    GlassTypeEnum.DOUBLE: 12.0,
+})
+
+# 許容応力の表の破壊強度（面内）を、表面強度の分布のこの非超過確率の値（特性値）として尺度母数を求める
+STRENGTH_FRACTILE = 0.05
+
+# 応力の分布（対数目盛のヒストグラム）の範囲 [N/mm²] と区間の数（区間の幅は約0.34%）
+HISTOGRAM_RANGE = (1e-2, 1e4)
+HISTOGRAM_BINS = 4096
+
+
+def thickness_tolerance(nominal: float) -> float:
+    """
+    呼び厚さに対する板厚の許容差（±）[mm]
+    """
+    for upper, tolerance in THICKNESS_TOLERANCES:
+        if nominal <= upper:
+            return tolerance
+    return THICKNESS_TOLERANCES[-1][1]
+
+
+@dataclass(frozen=True)
+class MonteCarloModel:
+    """
+    1枚のパネルの破損確率の標本を作るための条件（プロセス間で受け渡すため、値のみを持つ）
+    """
+    support: SupportTypeEnum # 支持条件
+    geometry: Tuple[Tuple[str, float], ...] # 形状の列（geometry_columns）の値
+    layers: Tuple[float, ...] # 呼び厚さ [mm]
+    tolerances: Tuple[float, ...] # 板厚の許容差（±、標準偏差の2倍とする）[mm]
+    shear_modulus: float # 中間膜のせん断弾性係数（SG・単板はinf）[N/mm²]
+    interlayer_thickness: float # 中間膜1層の厚さ [mm]
+    span: float # せん断結合を計算するスパン [mm]
+    E: float # ヤング係数 [N/mm²]
+    lookup_mode: LookupModeEnum # 係数の求め方
+    unit_stress: Optional[float] # FEMの場合の単位荷重・呼び厚さ（応力用の有効板厚）あたりの応力（係数表の場合はNone）
+    nominal_stress_thickness: float # 呼び厚さの応力用の有効板厚 [mm]
+    wind_location: float # 風圧のGumbel分布の位置母数 [N/mm²]
+    wind_scale: float # 風圧のGumbel分布の尺度母数 [N/mm²]
+    weibull_shape: float # 表面強度のWeibull分布の形状母数
+    weibull_scale: float # 表面強度のWeibull分布の尺度母数 [N/mm²]
+
+    def stress_thickness(self, h: np.ndarray) -> np.ndarray:
+        # 標本ごとの応力用の有効板厚（SG・単板は合計板厚）
+        if math.isinf(self.shear_modulus) or h.shape[1] == 1:
+            return h.sum(axis=1)
+        return effective_thickness_matrix(
+            h, h.shape[1], self.shear_modulus, self.interlayer_thickness, self.span, self.E
+        )["stress"]
+
+    def stress(self, thickness: np.ndarray, w: np.ndarray) -> np.ndarray:
+        # 標本ごとの最大応力（係数表は既存の一括計算、FEMは応力が w/t² に比例することを使う）
+        if self.unit_stress is not None:
+            return self.unit_stress * w * (self.nominal_stress_thickness / thickness) ** 2
+        columns = {name: np.broadcast_to(value, thickness.shape) for name, value in self.geometry}
+        columns["w"] = w
+        columns["E"] = np.broadcast_to(self.E, thickness.shape)
+        return CalculateStress.calculate_columns(self.support, columns, thickness, self.lookup_mode)["sigma"]
+
+
+def simulate_chunk(model: MonteCarloModel, size: int, seed: np.random.SeedSequence) -> dict:
+    """
+    1チャンク分の標本（板厚、風圧、表面強度）を作り、応力のヒストグラムと破損した標本の数を返す
+
+    Args:
+        model: パネルの条件
+        size: 標本数
+        seed: このチャンクの乱数の種（チャンクごとに独立。ワーカー数によらず同じ結果になる）
+
+    Returns:
+        dict: samples, failures, stress_sum, histogram（HISTOGRAM_BINS + 2 区間の度数。先頭・末尾は範囲外）
+    """
+    rng = np.random.default_rng(seed)
+    layers = np.array(model.layers)
+    tolerances = np.array(model.tolerances)
+    # 板厚は呼び厚さを平均、許容差を2σとする正規分布（許容差の範囲で打ち切る）
+    h = np.clip(rng.normal(layers, tolerances / 2, size=(size, len(layers))), layers - tolerances, layers + tolerances)
+    # 風圧はGumbel分布（負の値は0とする）、表面強度は2母数Weibull分布
+    w = np.maximum(rng.gumbel(model.wind_location, model.wind_scale, size), 0.0)
+    strength = model.weibull_scale * rng.weibull(model.weibull_shape, size)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sigma = model.stress(model.stress_thickness(h), w)
+    return {
+        "samples": size,
+        "failures": int(np.count_nonzero(sigma >= strength)),
+        "stress_sum": float(sigma.sum()),
+        "histogram": StressHistogram.count(sigma),
+    }
+
+
+class StressHistogram:
+    """
+    応力の分布を対数目盛のヒストグラムで集計するクラス
+    チャンクごとの度数を足し合わせられるため、全標本を保持せずにパーセンタイルを推定できます。
+    """
+
+    log_lower = math.log(HISTOGRAM_RANGE[0])
+    log_width = (math.log(HISTOGRAM_RANGE[1]) - math.log(HISTOGRAM_RANGE[0])) / HISTOGRAM_BINS
+    edges = np.exp(log_lower + log_width * np.arange(HISTOGRAM_BINS + 1))
+
+    @classmethod
+    def count(cls, sigma: np.ndarray) -> np.ndarray:
+        """
+        応力の配列の度数（先頭は範囲の下限未満、末尾は上限以上）
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            position = np.floor((np.log(sigma) - cls.log_lower) / cls.log_width)
+        index = np.clip(np.nan_to_num(position, nan=-1.0, neginf=-1.0), -1, HISTOGRAM_BINS).astype(np.intp) + 1
+        return np.bincount(index, minlength=HISTOGRAM_BINS + 2)
+
+    @classmethod
+    def quantile(cls, histogram: np.ndarray, rank: float) -> float:
+        """
+        小さい方から rank 番目（0〜標本数）の値を、区間内を対数で線形補間して求める
+        """
+        cumulative = np.cumsum(histogram)
+        index = int(np.searchsorted(cumulative, rank, side="left"))
+        if index == 0:
+            return float(cls.edges[0])
+        if index > HISTOGRAM_BINS:
+            return float(cls.edges[-1])
+        before = cumulative[index - 1]
+        fraction = (rank - before) / histogram[index] if histogram[index] else 0.0
+        return float(cls.edges[index - 1] * (cls.edges[index] / cls.edges[index - 1]) ** fraction)
+
+
+class BreakageProbability:
+    """
+    モンテカルロ法によるガラスの破損確率の計算クラス
+    板厚（許容差）、風圧（Gumbel分布）、表面強度（Weibull分布）の標本から既存の一括計算で応力を求め、
+    応力が表面強度以上となる割合（破損確率）と応力のパーセンタイルを、信頼区間とともにチャンクごとに返します。
+    """
+
+    @staticmethod
+    def build_model(data) -> MonteCarloModel:
+        """
+        入力（BreakageProbabilityInputScheme）から標本を作るための条件を求める
+
+        Raises:
+            ValueError: 呼び厚さで計算できない場合、大たわみ解析を指定した場合
+        """
+        panel = data.panel
+        support = SupportTypeEnum(panel.support)
+        if panel.solver == SolverEnum.NONLINEAR:
+            raise ValueError("大たわみ解析（nonlinear）は破損確率の計算に対応していません")
+        if not panel.t:
+            raise ValueError("板厚が指定されていません")
+
+        # 呼び厚さで計算し、係数表で計算できない場合（fem, auto）は単位荷重あたりのFEMの応力を使う
+        nominal = CalculateStress.calculate_batch_rows([panel])[0]
+        if nominal.get("error") is not None:
+            raise ValueError(nominal["error"])
+        layer = CalculateStress._glass_layer(support, panel)
+        unit_stress = None
+        if nominal["solver"] == SolverEnum.FEM.value:
+            unit_stress = CalculateStress._fem_calculator(support, panel).calculate_stress() / panel.w
+
+        geometry = tuple((name, float(getattr(panel, name))) for name in CalculateStress.geometry_columns[support])
+        G = math.inf
+        if panel.interlayer != InterlayerMaterialTypeEnum.SG:
+            G = shear_modulus(panel.interlayer, panel.load_duration, float(panel.temperature))
+
+        # 風圧のGumbel分布（平均 w × wind_mean_ratio、変動係数 wind_cov）
+        mean = panel.w * data.wind_mean_ratio
+        wind_scale = data.wind_cov * mean * math.sqrt(6) / math.pi
+        # 表面強度のWeibull分布（尺度母数は表の破壊強度を STRENGTH_FRACTILE の値とする）
+        weibull_shape = data.weibull_shape or WEIBULL_SHAPES[panel.glass_type]
+        weibull_scale = data.weibull_scale
+        if weibull_scale is None:
+            strength = GlassAllowableUnitStress(layer, panel.glass_type).allowable_stress.fracturesStrength.inplane
+            weibull_scale = strength / (-math.log(1 - STRENGTH_FRACTILE)) ** (1 / weibull_shape)
+
+        return MonteCarloModel(
+            support=support,
+            geometry=geometry,
+            layers=tuple(float(t) for t in panel.t),
+            tolerances=tuple(
+                thickness_tolerance(t) if data.thickness_tolerance is None else data.thickness_tolerance
+                for t in panel.t
+            ),
+            shear_modulus=G,
+            interlayer_thickness=float(panel.interlayer_thickness),
+            span=float(CalculateStress.laminate_span(support, dict(geometry))),
+            E=float(panel.E),
+            lookup_mode=getattr(panel, "lookup_mode", LookupModeEnum.STEP),
+            unit_stress=unit_stress,
+            nominal_stress_thickness=layer.get_stress_thickness(),
+            wind_location=mean - np.euler_gamma * wind_scale,
+            wind_scale=wind_scale,
+            weibull_shape=float(weibull_shape),
+            weibull_scale=float(weibull_scale),
+        )
+
+    @staticmethod
+    def iter_estimates(data) -> Iterator[dict]:
+        """
+        チャンクごとに、それまでの標本による推定値を返す
+
+        chunk_size ごとに独立な乱数の種（SeedSequence.spawn）を割り当てるため、同じ seed であれば
+        ワーカー数によらず同じ結果になります。workers が2以上の場合はチャンクをプロセスプールで計算し、
+        入力順に集計します。Lambda（/dev/shm が無くプロセスプールを作れない）では workers は1に制限し、
+        その他の環境でもプロセスプールを作れない場合は同じプロセスで計算します。
+
+        Args:
+            data: BreakageProbabilityInputScheme
+
+        Returns:
+            Iterator[dict]: 累積の推定値（最後の要素は done=True）。条件のエラーの場合は error のみの1要素
+        """
+        try:
+            model = BreakageProbability.build_model(data)
+        except ValueError as e:
+            yield {"error": str(e)}
+            return
+
+        sequence = np.random.SeedSequence(data.seed)
+        # 結果に返す種（seed が整数またはNoneのため、entropy は整数）
+        entropy = sequence.entropy
+        seed: int = entropy if isinstance(entropy, int) else 0
+        sizes = [min(data.chunk_size, data.samples - start) for start in range(0, data.samples, data.chunk_size)]
+        seeds = sequence.spawn(len(sizes))
+        histogram = np.zeros(HISTOGRAM_BINS + 2, dtype=np.int64)
+        samples = failures = 0
+        stress_sum = 0.0
+
+        workers = 1 if os.getenv("AWS_LAMBDA_FUNCTION_NAME") else min(data.workers, len(sizes))
+        executor = None
+        if workers > 1:
+            # 共有メモリ（セマフォ）を使えない環境ではプロセスプールを作れないため、同じプロセスで計算する
+            try:
+                executor = ProcessPoolExecutor(max_workers=workers)
+                chunks = executor.map(simulate_chunk, [model] * len(sizes), sizes, seeds)
+            except (OSError, NotImplementedError):
+                if executor is not None:
+                    executor.shutdown(cancel_futures=True)
+                executor = None
+        if executor is None:
+            chunks = map(simulate_chunk, [model] * len(sizes), sizes, seeds)
+        try:
+            for chunk in chunks:
+                samples += chunk["samples"]
+                failures += chunk["failures"]
+                stress_sum += chunk["stress_sum"]
+                histogram += chunk["histogram"]
+                yield BreakageProbability.estimate(
+                    samples, failures, stress_sum, histogram, data.percentiles, data.confidence,
+                    model, seed, samples == data.samples,
+                )
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+    @staticmethod
+    def calculate(data) -> dict:
+        """
+        全標本の推定値を返す
+        """
+        result: dict = {}
+        for result in BreakageProbability.iter_estimates(data):
+            pass
+        return result
+
+    @staticmethod
+    def estimate(
+        samples: int,
+        failures: int,
+        stress_sum: float,
+        histogram: np.ndarray,
+        percentiles: Sequence[float],
+        confidence: float,
+        model: MonteCarloModel,
+        seed: int,
+        done: bool,
+    ) -> dict:
+        """
+        集計値から破損確率（Wilsonの信頼区間）と応力のパーセンタイル（順序統計量の信頼区間）を求める
+        """
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        p = failures / samples
+        denominator = 1 + z ** 2 / samples
+        center = (p + z ** 2 / (2 * samples)) / denominator
+        half = z * math.sqrt(p * (1 - p) / samples + z ** 2 / (4 * samples ** 2)) / denominator
+
+        stress_percentiles = []
+        for percentile in percentiles:
+            q = percentile / 100
+            rank = q * samples
+            spread = z * math.sqrt(samples * q * (1 - q))
+            stress_percentiles.append({
+                "percentile": percentile,
+                "value": round(StressHistogram.quantile(histogram, rank), 2),
+                "lower": round(StressHistogram.quantile(histogram, max(rank - spread, 0.0)), 2),
+                "upper": round(StressHistogram.quantile(histogram, min(rank + spread, samples)), 2),
+            })
+        return {
+            "samples": samples,
+            "failures": failures,
+            "failure_probability": p,
+            "failure_probability_lower": max(center - half, 0.0),
+            "failure_probability_upper": min(center + half, 1.0),
+            "mean_stress": round(stress_sum / samples, 2),
+            "stress_percentiles": stress_percentiles,
+            "weibull_shape": model.weibull_shape,
+            "weibull_scale": round(model.weibull_scale, 2),
+            "seed": seed,
+            "done": done,
+        }
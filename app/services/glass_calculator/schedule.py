@@ -0,0 +1,261 @@
+import csv
+import io
+import re
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from app.services.glass_calculator.contracts.enums import GlassTypeEnum, SupportTypeEnum
+from app.services.glass_calculator.glass_calculator import CalculateStress
+
+# 計算に使う列と、見つからない場合に代わりに使う列
+SCHEDULE_COLUMNS = {
+    SupportTypeEnum.FOUR_UNIFORM: {"a": ("a",), "b": ("b",)},
+    SupportTypeEnum.FOUR_PARTIAL: {"a": ("a",), "b": ("b",), "a1": ("a1",), "b1": ("b1",)},
+    SupportTypeEnum.THREE_UNIFORM: {"free": ("free", "a"), "fix": ("fix", "b")},
+    SupportTypeEnum.TWO_UNIFORM: {"free": ("free", "a"), "fix": ("fix", "b")},
+    SupportTypeEnum.CIRCULAR_UNIFORM: {"D": ("D", "a")},
+}
+
+# 板厚の列（t1, t2, ...）
+LAYER_COLUMN_PATTERN = re.compile(r"^t(\d+)$")
+
+# 計算結果として追加する列
+RESULT_COLUMNS = ("sigma", "delta", "utilization_short_term", "utilization_long_term", "error")
+
+
+class GlassSchedule:
+    """
+    BIMから出力されたガラス一覧表（CSV, Parquet）の計算クラス
+    1行ずつ入力モデルを生成せず、列ごとの配列のまま計算します。
+    """
+
+    @staticmethod
+    def calculate_csv(content: bytes) -> bytes:
+        """
+        CSVの一覧表を計算し、計算結果の列を追加したCSVを返す
+
+        Args:
+            content: CSVファイルの内容（UTF-8、1行目はヘッダー）
+
+        Returns:
+            bytes: sigma, delta, utilization_short_term, utilization_long_term, error 列を追加したCSV
+        """
+        rows = list(csv.reader(io.StringIO(content.decode("utf-8-sig"))))
+        if not rows:
+            raise ValueError("CSVが空です")
+        header, records = rows[0], rows[1:]
+        records = [record + [""] * (len(header) - len(record)) for record in records]
+        columns = {name: list(values) for name, values in zip(header, zip(*records))} if records else {name: [] for name in header}
+
+        results = GlassSchedule.calculate_columns(columns, len(records))
+
+        output = io.StringIO()
+        writer = csv.writer(output, lineterminator="\n")
+        writer.writerow(header + list(RESULT_COLUMNS))
+        formatted = [GlassSchedule._format(results[name], name) for name in RESULT_COLUMNS]
+        for record, *values in zip(records, *formatted):
+            writer.writerow(record[: len(header)] + values)
+        return output.getvalue().encode("utf-8")
+
+    @staticmethod
+    def calculate_parquet(content: bytes) -> bytes:
+        """
+        Parquetの一覧表を計算し、計算結果の列を追加したParquetを返す
+
+        Args:
+            content: Parquetファイルの内容
+
+        Returns:
+            bytes: sigma, delta, utilization_short_term, utilization_long_term, error 列を追加したParquet
+
+        Raises:
+            ValueError: pyarrowがインストールされていない場合
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ValueError("Parquetの読み込みにはpyarrowが必要です")
+
+        table = pq.read_table(pa.BufferReader(content))
+        columns = {name: table.column(name).to_numpy(zero_copy_only=False) for name in table.column_names}
+
+        results = GlassSchedule.calculate_columns(columns, table.num_rows)
+
+        for name in RESULT_COLUMNS:
+            if name in table.column_names:
+                table = table.drop_columns([name])
+            values = results[name]
+            if name == "error":
+                table = table.append_column(name, pa.array(values.tolist(), type=pa.string()))
+            else:
+                table = table.append_column(name, pa.array(values, mask=np.isnan(values)))
+        output = pa.BufferOutputStream()
+        pq.write_table(table, output)
+        return output.getvalue().to_pybytes()
+
+    @staticmethod
+    def calculate_columns(columns: Dict[str, np.ndarray], row_count: int) -> Dict[str, np.ndarray]:
+        """
+        列ごとの配列から応力・変位・検定比を計算する
+
+        Args:
+            columns: 列名をキーとする値の配列（文字列または数値）
+            row_count: 行数
+
+        Returns:
+            Dict[str, np.ndarray]: sigma, delta, utilization_short_term, utilization_long_term（エラー行はnan）と error の配列
+        """
+        sigma = np.full(row_count, np.nan)
+        delta = np.full(row_count, np.nan)
+        error = np.full(row_count, None, dtype=object)
+
+        thickness, outer_thickness, layer_error = GlassSchedule._layer_columns(columns, row_count)
+        error[layer_error] = "板厚が指定されていません"
+
+        support = GlassSchedule._text_column(columns, "support", SupportTypeEnum.FOUR_UNIFORM.value, row_count)
+        glass_type = GlassSchedule._text_column(columns, "glass_type", GlassTypeEnum.FLOAT.value, row_count)
+        w, w_error = GlassSchedule._float_column(columns, "w", None, row_count)
+        E, E_error = GlassSchedule._float_column(columns, "E", 71600.0, row_count)
+        error[np.equal(error, None) & E_error] = "E: 正の数値を入力してください"
+        error[np.equal(error, None) & w_error] = "w: 正の数値を入力してください"
+
+        known_supports = {item.value for item in SupportTypeEnum}
+        for value in np.unique(support):
+            rows = support == value
+            if value not in known_supports:
+                error[rows & np.equal(error, None)] = f"無効な支持条件: {value}"
+                continue
+            support_type = SupportTypeEnum(value)
+
+            group = {"w": w[rows], "E": E[rows]}
+            group_error = error[rows]
+            for name, candidates in SCHEDULE_COLUMNS[support_type].items():
+                source = next((candidate for candidate in candidates if candidate in columns), candidates[0])
+                values, invalid = GlassSchedule._float_column(columns, source, None, row_count)
+                group[name] = values[rows]
+                group_error[np.equal(group_error, None) & invalid[rows]] = f"{source}: 正の数値を入力してください"
+
+            result = CalculateStress.calculate_columns(support_type, group, thickness[rows])
+            group_error[np.equal(group_error, None)] = result["error"][np.equal(group_error, None)]
+            valid = np.equal(group_error, None)
+            sigma[rows] = np.where(valid, result["sigma"], np.nan)
+            delta[rows] = np.where(valid, result["delta"], np.nan)
+            error[rows] = group_error
+
+        allowable = GlassSchedule._allowable_stress(glass_type, outer_thickness)
+        # 許容応力が求まらない行は応力・変位を残したままエラーを記録する
+        no_allowable = np.equal(error, None) & np.not_equal(allowable["error"], None)
+        error[no_allowable] = allowable["error"][no_allowable]
+        return {
+            "sigma": sigma,
+            "delta": delta,
+            "utilization_short_term": sigma / allowable["shortTerm"],
+            "utilization_long_term": sigma / allowable["longTerm"],
+            "error": error,
+        }
+
+    @staticmethod
+    def _layer_columns(columns: Dict[str, np.ndarray], row_count: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """t1, t2, ... 列から等価板厚、外側の板厚の小さい方、板厚不正の行を求める"""
+        names = sorted(
+            (name for name in columns if LAYER_COLUMN_PATTERN.match(name)),
+            key=lambda name: int(LAYER_COLUMN_PATTERN.match(name).group(1)),  # type: ignore
+        )
+        total = np.zeros(row_count)
+        first = np.full(row_count, np.nan)
+        last = np.full(row_count, np.nan)
+        invalid = np.zeros(row_count, dtype=bool)
+        for name in names:
+            values, value_error = GlassSchedule._float_column(columns, name, np.nan, row_count)
+            present = ~np.isnan(values)
+            invalid |= value_error
+            # 1枚ずつの計算（sum）と同じく先頭の層から順に足し合わせる
+            total = np.where(present, total + values, total)
+            first = np.where(np.isnan(first), values, first)
+            last = np.where(present, values, last)
+
+        # 中間膜はSGとして扱う（GlassLayer.get_equivalent_thicknessと同じく合計板厚）
+        invalid |= ~(total > 0)
+        return total, np.fmin(first, last), invalid
+
+    @staticmethod
+    def _float_column(
+        columns: Dict[str, np.ndarray], name: str, default, row_count: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        数値列を取り出す
+
+        Args:
+            columns: 列名をキーとする値の配列
+            name: 列名
+            default: 空欄の既定値（Noneの場合は必須、nanの場合は空欄のまま）
+            row_count: 行数
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: 値の配列と不正な行（必須の空欄、数値でない、正でない）
+        """
+        if name in columns:
+            values, unparsable = _parse_float_column(columns[name])
+        else:
+            values, unparsable = np.full(row_count, np.nan), np.zeros(row_count, dtype=bool)
+        blank = np.isnan(values) & ~unparsable
+        if default is not None:
+            values = np.where(blank, default, values)
+        invalid = unparsable | (blank & (default is None)) | (~np.isnan(values) & ~(values > 0))
+        return values, invalid
+
+    @staticmethod
+    def _text_column(columns: Dict[str, np.ndarray], name: str, default: str, row_count: int) -> np.ndarray:
+        """文字列列を取り出す（空欄は既定値）"""
+        if name not in columns:
+            return np.full(row_count, default, dtype=object)
+        values = np.array(["" if value is None else str(value).strip() for value in columns[name]], dtype=object)
+        values[values == ""] = default
+        return values
+
+    @staticmethod
+    def _allowable_stress(glass_type: np.ndarray, outer_thickness: np.ndarray) -> Dict[str, np.ndarray]:
+        """ガラスの種類（文字列）ごとに外側の板厚から短期・長期許容応力（面内）を求める"""
+        glass_types = np.array(glass_type, dtype=object)
+        known_types = {item.value for item in GlassTypeEnum}
+        unknown = {}
+        for value in np.unique(glass_type):
+            rows = glass_type == value
+            if value in known_types:
+                glass_types[rows] = GlassTypeEnum(value)
+            else:
+                unknown[value] = rows
+        allowable = CalculateStress._allowable_stress_by_type(glass_types, outer_thickness)
+        for value, rows in unknown.items():
+            allowable["error"][rows] = f"無効なガラスタイプ: {value}"
+        return allowable
+
+    @staticmethod
+    def _format(values: np.ndarray, name: str) -> List[str]:
+        """CSVに書き出す文字列に変換（計算できなかった行は空欄）"""
+        if name == "error":
+            return ["" if value is None else value for value in values]
+        digits = 3 if name.startswith("utilization") else 2
+        return ["" if np.isnan(value) else str(round(float(value), digits)) for value in values]
+
+
+def _parse_float_column(column) -> Tuple[np.ndarray, np.ndarray]:
+    """列を数値に変換し、値（空欄はnan）と数値として読めなかった位置を返す"""
+    try:
+        return np.asarray(column, dtype=np.float64), np.zeros(len(column), dtype=bool)
+    except (TypeError, ValueError):
+        pass
+
+    # 空欄や文字の混ざった列だけ1値ずつ変換する
+    values = np.full(len(column), np.nan)
+    unparsable = np.zeros(len(column), dtype=bool)
+    for i, value in enumerate(column):
+        if value is None or (isinstance(value, str) and not value.strip()):
+            continue
+        try:
+            values[i] = float(value)
+        except (TypeError, ValueError):
+            unparsable[i] = True
+    return values, unparsable
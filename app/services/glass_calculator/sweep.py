@@ -0,0 +1,110 @@
+from typing import List
+
+import numpy as np
+
+from app.services.glass_calculator.allowable_stress import GlassAllowableUnitStress
+from app.services.glass_calculator.contracts.enums import GlassTypeEnum, InterlayerMaterialTypeEnum, SupportTypeEnum
+from app.services.glass_calculator.fourside.uniform import FourSideUniformLoadGlass
+from app.services.glass_calculator.glass_layer import GlassLayer
+from app.services.glass_calculator.threeside.uniform import ThreeSideUniformLoadGlass
+
+# 1軸あたりの値の数の上限
+MAX_AXIS_LENGTH = 10000
+
+
+class ParametricSweep:
+    """
+    パラメータスイープの計算クラス
+    a, b, 積層構成, w の直積（グリッド）の応力・変位を計算します。
+    グリッドはC順（a, b, t, w の順に外側から）に並べ、offsetからlimit件ずつ計算するため、
+    グリッドが大きい場合も1回に確保する配列は limit 件分です。
+    """
+
+    @staticmethod
+    def expand_axis(axis) -> np.ndarray:
+        """
+        軸の値を配列にする
+
+        Args:
+            axis: 値のリスト、または start, stop, step 属性を持つ範囲（stopを含む）
+
+        Returns:
+            np.ndarray: 軸の値
+
+        Raises:
+            ValueError: 軸の値の数が上限を超える場合
+        """
+        if isinstance(axis, (list, tuple, np.ndarray)):
+            count = len(axis)
+        else:
+            count = max(int(np.floor((axis.stop - axis.start) / axis.step + 1e-9)) + 1, 0)
+        if count > MAX_AXIS_LENGTH:
+            raise ValueError(f"軸の値の数が{MAX_AXIS_LENGTH}を超えています")
+
+        if isinstance(axis, (list, tuple, np.ndarray)):
+            return np.asarray(axis, dtype=np.float64)
+        return axis.start + axis.step * np.arange(count)
+
+    @staticmethod
+    def calculate(
+        support: SupportTypeEnum,
+        a: np.ndarray,
+        b: np.ndarray,
+        layers: List[List[float]],
+        w: np.ndarray,
+        E: float,
+        offset: int,
+        limit: int,
+        glass_type: GlassTypeEnum = GlassTypeEnum.FLOAT,
+    ) -> dict:
+        """
+        グリッドのうち offset から limit 件を計算する
+
+        Args:
+            support: 支持条件（四辺支持または三辺支持）
+            a: 短辺（三辺支持はフリー辺）の値 [mm]
+            b: 長辺（三辺支持は固定辺）の値 [mm]
+            layers: 積層構成のリスト
+            w: 荷重の値 [N/mm2]
+            E: ヤング係数 [N/mm2]
+            offset: 計算を始める位置（C順の通し番号。グリッドの件数以上の場合は空の結果を返す）
+            limit: 計算する件数
+            glass_type: ガラスの種類（検定比の許容応力に使用）
+
+        Returns:
+            dict: グリッドの形状と軸、計算した範囲の sigma, delta, utilization_short_term, utilization_long_term
+                （係数テーブル・許容応力の範囲外はnan）と係数テーブルの版
+        """
+        thickness = GlassLayer.get_equivalent_thickness_batch(layers, InterlayerMaterialTypeEnum.SG)
+        # 許容応力は積層構成ごとに外側の板厚（小さい方）から1回だけ求める
+        outer_thickness = np.array([min(layup[0], layup[-1]) if layup else np.nan for layup in layers])
+        allowable = GlassAllowableUnitStress.get_allowable_stress_batch(glass_type, outer_thickness)
+        shape = (len(a), len(b), len(layers), len(w))
+        total = int(np.prod(shape))
+        # offset がグリッドの末尾以降の場合は空の範囲とする
+        start = min(offset, total)
+        stop = min(start + limit, total)
+
+        # 計算範囲の通し番号を各軸の添字に戻し、軸の値を並べて一括計算する
+        index_a, index_b, index_t, index_w = np.unravel_index(np.arange(start, stop), shape)
+        if support == SupportTypeEnum.FOUR_UNIFORM:
+            calculator = FourSideUniformLoadGlass
+        elif support == SupportTypeEnum.THREE_UNIFORM:
+            calculator = ThreeSideUniformLoadGlass
+        else:
+            raise ValueError(f"無効な支持条件: {support}")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = calculator.calculate_batch(
+                a[index_a], b[index_b], thickness[index_t], w[index_w], np.full(stop - start, E)
+            )
+
+        return {
+            "shape": list(shape),
+            "offset": offset,
+            "next_offset": stop if stop < total else None,
+            "sigma": result["sigma"],
+            "delta": result["delta"],
+            "utilization_short_term": result["sigma"] / allowable["shortTerm"][index_t],
+            "utilization_long_term": result["sigma"] / allowable["longTerm"][index_t],
+            "coefficient_version": calculator.coefficient_table.version_key,
+        }
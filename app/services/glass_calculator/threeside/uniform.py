@@ -1,7 +1,12 @@
 from typing import Dict
 
+import numpy as np
+
+from app.services.glass_calculator.coefficient_tables import get_coefficient_table
+from app.services.glass_calculator.contracts.enums import LookupModeEnum, SupportTypeEnum
 from app.services.glass_calculator.glass_material import GlassMaterial
 from app.services.glass_calculator.glass_layer import GlassLayer
+from app.services.glass_calculator.panel_batch import PanelBatch
 from app.services.glass_calculator.contracts.interfaces import  IPlate
 from app.services.binary_search import binary_search
 from app.services.binary_search.binary_search import BisectTypeEnum
@@ -14,7 +19,10 @@ class ThreeSideUniformLoadGlass(IPlate):
     範囲外の入力値に対しては、例外をraiseします。
     """
     
-    def __init__(self, free_edge: float, fixed_edge: float, layer: GlassLayer, w: float, material:GlassMaterial):
+    # 係数テーブル（固定辺/フリー辺 ごとの alpha, beta）
+    coefficient_table = get_coefficient_table(SupportTypeEnum.THREE_UNIFORM)
+
+    def __init__(self, free_edge: float, fixed_edge: float, layer: GlassLayer, w: float, material:GlassMaterial, lookup_mode: LookupModeEnum = LookupModeEnum.STEP):
         """
         コンストラクタ
         
@@ -24,6 +32,7 @@ class ThreeSideUniformLoadGlass(IPlate):
             layer: ガラスレイヤークラス
             w: 荷重 [N/mm2]
             material: マテリアル
+            lookup_mode: 係数の求め方（step: 表の行の値、linear: 線形補間）
             
         Raises:
             ValueError: 固定辺/フリー < 0.1の場合
@@ -35,6 +44,7 @@ class ThreeSideUniformLoadGlass(IPlate):
         self.layer = layer
         self.w = w
         self.material = material
+        self.lookup_mode = lookup_mode
         
         coeff = self._calculate_coeff()
         self.alpha = coeff["alpha"]
@@ -65,15 +75,14 @@ class ThreeSideUniformLoadGlass(IPlate):
         Raises:
             ValueError: 係数テーブルの適用範囲外の場合
         """
-        coeff = {
-            "bByA": [0.1, 0.3, 0.5, 0.7, 1.0, 1.2, 1.5, 2, 3, float('inf')],
-            "beta": [0.071, 0.195, 0.350, 0.511, 0.661, 0.715, 0.758, 0.783, 0.791, 0.791],
-            "alpha": [0.005, 0.036, 0.076, 0.108, 0.139, 0.150, 0.158, 0.164, 0.165, 0.165],
-        }
-        
-        index = binary_search.binary_search(coeff["bByA"], self.edge_length_ratio, BisectTypeEnum.LEFT)
-        alpha = coeff["alpha"][index]
-        beta = coeff["beta"][index]
+        coeff = self.coefficient_table
+        if self.lookup_mode == LookupModeEnum.LINEAR:
+            alpha = float(coeff.interpolate("b_by_a", "alpha", self.edge_length_ratio))
+            beta = float(coeff.interpolate("b_by_a", "beta", self.edge_length_ratio))
+            return {"alpha": alpha, "beta": beta}
+        index = binary_search.binary_search(coeff.axes["b_by_a"], self.edge_length_ratio, BisectTypeEnum.LEFT)
+        alpha = float(coeff.values["alpha"][index])
+        beta = float(coeff.values["beta"][index])
         return {"alpha": alpha, "beta": beta}
     
     def calculate_stress(self) -> float:
@@ -83,8 +92,7 @@ class ThreeSideUniformLoadGlass(IPlate):
         Returns:
             float: 板の応力 [N/mm2]
         """
-        layer = self.layer.get_equivalent_thickness()
-        sigma = (self.beta * (self.w * self.a ** 2)) / layer ** 2
+        sigma = (self.beta * (self.w * self.a ** 2)) / self.layer.get_stress_thickness_squared()
         return sigma
     
     def calculate_displacement(self) -> float:
@@ -95,6 +103,69 @@ class ThreeSideUniformLoadGlass(IPlate):
             float: 板の変位 [mm]
         """
         e = self.material.E
-        layer = self.layer.get_equivalent_thickness()
-        delta = (self.alpha * (self.w * self.a ** 4)) / (layer ** 3 * e)
+        delta = (self.alpha * (self.w * self.a ** 4)) / (self.layer.get_equivalent_thickness_cubed() * e)
         return delta
+
+    @classmethod
+    def calculate_batch(
+        cls,
+        free_edge: np.ndarray,
+        fixed_edge: np.ndarray,
+        thickness: np.ndarray,
+        w: np.ndarray,
+        E: np.ndarray,
+        lookup_mode: LookupModeEnum = LookupModeEnum.STEP,
+    ) -> Dict[str, np.ndarray]:
+        """
+        一括計算
+
+        Args:
+            free_edge: フリー辺の長さの配列 [mm]
+            fixed_edge: 固定辺の長さの配列 [mm]
+            thickness: 等価板厚の配列 [mm]
+            w: 荷重の配列 [N/mm2]
+            E: ヤング係数の配列 [N/mm2]
+            lookup_mode: 係数の求め方（step: 表の行の値、linear: 線形補間）
+
+        Returns:
+            Dict[str, np.ndarray]: sigma, delta（エラー行はnan）と行ごとのエラーメッセージ error
+        """
+        a = np.asarray(free_edge, dtype=np.float64)
+        edge_length_ratio = np.asarray(fixed_edge, dtype=np.float64) / a
+
+        error = np.full(a.shape, None, dtype=object)
+        error[edge_length_ratio < 0.1] = "b/a is smaller than 0.1. use FEM instead"
+        valid = np.equal(error, None)
+
+        coeff = cls.coefficient_table
+        if lookup_mode == LookupModeEnum.LINEAR:
+            alpha = np.where(valid, coeff.interpolate("b_by_a", "alpha", edge_length_ratio), np.nan)
+            beta = np.where(valid, coeff.interpolate("b_by_a", "beta", edge_length_ratio), np.nan)
+        else:
+            index = binary_search.search_many(coeff.axes["b_by_a"], edge_length_ratio, BisectTypeEnum.LEFT)
+            index = np.minimum(index, len(coeff.axes["b_by_a"]) - 1)
+            alpha = np.where(valid, coeff.values["alpha"][index], np.nan)
+            beta = np.where(valid, coeff.values["beta"][index], np.nan)
+
+        sigma = (beta * (w * a ** 2)) / thickness ** 2
+        delta = (alpha * (w * a ** 4)) / (thickness ** 3 * E)
+        return {"sigma": sigma, "delta": delta, "error": error}
+
+    @classmethod
+    def calculate_panels(cls, panels: PanelBatch, thickness: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        三辺支持板の PanelBatch を一括で計算（係数の求め方が混在する場合は求め方ごとに計算）
+
+        Args:
+            panels: 三辺支持板の PanelBatch
+            thickness: 等価板厚の配列 [mm]
+
+        Returns:
+            Dict[str, np.ndarray]: sigma, delta（エラー行はnan）と行ごとのエラーメッセージ error
+        """
+        return panels.calculate_by_lookup_mode(
+            thickness,
+            lambda columns, thickness, lookup_mode: cls.calculate_batch(
+                columns["free"], columns["fix"], thickness, columns["w"], columns["E"], lookup_mode
+            ),
+        )
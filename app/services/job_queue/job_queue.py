@@ -0,0 +1,338 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from pydantic import TypeAdapter
+
+from app.schemas.glass import BatchItemScheme
+from app.services.glass_calculator.glass_calculator import CalculateStress
+
+# ジョブのデータベース（Lambdaでは/tmpのみ書き込み可能）
+DEFAULT_JOB_QUEUE_PATH = "/tmp/glass_jobs.sqlite3"
+
+# 実行中のチャンクを他のワーカーに渡すまでの時間（秒）
+DEFAULT_LEASE_SECONDS = 300
+
+# 1チャンクの計算を試す回数の上限（全て失敗した場合はジョブを失敗とする）
+DEFAULT_MAX_ATTEMPTS = 3
+
+batch_items_adapter = TypeAdapter(List[BatchItemScheme])
+
+
+class JobQueue:
+    """
+    一括計算ジョブのキュー
+    ジョブはチャンクに分割してSQLiteに保存し、チャンク単位で計算・記録します。
+    完了したチャンクは再計算しないため、ワーカーが再起動しても続きから処理できます。
+    計算に失敗したチャンクは max_attempts 回まで再処理し、それでも失敗した場合はジョブを失敗としますが、
+    他のチャンクの計算は続け、完了したチャンクの結果は取得できます。
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_JOB_QUEUE_PATH,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ):
+        """
+        コンストラクタ
+
+        Args:
+            path: SQLiteファイルのパス
+            lease_seconds: 実行中のチャンクを他のワーカーに渡すまでの時間 [s]
+            max_attempts: 1チャンクの計算を試す回数の上限
+        """
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        with self._connect() as connection:
+            connection.executescript(
+                """
+                PRAGMA journal_mode=WAL;
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    total_rows INTEGER NOT NULL,
+                    total_chunks INTEGER NOT NULL,
+                    done_chunks INTEGER NOT NULL DEFAULT 0,
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS chunks (
+                    job_id TEXT NOT NULL,
+                    chunk_index INTEGER NOT NULL,
+                    status TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    result TEXT,
+                    lease_until REAL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    error TEXT,
+                    PRIMARY KEY (job_id, chunk_index)
+                );
+                CREATE INDEX IF NOT EXISTS chunks_status ON chunks (status, lease_until);
+                """
+            )
+            # 再処理の回数・エラーの列が無い以前のデータベースには列を追加する
+            columns = {row["name"] for row in connection.execute("PRAGMA table_info(chunks)")}
+            if "attempts" not in columns:
+                connection.execute("ALTER TABLE chunks ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0")
+            if "error" not in columns:
+                connection.execute("ALTER TABLE chunks ADD COLUMN error TEXT")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # トランザクションはBEGIN/COMMITで明示する（COMMIT前に例外が発生した場合はcloseでロールバック）
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    def submit(self, panels: list, chunk_size: int) -> dict:
+        """
+        ジョブを登録する
+
+        Args:
+            panels: 一括計算の入力（BatchItemScheme）のリスト
+            chunk_size: 1チャンクの行数
+
+        Returns:
+            dict: ジョブの状態
+        """
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        chunks = [panels[start:start + chunk_size] for start in range(0, len(panels), chunk_size)]
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                "INSERT INTO jobs (id, status, total_rows, total_chunks, done_chunks, created_at, updated_at)"
+                " VALUES (?, ?, ?, ?, 0, ?, ?)",
+                (job_id, "done" if not chunks else "queued", len(panels), len(chunks), now, now),
+            )
+            connection.executemany(
+                "INSERT INTO chunks (job_id, chunk_index, status, payload) VALUES (?, ?, 'pending', ?)",
+                (
+                    (job_id, index, json.dumps([panel.model_dump(mode="json") for panel in chunk]))
+                    for index, chunk in enumerate(chunks)
+                ),
+            )
+            connection.execute("COMMIT")
+        return self.get_status(job_id)  # type: ignore
+
+    def get_status(self, job_id: str) -> Optional[dict]:
+        """
+        ジョブの状態を返す
+
+        Returns:
+            Optional[dict]: ジョブの状態（存在しない場合はNone）
+        """
+        with self._connect() as connection:
+            row = connection.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None:
+                return None
+            failed_chunks = connection.execute(
+                "SELECT COUNT(*) FROM chunks WHERE job_id = ? AND status = 'failed'", (job_id,)
+            ).fetchone()[0]
+        return {
+            "id": row["id"],
+            "status": row["status"],
+            "total_rows": row["total_rows"],
+            "total_chunks": row["total_chunks"],
+            "done_chunks": row["done_chunks"],
+            "failed_chunks": failed_chunks,
+            "progress": row["done_chunks"] / row["total_chunks"] if row["total_chunks"] else 1.0,
+            "error": row["error"],
+        }
+
+    def iter_results(self, job_id: str) -> Iterator[dict]:
+        """
+        ジョブの結果を入力順に1行ずつ返す（チャンク単位で読み込む）
+        実行中のジョブは先頭から続けて終わったチャンクまでを返し（行の位置が入力とずれないよう、
+        未処理のチャンクがあればそこで止める）、失敗したチャンクは行ごとにチャンクのエラーを返します。
+        """
+        with self._connect() as connection:
+            chunks = [
+                (row["chunk_index"], row["status"])
+                for row in connection.execute(
+                    "SELECT chunk_index, status FROM chunks WHERE job_id = ? ORDER BY chunk_index", (job_id,)
+                )
+            ]
+        for index, status in chunks:
+            if status not in ("done", "failed"):
+                return
+            with self._connect() as connection:
+                row = connection.execute(
+                    "SELECT status, result, payload, error FROM chunks WHERE job_id = ? AND chunk_index = ?",
+                    (job_id, index),
+                ).fetchone()
+            if row["status"] == "done":
+                yield from json.loads(row["result"])
+            else:
+                yield from ({"error": row["error"]} for _ in json.loads(row["payload"]))
+
+    def process_next_chunk(self) -> bool:
+        """
+        未処理のチャンクを1つ取り出して計算する
+
+        Returns:
+            bool: 処理したチャンクがあった場合はTrue
+        """
+        claimed = self._claim_chunk()
+        if claimed is None:
+            return False
+        job_id, chunk_index, payload = claimed
+
+        try:
+            panels = batch_items_adapter.validate_json(payload)
+            result = json.dumps(CalculateStress.calculate_batch_rows(panels), ensure_ascii=False)
+        except Exception as e:
+            self._fail_chunk(job_id, chunk_index, str(e))
+            return True
+        self._complete_chunk(job_id, chunk_index, result)
+        return True
+
+    def _claim_chunk(self):
+        # 未処理のチャンク、またはリース切れ（ワーカー停止）の実行中チャンクを取り出す
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute(
+                "SELECT job_id, chunk_index, payload FROM chunks"
+                " WHERE status = 'pending' OR (status = 'running' AND lease_until < ?)"
+                " ORDER BY rowid LIMIT 1",
+                (now,),
+            ).fetchone()
+            if row is None:
+                connection.execute("COMMIT")
+                return None
+            # 取り出した回数を数える（リース切れによる再処理も1回とする）
+            connection.execute(
+                "UPDATE chunks SET status = 'running', lease_until = ?, attempts = attempts + 1"
+                " WHERE job_id = ? AND chunk_index = ?",
+                (now + self.lease_seconds, row["job_id"], row["chunk_index"]),
+            )
+            connection.execute(
+                "UPDATE jobs SET status = 'running', updated_at = ? WHERE id = ? AND status = 'queued'",
+                (now, row["job_id"]),
+            )
+            connection.execute("COMMIT")
+        return row["job_id"], row["chunk_index"], row["payload"]
+
+    def _complete_chunk(self, job_id: str, chunk_index: int, result: str) -> None:
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            updated = connection.execute(
+                "UPDATE chunks SET status = 'done', result = ?, lease_until = NULL"
+                " WHERE job_id = ? AND chunk_index = ? AND status = 'running'",
+                (result, job_id, chunk_index),
+            ).rowcount
+            if updated:
+                connection.execute(
+                    "UPDATE jobs SET done_chunks = done_chunks + 1, updated_at = ?,"
+                    " status = CASE WHEN done_chunks + 1 >= total_chunks AND status != 'failed' THEN 'done' ELSE status END"
+                    " WHERE id = ?",
+                    (now, job_id),
+                )
+            connection.execute("COMMIT")
+
+    def _fail_chunk(self, job_id: str, chunk_index: int, error: str) -> None:
+        # 試した回数が上限未満であれば未処理に戻して再処理し、上限に達した場合はジョブを失敗とする
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute(
+                "SELECT attempts FROM chunks WHERE job_id = ? AND chunk_index = ? AND status = 'running'",
+                (job_id, chunk_index),
+            ).fetchone()
+            if row is None:
+                connection.execute("COMMIT")
+                return
+            failed = row["attempts"] >= self.max_attempts
+            connection.execute(
+                "UPDATE chunks SET status = ?, error = ?, lease_until = NULL WHERE job_id = ? AND chunk_index = ?",
+                ("failed" if failed else "pending", error, job_id, chunk_index),
+            )
+            if failed:
+                connection.execute(
+                    "UPDATE jobs SET status = 'failed', error = ?, updated_at = ? WHERE id = ?",
+                    (error, now, job_id),
+                )
+            connection.execute("COMMIT")
+
+
+class JobWorkerPool:
+    """
+    ジョブキューのチャンクを処理するワーカースレッドのプール
+    """
+
+    def __init__(self, queue: JobQueue, workers: int = 2, poll_interval: float = 1.0):
+        """
+        コンストラクタ
+
+        Args:
+            queue: ジョブキュー
+            workers: ワーカースレッド数
+            poll_interval: 未処理のチャンクが無いときの待ち時間 [s]
+        """
+        self.queue = queue
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        """ワーカーを起動する（リース切れのチャンクは起動後に再処理される）"""
+        if self._threads:
+            return
+        self._stopped.clear()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"job-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self) -> None:
+        """ワーカーを停止する（実行中のチャンクは完了を待つ）"""
+        self._stopped.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def notify(self) -> None:
+        """新しいジョブが登録されたことをワーカーに知らせる"""
+        self._wakeup.set()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            if not self.queue.process_next_chunk():
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+
+
+_job_queue: Optional[JobQueue] = None
+_job_worker_pool: Optional[JobWorkerPool] = None
+
+
+def get_job_queue() -> JobQueue:
+    """環境変数 JOB_QUEUE_PATH のジョブキューを返す"""
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = JobQueue(os.getenv("JOB_QUEUE_PATH", DEFAULT_JOB_QUEUE_PATH))
+    return _job_queue
+
+
+def get_job_worker_pool() -> JobWorkerPool:
+    """環境変数 JOB_WORKERS のワーカー数のプールを返す"""
+    global _job_worker_pool
+    if _job_worker_pool is None:
+        _job_worker_pool = JobWorkerPool(get_job_queue(), int(os.getenv("JOB_WORKERS", "2")))
+    return _job_worker_pool
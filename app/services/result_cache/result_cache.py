@@ -0,0 +1,184 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+from app.services.glass_calculator.coefficient_tables import get_coefficient_table
+from app.services.glass_calculator.contracts.enums import InterlayerMaterialTypeEnum, SupportTypeEnum
+from app.services.glass_calculator.laminate import get_shear_modulus_table
+from app.services.result_cache.result_store import get_result_store
+
+# キャッシュする計算結果の件数の上限
+DEFAULT_RESULT_CACHE_SIZE = 10000
+
+# 計算結果を保持する時間（秒）
+DEFAULT_RESULT_CACHE_TTL = 3600
+
+
+class ResultCache:
+    """
+    計算結果のLRUキャッシュ
+    件数の上限を超えた場合は最も長く使われていない結果から削除し、保持時間を過ぎた結果は使いません。
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_RESULT_CACHE_SIZE,
+        ttl_seconds: float = DEFAULT_RESULT_CACHE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        コンストラクタ
+
+        Args:
+            max_size: キャッシュする件数の上限（0の場合はキャッシュしない）
+            ttl_seconds: 計算結果を保持する時間 [s]
+            clock: 現在時刻を返す関数 [s]
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        キャッシュした計算結果を返す
+
+        Returns:
+            Optional[dict]: 計算結果のコピー（無い場合、保持時間を過ぎた場合はNone）
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry[1])
+
+    def put(self, key: str, result: dict) -> None:
+        """計算結果をキャッシュする（件数の上限を超えた場合は最も長く使われていない結果を削除する）"""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, dict(result))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """キャッシュした計算結果と件数を消去する"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def stats(self) -> dict:
+        """キャッシュの件数（ヒット、ミス、削除）と使用状況を返す"""
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": self.hits / requests if requests else 0.0,
+            }
+
+
+def canonical_key(scope: str, support: SupportTypeEnum, data) -> str:
+    """
+    入力モデルからキャッシュのキーを作る
+
+    Args:
+        scope: 計算の種類（1枚ずつの計算と一括計算で結果が異なる場合があるため分ける）
+        support: 支持条件
+        data: 入力モデル（pydanticのモデル）
+
+    Returns:
+        str: 支持条件、係数テーブル（PVB, EVAはせん断弾性係数の表も）の版、入力値（支持条件を除き項目名順）をまとめたキー
+    """
+    values = data.model_dump(mode="json", exclude={"support"})
+    version = get_coefficient_table(support).version_key
+    interlayer = getattr(data, "interlayer", InterlayerMaterialTypeEnum.SG)
+    if interlayer != InterlayerMaterialTypeEnum.SG:
+        version = f"{version},{get_shear_modulus_table(interlayer).version_key}"
+    return json.dumps([scope, support.value, version, values], sort_keys=True, separators=(",", ":"))
+
+
+def cached_result(support: SupportTypeEnum):
+    """
+    1枚ずつの計算をキャッシュするデコレーター（同じ入力の計算結果はキャッシュから返す）
+
+    Args:
+        support: 支持条件
+    """
+    def decorator(calculate):
+        @functools.wraps(calculate)
+        def wrapper(data):
+            key = canonical_key("single", support, data)
+            result = get_cached_results([key])[0]
+            if result is None:
+                result = calculate(data)
+                put_cached_results({key: result})
+            return result
+        return wrapper
+    return decorator
+
+
+def get_cached_results(keys: List[str]) -> List[Optional[dict]]:
+    """
+    キャッシュした計算結果をキーの順に返す（メモリに無い結果は永続キャッシュから探す）
+
+    Returns:
+        List[Optional[dict]]: 計算結果（どちらにも無いキーはNone）
+    """
+    cache = get_result_cache()
+    results = [cache.get(key) for key in keys]
+    store = get_result_store()
+    missing = [i for i, result in enumerate(results) if result is None]
+    if store is not None and missing:
+        for i, result in zip(missing, store.get_many([keys[i] for i in missing])):
+            if result is not None:
+                cache.put(keys[i], result)
+                results[i] = result
+    return results
+
+
+def put_cached_results(results: Dict[str, dict]) -> None:
+    """計算結果をメモリと永続キャッシュ（有効な場合）に保存する"""
+    cache = get_result_cache()
+    for key, result in results.items():
+        cache.put(key, result)
+    store = get_result_store()
+    if store is not None:
+        store.put_many(results)
+
+
+_result_cache: Optional[ResultCache] = None
+
+
+def get_result_cache() -> ResultCache:
+    """環境変数 RESULT_CACHE_SIZE の件数、RESULT_CACHE_TTL の保持時間のキャッシュを返す"""
+    global _result_cache
+    if _result_cache is None:
+        _result_cache = ResultCache(
+            int(os.getenv("RESULT_CACHE_SIZE", str(DEFAULT_RESULT_CACHE_SIZE))),
+            float(os.getenv("RESULT_CACHE_TTL", str(DEFAULT_RESULT_CACHE_TTL))),
+        )
+    return _result_cache
@@ -0,0 +1,172 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from app.services.glass_calculator.coefficient_tables import coefficient_versions
+from app.services.glass_calculator.laminate import shear_modulus_versions
+
+# 計算結果のデータベース（Lambdaでは/tmpのみ書き込み可能。環境変数 RESULT_STORE_PATH で有効にする）
+DEFAULT_RESULT_STORE_PATH = "/tmp/glass_results.sqlite3"
+
+# 保存する計算結果の合計サイズの上限（バイト）
+DEFAULT_RESULT_STORE_MAX_BYTES = 64 * 1024 * 1024
+
+# テーブル構成の版（構成を変更した場合に更新する。異なる版のデータベースは作り直す）
+RESULT_STORE_SCHEMA_VERSION = 1
+
+# 1回のSQLで検索するキーの数（SQLiteの変数の数の上限より小さくする）
+LOOKUP_CHUNK_SIZE = 500
+
+
+class ResultStore:
+    """
+    計算結果の永続キャッシュ
+    計算結果をSQLiteに保存し、同じコンテナ内の別プロセス（再起動後のLambda、uvicornのワーカー）と共有します。
+    係数テーブル・中間膜のせん断弾性係数の表の版が変わった場合は保存した結果をすべて削除し、合計サイズが上限を超えた場合は
+    最も長く使われていない結果から削除します。
+    """
+
+    def __init__(self, path: str = DEFAULT_RESULT_STORE_PATH, max_bytes: int = DEFAULT_RESULT_STORE_MAX_BYTES):
+        """
+        コンストラクタ
+
+        Args:
+            path: SQLiteファイルのパス
+            max_bytes: 保存する計算結果の合計サイズの上限 [byte]
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        versions = json.dumps(
+            {"coefficient": coefficient_versions(), "shear_modulus": shear_modulus_versions()}, sort_keys=True
+        )
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("BEGIN IMMEDIATE")
+            if connection.execute("PRAGMA user_version").fetchone()[0] != RESULT_STORE_SCHEMA_VERSION:
+                connection.execute("DROP TABLE IF EXISTS results")
+                connection.execute("DROP TABLE IF EXISTS meta")
+                connection.execute(f"PRAGMA user_version = {RESULT_STORE_SCHEMA_VERSION}")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " key TEXT PRIMARY KEY, result TEXT NOT NULL, size INTEGER NOT NULL, used_at REAL NOT NULL"
+                ")"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS results_used_at ON results (used_at)")
+            connection.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            # 係数テーブル・せん断弾性係数の表の版が保存時と異なる場合は結果を使わない
+            row = connection.execute("SELECT value FROM meta WHERE name = 'table_versions'").fetchone()
+            if row is None or row["value"] != versions:
+                connection.execute("DELETE FROM results")
+                connection.execute(
+                    "INSERT OR REPLACE INTO meta (name, value) VALUES ('table_versions', ?)", (versions,)
+                )
+            connection.execute("COMMIT")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # トランザクションはBEGIN/COMMITで明示する（COMMIT前に例外が発生した場合はcloseでロールバック）
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    def get_many(self, keys: List[str]) -> List[Optional[dict]]:
+        """
+        保存した計算結果をキーの順に返す
+
+        Returns:
+            List[Optional[dict]]: 計算結果（保存されていないキーはNone）
+        """
+        found: Dict[str, dict] = {}
+        unique_keys = list(dict.fromkeys(keys))
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            for start in range(0, len(unique_keys), LOOKUP_CHUNK_SIZE):
+                chunk = unique_keys[start:start + LOOKUP_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                for row in connection.execute(f"SELECT key, result FROM results WHERE key IN ({placeholders})", chunk):
+                    found[row["key"]] = json.loads(row["result"])
+                connection.execute(f"UPDATE results SET used_at = ? WHERE key IN ({placeholders})", [now, *chunk])
+            connection.execute("COMMIT")
+
+        results = [found.get(key) for key in keys]
+        with self._lock:
+            self.hits += sum(result is not None for result in results)
+            self.misses += sum(result is None for result in results)
+        return [None if result is None else dict(result) for result in results]
+
+    def put_many(self, results: Dict[str, dict]) -> None:
+        """計算結果を保存する（合計サイズが上限を超えた場合は最も長く使われていない結果を削除する）"""
+        if not results:
+            return
+        now = time.time()
+        rows = []
+        for key, result in results.items():
+            text = json.dumps(result, ensure_ascii=False)
+            rows.append((key, text, len(key) + len(text.encode()), now))
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.executemany(
+                "INSERT OR REPLACE INTO results (key, result, size, used_at) VALUES (?, ?, ?, ?)", rows
+            )
+            total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+            evicted = 0
+            if total > self.max_bytes:
+                # 新しく使われた順に合計サイズが上限に収まる分だけ残す
+                evicted = connection.execute(
+                    "DELETE FROM results WHERE key IN ("
+                    " SELECT key FROM ("
+                    "  SELECT key, SUM(size) OVER (ORDER BY used_at DESC, key) AS kept FROM results"
+                    " ) WHERE kept > ?"
+                    ")",
+                    (self.max_bytes,),
+                ).rowcount
+            connection.execute("COMMIT")
+        with self._lock:
+            self.evictions += evicted
+
+    def clear(self) -> None:
+        """保存した計算結果と件数を消去する"""
+        with self._connect() as connection:
+            connection.execute("DELETE FROM results")
+        with self._lock:
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """保存した計算結果の件数・サイズと、このプロセスでのヒット・ミス・削除の件数を返す"""
+        with self._connect() as connection:
+            row = connection.execute("SELECT COUNT(*) AS count, COALESCE(SUM(size), 0) AS size FROM results").fetchone()
+        with self._lock:
+            return {
+                "path": self.path,
+                "size": row["count"],
+                "bytes": row["size"],
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_result_store: Optional[ResultStore] = None
+
+
+def get_result_store() -> Optional[ResultStore]:
+    """環境変数 RESULT_STORE_PATH の永続キャッシュを返す（未設定の場合はNone）"""
+    global _result_store
+    path = os.getenv("RESULT_STORE_PATH")
+    if _result_store is None and path:
+        _result_store = ResultStore(path, int(os.getenv("RESULT_STORE_MAX_BYTES", str(DEFAULT_RESULT_STORE_MAX_BYTES))))
+    return _result_store
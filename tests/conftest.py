@@ -0,0 +1,11 @@
+import pytest
+
+from app.services.result_cache.result_cache import get_result_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_result_cache():
+    # 計算結果のキャッシュはプロセス全体で共有されるため、テストごとに空にする
+    get_result_cache().clear()
+    yield
+    get_result_cache().clear()
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from app.services.glass_calculator.allowable_stress import GlassAllowableUnitStress
+from app.services.glass_calculator.contracts.enums import GlassTypeEnum, InterlayerMaterialTypeEnum
+from app.services.glass_calculator.glass_layer import GlassLayer
+
+
+def allowable_stress(layers, glass_type):
+    return GlassAllowableUnitStress(GlassLayer(layers, InterlayerMaterialTypeEnum.SG), glass_type).allowable_stress  # type: ignore
+
+
+class TestGlassAllowableUnitStress:
+    """許容応力のテスト"""
+
+    @pytest.mark.parametrize(
+        "t, expected",
+        [(3, 24.5), (8, 24.5), (8.5, 22.1), (12, 22.1), (15, 19.6), (20, 19.6), (25, 18.6)],
+    )
+    def test_float_thickness_ranges(self, t, expected):
+        """フロートガラスの板厚区分の境界（上限を含む）"""
+        assert allowable_stress([t], GlassTypeEnum.FLOAT).allowableStress.shortTerm.inplane == expected
+
+    @pytest.mark.parametrize("t", [5, 11])
+    def test_invalid_thickness(self, t):
+        """区分の範囲外の板厚はエラーとなること"""
+        with pytest.raises(ValueError, match="無効なガラスタイプまたは厚さ"):
+            allowable_stress([t], GlassTypeEnum.WIRED)
+
+    def test_outer_layer(self):
+        """外側の板厚の小さい方で区分を決めること"""
+        assert allowable_stress([10, 12, 6], GlassTypeEnum.FLOAT).allowableStress.shortTerm.inplane == 24.5
+
+    def test_interned(self):
+        """同じ板厚区分では同一の凍結されたオブジェクトを返すこと"""
+        first = allowable_stress([4], GlassTypeEnum.TEMPERED)
+        second = allowable_stress([19], GlassTypeEnum.TEMPERED)
+        assert first is second
+        with pytest.raises(AttributeError):
+            first.fracturesStrength.inplane = 0  # type: ignore
+
+    def test_batch_matches_scalar(self):
+        """一括計算が1枚ずつの計算と一致すること"""
+        thickness = np.array([3, 4, 6, 8, 10, 12, 19, 20, 25, np.nan])
+        for glass_type in GlassTypeEnum:
+            result = GlassAllowableUnitStress.get_allowable_stress_batch(glass_type, thickness)
+            for i, t in enumerate(thickness[:-1]):
+                try:
+                    stress = allowable_stress([float(t)], glass_type).allowableStress
+                except ValueError as e:
+                    assert result["error"][i] == str(e)
+                    continue
+                assert result["shortTerm"][i] == stress.shortTerm.inplane
+                assert result["longTerm"][i] == stress.longTerm.inplane
+            assert np.isnan(result["shortTerm"][-1]) and result["error"][-1] is None
+
+
+class TestUtilization:
+    """検定比のテスト"""
+
+    def test_batch_matches_single_calculation(self):
+        """一括計算の検定比が1枚ずつの計算と一致し、許容応力が求まらない行はエラーとなること"""
+        from app.schemas.glass import ThreeSideUniformBatchItemScheme
+        from app.services.glass_calculator.glass_calculator import CalculateStress
+
+        panels = [
+            ThreeSideUniformBatchItemScheme(support="three-uniform", free=1000, fix=800, t=[6], w=0.002, glass_type="tempered"),
+            ThreeSideUniformBatchItemScheme(support="three-uniform", free=1000, fix=800, t=[8, 8], w=0.002),
+            ThreeSideUniformBatchItemScheme(support="three-uniform", free=1000, fix=800, t=[3], w=0.002, glass_type="tempered"),
+        ]
+        results = CalculateStress.calculate_batch_rows(panels)
+
+        for panel, row in zip(panels[:2], results):
+            single = CalculateStress.calculate_threeside_uniform(panel)
+            assert row == single
+            assert 0 < single["utilization_short_term"] < single["utilization_long_term"]
+        assert results[2] == CalculateStress.calculate_threeside_uniform(panels[2])
+        assert "無効なガラスタイプまたは厚さ" in results[2]["error"]
@@ -0,0 +1,111 @@
+import asyncio
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1 import batch
+from app.schemas.glass import BatchInputScheme
+from app.services.glass_calculator.glass_calculator import CalculateStress
+
+app = FastAPI()
+app.include_router(batch.router)
+client = TestClient(app)
+
+
+def make_lines(count):
+    return [
+        json.dumps({"support": "four-uniform", "a": 1000, "b": 1000 + 100 * i, "t": [6], "w": 0.002}).encode()
+        for i in range(count)
+    ]
+
+
+def expected_rows(lines):
+    panels = BatchInputScheme(panels=[json.loads(line) for line in lines]).panels  # type: ignore
+    return CalculateStress.calculate_batch_rows(panels)
+
+
+def read_rows(body: bytes):
+    return [json.loads(line) for line in body.decode().splitlines()]
+
+
+def stream_messages(chunks, chunk_size):
+    # 本文を chunks ごとに分けて受け取るASGIの呼び出し（TestClientは本文を1回で渡すため）
+    messages = [{"type": "http.request", "body": chunk, "more_body": True} for chunk in chunks]
+    messages.append({"type": "http.request", "body": b"", "more_body": False})
+    sent = []
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/stream",
+        "raw_path": b"/stream",
+        "root_path": "",
+        "query_string": f"chunk_size={chunk_size}".encode(),
+        "headers": [(b"content-type", b"application/x-ndjson")],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+    asyncio.run(app(scope, receive, send))
+    return sent
+
+
+class TestBatchStream:
+    """NDJSONの一括計算（/stream）のテスト"""
+
+    def test_order_across_chunks(self):
+        """chunk_size を跨いでも入力の順に結果が返されること"""
+        lines = make_lines(5)
+
+        response = client.post("/stream?chunk_size=2", content=b"\n".join(lines) + b"\n")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert read_rows(response.content) == expected_rows(lines)
+
+    def test_line_split_across_body_chunks(self):
+        """本文の区切りが行の途中にあっても行として組み立てられ、チャンクごとに返されること"""
+        lines = make_lines(3)
+        body = b"\n".join(lines) + b"\n"
+        chunks = [body[:10], body[10:len(lines[0]) + 5], body[len(lines[0]) + 5:]]
+
+        sent = stream_messages(chunks, 2)
+
+        assert sent[0]["status"] == 200
+        bodies = [message["body"] for message in sent if message["type"] == "http.response.body" and message["body"]]
+        assert len(bodies) == 2
+        assert read_rows(b"".join(bodies)) == expected_rows(lines)
+
+    def test_blank_and_unterminated_lines(self):
+        """空行は読み飛ばし、末尾の改行の無い行も計算されること"""
+        lines = make_lines(3)
+        body = lines[0] + b"\n\n" + lines[1] + b"\n  \n" + lines[2]
+
+        response = client.post("/stream?chunk_size=10", content=body + b"\n\n")
+        unterminated = client.post("/stream?chunk_size=10", content=body)
+
+        assert read_rows(response.content) == expected_rows(lines)
+        assert read_rows(unterminated.content) == expected_rows(lines)
+
+    def test_invalid_lines_return_row_errors(self):
+        """JSONとして不正な行・入力エラーの行は同じ位置にエラーを返し、他の行は計算されること"""
+        lines = make_lines(2)
+        body = b"\n".join([lines[0], b"{not json", b'{"support": "four-uniform", "a": -1, "t": [6], "w": 0.002}', lines[1]])
+
+        rows = read_rows(client.post("/stream?chunk_size=3", content=body).content)
+
+        assert len(rows) == 4
+        assert [rows[0], rows[3]] == expected_rows(lines)
+        assert set(rows[1]) == {"error"} and "Invalid JSON" in rows[1]["error"]
+        assert set(rows[2]) == {"error"} and "a:" in rows[2]["error"]
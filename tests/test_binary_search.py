@@ -3,6 +3,7 @@ import sys
 sys.path.append("..app")
 from app.services.binary_search import binary_search
 from app.services.binary_search.binary_search import BisectTypeEnum
+import numpy as np
 import pytest
 
 
@@ -36,3 +37,20 @@ class Testbinary_search:
         target = 3
         res = binary_search.binary_search(arr, target, BisectTypeEnum.RIGHT)
         assert res == 5
+
+
+class Testsearch_many:
+    """Test cases for the vectorized search_many utility function"""
+
+    @pytest.mark.parametrize("bisect_type", [BisectTypeEnum.LEFT, BisectTypeEnum.RIGHT])
+    def test_search_many_matches_binary_search(self, bisect_type):
+        """Should return the same indices as binary_search for every target"""
+        arr = [1, 2, 2, 3, 3, 4, 5]
+        targets = np.array([0, 1, 2, 2.5, 3, 3.5, 5, 6])
+        res = binary_search.search_many(arr, targets, bisect_type)
+        assert res.tolist() == [binary_search.binary_search(arr, target, bisect_type) for target in targets]
+
+    def test_search_many_keeps_shape(self):
+        """Should return an index array with the same shape as targets"""
+        res = binary_search.search_many(np.array([1.0, 2.0, 3.0]), np.array([[0.5, 1.5], [2.5, 3.5]]))
+        assert res.tolist() == [[0, 1], [2, 3]]
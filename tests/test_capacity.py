@@ -0,0 +1,52 @@
+import pytest
+
+from app.schemas.glass import CapacityItemScheme
+from app.services.glass_calculator.capacity import WindCapacity
+from app.services.glass_calculator.contracts.enums import InterlayerMaterialTypeEnum
+from app.services.glass_calculator.fourside.uniform import FourSideUniformLoadGlass
+from app.services.glass_calculator.glass_layer import GlassLayer
+from app.services.glass_calculator.glass_material import GlassMaterial
+from app.services.glass_calculator.threeside.uniform import ThreeSideUniformLoadGlass
+
+
+def layer(t):
+    return GlassLayer([t], InterlayerMaterialTypeEnum.SG)  # type: ignore
+
+
+class TestWindCapacity:
+    """最大風圧の計算クラスのテスト"""
+
+    def test_stress_reaches_allowable(self):
+        """最大風圧を載荷した応力が許容応力に一致すること"""
+        panel = CapacityItemScheme(support="four-uniform", a=1500, b=2500, t=[8])
+        result = WindCapacity.calculate_batch([panel])[0]
+
+        glass = FourSideUniformLoadGlass(1500, 2500, layer(8), result["w_short_term"], GlassMaterial())
+        assert glass.calculate_stress() == pytest.approx(24.5)
+        glass = FourSideUniformLoadGlass(1500, 2500, layer(8), result["w_long_term"], GlassMaterial())
+        assert glass.calculate_stress() == pytest.approx(9.8)
+        assert result["w_max"] == result["w_short_term"]
+        assert result["governing"] == "short_term"
+
+    def test_deflection_governs(self):
+        """変位の制限値で決まる場合は変位が制限値に一致すること"""
+        panel = CapacityItemScheme(support="three-uniform", a=1000, b=800, t=[6], glass_type="tempered", deflection_limit=5)
+        result = WindCapacity.calculate_batch([panel])[0]
+
+        glass = ThreeSideUniformLoadGlass(1000, 800, layer(6), result["w_deflection"], GlassMaterial())
+        assert glass.calculate_displacement() == pytest.approx(5)
+        assert result["w_max"] == result["w_deflection"] < result["w_short_term"]
+        assert result["governing"] == "deflection"
+
+    def test_row_errors(self):
+        """行ごとのエラーが他の行に影響しないこと"""
+        panels = [
+            CapacityItemScheme(support="four-uniform", a=1500, t=[8]),
+            CapacityItemScheme(support="four-uniform", a=1500, b=2500, t=[3], glass_type="tempered"),
+            CapacityItemScheme(support="four-uniform", a=1500, b=2500, t=[8]),
+        ]
+        results = WindCapacity.calculate_batch(panels)
+
+        assert results[0] == {"error": "b: 値を入力してください"}
+        assert "無効なガラスタイプまたは厚さ" in results[1]["error"]
+        assert results[2]["w_short_term"] > 0
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from app.services.glass_calculator.glass_material import GlassMaterial
 from app.services.glass_calculator.circular.uniform import CircleUniformLoadGlass
@@ -74,3 +75,21 @@ class TestCircleSupportedUniformLoadGlass:
             # thickness**3 は 1728 (12^3)
             expected = 0.756 * (1 * 500**4) / (E * 12**3)
             assert pytest.approx(displacement, 0.001) == expected
+
+    class TestCalculateBatch:
+        """一括計算メソッドのテスト"""
+
+        def test_batch_matches_single_calculation(self):
+            """一括計算の結果が1枚ずつの計算結果と一致すること"""
+            glass_material = GlassMaterial()
+            panels = [(500, 12.0, 1.0), (300, 8.0, 0.5)]
+            radius, thickness, w = (np.array(column, dtype=np.float64) for column in zip(*panels))
+            E = np.full(len(panels), glass_material.E, dtype=np.float64)
+
+            result = CircleUniformLoadGlass.calculate_batch(radius, thickness, w, E)
+
+            for i, (r, t, load) in enumerate(panels):
+                glass_layer = GlassLayer([t], InterlayerMaterialTypeEnum.SG) # type: ignore
+                plate = CircleUniformLoadGlass(r, glass_layer, load, glass_material)
+                assert result["sigma"][i] == plate.calculate_stress()
+                assert result["delta"][i] == plate.calculate_displacement()
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from app.services.glass_calculator.coefficient_tables import (
+    coefficient_versions,
+    get_coefficient_table,
+    register_coefficient_table,
+)
+from app.services.glass_calculator.contracts.enums import InterlayerMaterialTypeEnum, SupportTypeEnum
+from app.services.glass_calculator.fourside.partial import FourSidePartialLoadGlass
+from app.services.glass_calculator.fourside.uniform import FourSideUniformLoadGlass
+from app.services.glass_calculator.glass_layer import GlassLayer
+from app.services.glass_calculator.glass_material import GlassMaterial
+
+
+class TestCoefficientTables:
+    """係数テーブルのテスト"""
+
+    def test_every_support_is_registered(self):
+        """全ての支持条件の係数テーブルが版付きで登録されていること"""
+        versions = coefficient_versions()
+        assert set(versions) == {support.value for support in SupportTypeEnum}
+        assert get_coefficient_table(SupportTypeEnum.FOUR_UNIFORM).version_key == f"four-uniform:{versions['four-uniform']}"
+
+    def test_tables_are_immutable(self):
+        """軸と係数は書き換えできないこと"""
+        table = get_coefficient_table(SupportTypeEnum.FOUR_UNIFORM)
+        with pytest.raises(ValueError):
+            table.values["beta"][0] = 0
+        with pytest.raises(TypeError):
+            table.values["beta"] = np.zeros(7)  # type: ignore
+        assert table.axes["b_by_a"].flags["C_CONTIGUOUS"]
+
+    def test_duplicate_registration(self):
+        """同じ支持条件のテーブルは登録できないこと"""
+        with pytest.raises(ValueError):
+            register_coefficient_table(SupportTypeEnum.FOUR_UNIFORM, "2", "", {}, {})
+
+    def test_calculators_resolve_through_registry(self):
+        """計算クラスが登録済みのテーブルを参照すること"""
+        assert FourSideUniformLoadGlass.coefficient_table is get_coefficient_table(SupportTypeEnum.FOUR_UNIFORM)
+        assert FourSidePartialLoadGlass.coefficient_table is get_coefficient_table(SupportTypeEnum.FOUR_PARTIAL)
+
+    def test_partial_uses_row_axis(self):
+        """b/a=1.4 の行では、その行の b'/a の軸（欠損の無い範囲）で係数を参照すること"""
+        layer = GlassLayer([8], InterlayerMaterialTypeEnum.SG)  # type: ignore
+        plate = FourSidePartialLoadGlass(100, 130, layer, 0.002, 99, 100, GlassMaterial())
+
+        assert (plate.alpha, plate.beta) == (0.066, 0.36)
@@ -0,0 +1,162 @@
+import pytest
+
+from app.schemas.glass import BatchInputScheme, FourSideUniformInputScheme
+from app.services.glass_calculator.contracts.enums import EdgeConditionEnum, InterlayerMaterialTypeEnum, SupportTypeEnum
+import numpy as np
+
+from app.services.glass_calculator.fem.plate import FEMPlateGlass, RectangularPlateFEM, model_cache_stats
+from app.services.glass_calculator.glass_calculator import CalculateStress
+from app.services.glass_calculator.glass_layer import GlassLayer
+from app.services.glass_calculator.glass_material import GlassMaterial
+
+
+class TestFEMPlateGlass:
+    """FEMによるガラス板の計算クラスのテスト"""
+
+    @pytest.mark.parametrize(
+        "support, edges, beta, alpha",
+        [
+            (SupportTypeEnum.FOUR_UNIFORM, {"a": 1000, "b": 1000}, 0.272, 0.047),
+            (SupportTypeEnum.FOUR_UNIFORM, {"a": 1000, "b": 2000}, 0.603, 0.116),
+            (SupportTypeEnum.THREE_UNIFORM, {"free": 1000, "fix": 500}, 0.350, 0.076),
+            (SupportTypeEnum.TWO_UNIFORM, {"free": 1000, "fix": 1000}, 0.782, 0.163),
+        ],
+    )
+    def test_uniform_load_matches_coefficient_table(self, support, edges, beta, alpha):
+        """等分布荷重の応力・変位が係数表による計算と概ね一致すること"""
+        layer = GlassLayer([10], InterlayerMaterialTypeEnum.SG) # type: ignore
+        plate = FEMPlateGlass.from_support(support, edges, layer, 1.0, GlassMaterial(71600, 0.22))
+        a = edges.get("a", edges.get("free"))
+
+        assert plate.calculate_stress() == pytest.approx(beta * a ** 2 / 10 ** 2, rel=0.02)
+        assert plate.calculate_displacement() == pytest.approx(alpha * a ** 4 / (71600 * 10 ** 3), rel=0.02)
+
+    def test_partial_load_matches_coefficient_table(self):
+        """部分荷重の応力・変位が係数表による計算と概ね一致すること"""
+        layer = GlassLayer([10], InterlayerMaterialTypeEnum.SG) # type: ignore
+        plate = FEMPlateGlass.from_support(
+            SupportTypeEnum.FOUR_PARTIAL, {"a": 1000, "b": 1000, "a1": 400, "b1": 400}, layer, 1.0,
+            GlassMaterial(71600, 0.22),
+        )
+
+        assert plate.calculate_stress() == pytest.approx(0.801 * 400 * 400 / 10 ** 2, rel=0.02)
+        assert plate.calculate_displacement() == pytest.approx(0.107 * 400 * 400 * 1000 ** 2 / (71600 * 10 ** 3), rel=0.02)
+
+    def test_clamped_edges_reduce_stress(self):
+        """固定辺の板は単純支持の板より変位が小さいこと"""
+        layer = GlassLayer([10], InterlayerMaterialTypeEnum.SG) # type: ignore
+        edges = {"a": 1000, "b": 1000}
+        simple = FEMPlateGlass.from_support(SupportTypeEnum.FOUR_UNIFORM, edges, layer, 1.0, GlassMaterial())
+        clamped = FEMPlateGlass.from_support(
+            SupportTypeEnum.FOUR_UNIFORM, edges, layer, 1.0, GlassMaterial(), [EdgeConditionEnum.CLAMPED] * 4
+        )
+
+        assert clamped.calculate_displacement() < simple.calculate_displacement() / 2
+
+    def test_insufficient_support(self):
+        """支持が不足する場合にエラーが発生すること"""
+        edges = [EdgeConditionEnum.SIMPLE] + [EdgeConditionEnum.FREE] * 3
+        with pytest.raises(ValueError, match="支持が不足しています"):
+            RectangularPlateFEM(1000, 1000, 0.22, edges)
+
+    def test_circular_support_is_not_supported(self):
+        """円形支持はFEMで計算できないこと"""
+        layer = GlassLayer([10], InterlayerMaterialTypeEnum.SG) # type: ignore
+        with pytest.raises(ValueError, match="FEMで計算できない支持条件です"):
+            FEMPlateGlass.from_support(SupportTypeEnum.CIRCULAR_UNIFORM, {"D": 1000}, layer, 1.0, GlassMaterial())
+
+
+class TestFactorizationCache:
+    """FEMの分解済み剛性行列の再利用のテスト"""
+
+    def test_model_is_shared_by_signature(self):
+        """寸法・ポアソン比・辺の条件・分割数が同じモデルは共有されること"""
+        edges = [EdgeConditionEnum.SIMPLE] * 4
+        first = RectangularPlateFEM.get(1234, 2345, 0.22, edges, 8)
+        hits = model_cache_stats()["hits"]
+
+        assert RectangularPlateFEM.get(1234.0, 2345.0, 0.22, tuple(edges), 8) is first
+        assert model_cache_stats()["hits"] == hits + 1
+        assert RectangularPlateFEM.get(1234, 2345, 0.3, edges, 8) is not first
+
+    def test_multiple_right_hand_sides_match_single_solves(self):
+        """荷重ケースを列に並べて解いた結果が1ケースずつ解いた結果と一致すること"""
+        plate = RectangularPlateFEM.get(1000, 1500, 0.22, [EdgeConditionEnum.SIMPLE] * 4, 8)
+        loads = [plate.load_vector(1.0), plate.load_vector(2.0, (400, 600)), plate.load_vector(0.5, (1000, 300))]
+        rigidity = RectangularPlateFEM.rigidity(np.array([8.0, 10.0, 12.0]), 71600, 0.22)
+
+        combined = plate.solve(np.stack(loads, axis=1), rigidity)
+
+        for k, load in enumerate(loads):
+            assert combined[:, k] == pytest.approx(plate.solve(load, rigidity[k]))
+
+    def test_batch_matches_single_calculation(self):
+        """一括計算の結果が1枚ずつの計算結果と一致すること"""
+        layers = [[6, 6], [8], [10]]
+        w = np.array([0.002, 0.003, 0.001])
+        result = FEMPlateGlass.calculate_batch(
+            SupportTypeEnum.FOUR_UNIFORM,
+            [{"a": 500, "b": 3000}] * 2 + [{"a": 600, "b": 3000}],
+            np.array([12.0, 8.0, 10.0]),
+            w,
+            np.full(3, 71600.0),
+            np.full(3, 0.22),
+            [None] * 3,
+            [16] * 3,
+        )
+
+        for i, (layer, edges) in enumerate(zip(layers, [{"a": 500, "b": 3000}] * 2 + [{"a": 600, "b": 3000}])):
+            plate = FEMPlateGlass.from_support(
+                SupportTypeEnum.FOUR_UNIFORM, edges, GlassLayer(layer, InterlayerMaterialTypeEnum.SG), # type: ignore
+                w[i], GlassMaterial(71600, 0.22),
+            )
+            assert result["sigma"][i] == pytest.approx(plate.calculate_stress(), rel=1e-12)
+            assert result["delta"][i] == pytest.approx(plate.calculate_displacement(), rel=1e-12)
+            assert result["error"][i] is None
+
+
+class TestCalculateStressSolver:
+    """計算方法（solver）の切り替えのテスト"""
+
+    def test_auto_falls_back_to_fem_out_of_table(self):
+        """係数表の範囲外の場合にFEMで計算されること"""
+        data = FourSideUniformInputScheme(a=500, b=3000, t=[6, 6], w=0.002, solver="auto")  # type: ignore
+
+        result = CalculateStress.calculate_fourside_uniform(data)
+
+        assert result["solver"] == "fem"
+        assert result["coefficient_version"] is None
+        assert result["sigma"] > 0
+
+    def test_auto_uses_table_in_range(self):
+        """係数表の範囲内の場合は係数表で計算されること"""
+        data = FourSideUniformInputScheme(a=1000, b=2000, t=[6, 6], w=0.002, solver="auto")  # type: ignore
+
+        result = CalculateStress.calculate_fourside_uniform(data)
+
+        assert result["solver"] == "table"
+        assert result["coefficient_version"] == "four-uniform:1"
+
+    def test_auto_does_not_fall_back_on_allowable_stress_error(self, monkeypatch):
+        """許容応力が求まらない場合はFEMで計算し直さずにエラーを返すこと"""
+        data = FourSideUniformInputScheme(a=1000, b=2000, t=[4], w=0.002, glass_type="wired", solver="auto")  # type: ignore
+        monkeypatch.setattr(CalculateStress, "calculate_fem", lambda *args: pytest.fail("FEMで計算"))
+
+        result = CalculateStress.calculate_fourside_uniform(data)
+
+        assert result == {"error": "無効なガラスタイプまたは厚さ: GlassTypeEnum.WIRED, 4.0"}
+
+    def test_batch_matches_single_calculation(self):
+        """一括計算のFEMの行が1枚ずつの計算結果と一致すること"""
+        panels = [
+            {"support": "four-uniform", "a": 500, "b": 3000, "t": [6, 6], "w": 0.002, "solver": "auto"},
+            {"support": "four-uniform", "a": 500, "b": 3000, "t": [6, 6], "w": 0.002},
+            {"support": "two-uniform", "free": 1000, "fix": 1000, "t": [8], "w": 0.002, "solver": "fem"},
+        ]
+        data = BatchInputScheme(panels=panels)  # type: ignore
+
+        results = CalculateStress.calculate_batch(data)["results"]
+
+        assert results[0] == CalculateStress.calculate_fourside_uniform(data.panels[0])
+        assert results[1] == {"error": "b/aが5を超えています。代わりにFEMを使用してください"}
+        assert results[2] == CalculateStress.calculate_twoside_uniform(data.panels[2])
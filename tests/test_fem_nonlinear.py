@@ -0,0 +1,100 @@
+import pytest
+
+from app.schemas.glass import BatchInputScheme
+from app.services.glass_calculator.contracts.enums import InterlayerMaterialTypeEnum, SupportTypeEnum
+from app.services.glass_calculator.fem.nonlinear import LargeDeflectionPlateGlass
+from app.services.glass_calculator.fem.plate import FEMPlateGlass
+from app.services.glass_calculator.glass_calculator import CalculateStress
+from app.services.glass_calculator.glass_layer import GlassLayer
+from app.services.glass_calculator.glass_material import GlassMaterial
+from app.services.result_cache.result_cache import get_result_cache
+
+
+SUPPORTS = [
+    (SupportTypeEnum.FOUR_UNIFORM, {"a": 1000, "b": 1500}),
+    (SupportTypeEnum.FOUR_PARTIAL, {"a": 1000, "b": 1000, "a1": 400, "b1": 400}),
+    (SupportTypeEnum.THREE_UNIFORM, {"free": 1000, "fix": 800}),
+    (SupportTypeEnum.TWO_UNIFORM, {"free": 1000, "fix": 1000}),
+]
+
+
+class TestLargeDeflectionPlateGlass:
+    """大たわみ解析によるガラス板の計算クラスのテスト"""
+
+    @pytest.mark.parametrize("support, edges", SUPPORTS)
+    def test_small_load_matches_linear_fem(self, support, edges):
+        """荷重が小さい（たわみが板厚に比べて小さい）場合は線形FEMと一致すること"""
+        layer = GlassLayer([6], InterlayerMaterialTypeEnum.SG) # type: ignore
+        material = GlassMaterial(71600, 0.22)
+
+        linear = FEMPlateGlass.from_support(support, edges, layer, 1e-5, material)
+        plate = LargeDeflectionPlateGlass(support, edges, layer, 1e-5, material)
+
+        assert plate.calculate_stress() == pytest.approx(linear.calculate_stress(), rel=0.01)
+        assert plate.calculate_displacement() == pytest.approx(linear.calculate_displacement(), rel=0.01)
+
+    def test_large_load_is_stiffer_than_linear_fem(self):
+        """たわみが板厚を超える場合は膜力により変位・応力が線形FEMより小さくなること"""
+        support, edges = SUPPORTS[0]
+        layer = GlassLayer([6], InterlayerMaterialTypeEnum.SG) # type: ignore
+        material = GlassMaterial(71600, 0.22)
+
+        linear = FEMPlateGlass.from_support(support, edges, layer, 0.01, material)
+        plate = LargeDeflectionPlateGlass(support, edges, layer, 0.01, material)
+
+        assert plate.calculate_displacement() > 6
+        assert plate.calculate_displacement() < 0.7 * linear.calculate_displacement()
+        assert plate.calculate_stress() < 0.9 * linear.calculate_stress()
+
+    def test_circular_small_load_matches_closed_form(self):
+        """円形板（軸対称）の荷重が小さい場合は周辺単純支持の理論解と一致すること"""
+        layer = GlassLayer([6], InterlayerMaterialTypeEnum.SG) # type: ignore
+        w, r, nu = 1e-5, 500, 0.22
+        rigidity = 71600 * 6 ** 3 / (12 * (1 - nu ** 2))
+
+        plate = LargeDeflectionPlateGlass(SupportTypeEnum.CIRCULAR_UNIFORM, {"D": 2 * r}, layer, w, GlassMaterial(71600, nu))
+
+        assert plate.calculate_stress() == pytest.approx(3 * (3 + nu) / 8 * w * r ** 2 / 6 ** 2, rel=0.01)
+        assert plate.calculate_displacement() == pytest.approx(
+            (5 + nu) / (1 + nu) * w * r ** 4 / (64 * rigidity), rel=0.01
+        )
+
+    def test_reuses_converged_solution(self):
+        """同じモデルの収束解を初期値に使い、同じ荷重は反復せずに求まること"""
+        layer = GlassLayer([5], InterlayerMaterialTypeEnum.SG) # type: ignore
+        material = GlassMaterial(71600, 0.22)
+        edges = {"a": 900, "b": 1300}
+
+        first = LargeDeflectionPlateGlass(SupportTypeEnum.FOUR_UNIFORM, edges, layer, 0.004, material)
+        same = LargeDeflectionPlateGlass(SupportTypeEnum.FOUR_UNIFORM, edges, layer, 0.004, material)
+        larger = LargeDeflectionPlateGlass(SupportTypeEnum.FOUR_UNIFORM, edges, layer, 0.0045, material)
+        cold = LargeDeflectionPlateGlass(SupportTypeEnum.FOUR_UNIFORM, {"a": 900, "b": 1301}, layer, 0.0045, material)
+
+        assert same.iterations == 0
+        assert same.calculate_stress() == first.calculate_stress()
+        assert larger.iterations < cold.iterations
+        assert larger.calculate_stress() == pytest.approx(cold.calculate_stress(), rel=0.01)
+
+
+class TestCalculateStressNonlinear:
+    """計算方法 nonlinear のテスト"""
+
+    def test_batch_matches_single_calculation(self):
+        """一括計算の大たわみの行が1枚ずつの計算結果と一致すること"""
+        panels = [
+            {"support": "four-uniform", "a": 1000, "b": 1500, "t": [6], "w": 0.005, "solver": "nonlinear"},
+            {"support": "three-uniform", "free": 1000, "fix": 1000, "t": [8], "w": 0.005, "solver": "nonlinear"},
+            {"support": "circular-uniform", "D": 1000, "t": [6], "w": 0.005, "solver": "nonlinear", "fem": {"load_steps": 2}},
+            {"support": "circular-uniform", "D": 1000, "t": [6], "w": 0.005},
+        ]
+        data = BatchInputScheme(panels=panels)  # type: ignore
+
+        results = CalculateStress.calculate_batch(data)["results"]
+        get_result_cache().clear()
+
+        assert results[0] == CalculateStress.calculate_fourside_uniform(data.panels[0])
+        assert results[1] == CalculateStress.calculate_threeside_uniform(data.panels[1])
+        assert results[2] == CalculateStress.calculate_circular_uniform(data.panels[2])
+        assert [result["solver"] for result in results] == ["nonlinear", "nonlinear", "nonlinear", "table"]
+        assert results[2]["coefficient_version"] is None
+        assert results[2]["sigma"] < results[3]["sigma"]
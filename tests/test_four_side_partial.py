@@ -1,5 +1,6 @@
+import numpy as np
 from app.services.glass_calculator.glass_layer import GlassLayer
-from app.services.glass_calculator.contracts.enums import InterlayerMaterialTypeEnum
+from app.services.glass_calculator.contracts.enums import InterlayerMaterialTypeEnum, LookupModeEnum
 from app.services.glass_calculator.fourside.partial import FourSidePartialLoadGlass
 import pytest
 
@@ -106,7 +107,7 @@ class TestFourSidePartialLoadGlass:
                 glass_layer,
                 1.0,
                 10,
-                20,
+                10,
                 glass_material
             )
             
@@ -152,13 +153,13 @@ class TestFourSidePartialLoadGlass:
                 glass_layer,
                 1.0,
                 10,
-                20,
+                10,
                 glass_material
             )
             
             stress = plate.calculate_stress()
             
-            expected = 3.226 * (1 * 10 * 20) / (12**2)
+            expected = 3.226 * (1 * 10 * 10) / (12**2)
             assert pytest.approx(stress, 0.001) == expected
     
     class TestCalculateDisplacement:
@@ -197,11 +198,135 @@ class TestFourSidePartialLoadGlass:
                 glass_layer,
                 1.0,
                 10,
-                20,
+                10,
                 glass_material
             )
             
             displacement = plate.calculate_displacement()
             
-            expected = 0.188 * (1 * 10 * 20 * 1000**2) / (71600 * 12**3)
+            expected = 0.188 * (1 * 10 * 10 * 1000**2) / (71600 * 12**3)
             assert pytest.approx(displacement, 0.001) == expected
+
+    class TestCalculateBatch:
+        """一括計算メソッドのテスト"""
+
+        def test_batch_matches_single_calculation(self):
+            """一括計算の結果が1枚ずつの計算結果と一致すること"""
+            glass_material = GlassMaterial()
+            panels = [(1000, 1000, 10, 10), (1000, 2000, 10, 20), (1000, 1300, 300, 500), (1000, 1800, 500, 1500)]
+            a, b, a1, b1 = (np.array(column, dtype=np.float64) for column in zip(*panels))
+            thickness = np.full(len(panels), 12.0)
+            w = np.ones(len(panels))
+            E = np.full(len(panels), glass_material.E, dtype=np.float64)
+
+            result = FourSidePartialLoadGlass.calculate_batch(a, b, thickness, w, a1, b1, E)
+
+            glass_layer = GlassLayer([6, 6], InterlayerMaterialTypeEnum.SG) # type: ignore
+            for i, (short_edge, long_edge, load_a, load_b) in enumerate(panels):
+                plate = FourSidePartialLoadGlass(short_edge, long_edge, glass_layer, 1.0, load_a, load_b, glass_material)
+                assert result["sigma"][i] == plate.calculate_stress()
+                assert result["delta"][i] == plate.calculate_displacement()
+                assert result["error"][i] is None
+
+        def test_batch_reports_errors_per_row(self):
+            """係数テーブルの範囲外の行だけがエラーになること"""
+            a = np.array([1000, 1000, 1000, 1000], dtype=np.float64)
+            b = np.array([2500, 1000, 1300, 1000], dtype=np.float64)
+            a1 = np.array([100, 5, 700, 100], dtype=np.float64)
+            b1 = np.array([100, 100, 1300, 100], dtype=np.float64)
+
+            result = FourSidePartialLoadGlass.calculate_batch(
+                a, b, np.full(4, 12.0), np.ones(4), a1, b1, np.full(4, 71600.0)
+            )
+
+            assert result["error"][0] == "b/a is smaller than 1 or greater than 2. use FEM instead"
+            assert result["error"][1] == "a is greater than 1 or smaller than 0.01. use FEM instead"
+            assert result["error"][2] == "b1/a is smaller than 0.01 or greater than 1.2. use FEM instead"
+            assert result["error"][3] is None
+
+    class TestLookupMode:
+        """係数の求め方（3重線形補間）のテスト"""
+
+        def test_linear_matches_table_on_grid_points(self):
+            """表の格子点では表の値と一致すること"""
+            glass_layer = GlassLayer([6, 6], InterlayerMaterialTypeEnum.SG) # type: ignore
+            plate = FourSidePartialLoadGlass(
+                1000, 1400, glass_layer, 1.0, 400, 800, GlassMaterial(), LookupModeEnum.LINEAR
+            )
+
+            coeff = plate._calculate_coeff()
+
+            assert coeff["alpha"] == pytest.approx(0.122)
+            assert coeff["beta"] == pytest.approx(0.778)
+
+        def test_step_matches_linear_on_grid_points(self):
+            """表の格子点では表の行の値（step）と3重線形補間（linear）が一致すること"""
+            glass_layer = GlassLayer([6, 6], InterlayerMaterialTypeEnum.SG) # type: ignore
+            table = FourSidePartialLoadGlass.coefficient_table
+            for i, b_by_a in enumerate(table.axes["b_by_a"]):
+                for j, a1_by_a in enumerate(table.axes["a1_by_a"]):
+                    for k, b1_by_a in enumerate(table.axes["b1_by_a"][i][:FourSidePartialLoadGlass.b1_count[i]]):
+                        a = 1000.0
+                        coeffs = [
+                            FourSidePartialLoadGlass(
+                                a, b_by_a * a, glass_layer, 1.0, a1_by_a * a, b1_by_a * a, GlassMaterial(), mode
+                            )._calculate_coeff()
+                            for mode in (LookupModeEnum.STEP, LookupModeEnum.LINEAR)
+                        ]
+                        assert coeffs[0]["beta"] == table.values["beta"][i, j, k]
+                        assert coeffs[1]["beta"] == pytest.approx(coeffs[0]["beta"], rel=1e-9)
+                        assert coeffs[1]["alpha"] == pytest.approx(coeffs[0]["alpha"], rel=1e-9)
+
+        def test_step_uses_b1_axis(self):
+            """表の行の値（step）は b'/a の軸で b'/a の添字を求めること（b/a=1, a'/a=0.2, b'/a=0.4）"""
+            glass_layer = GlassLayer([6, 6], InterlayerMaterialTypeEnum.SG) # type: ignore
+            plate = FourSidePartialLoadGlass(1000, 1000, glass_layer, 1.0, 200, 400, GlassMaterial())
+
+            assert plate._calculate_coeff()["beta"] == 1.024
+
+        def test_linear_interpolates_between_grid_points(self):
+            """格子点の間では前後の格子点の値を線形補間すること"""
+            glass_layer = GlassLayer([6, 6], InterlayerMaterialTypeEnum.SG) # type: ignore
+            plate = FourSidePartialLoadGlass(
+                1000, 1200, glass_layer, 1.0, 300, 200, GlassMaterial(), LookupModeEnum.LINEAR
+            )
+
+            coeff = plate._calculate_coeff()
+
+            # b/a = 1 と 1.4 の中間、a'/a = 0.2 と 0.4 の中間、b'/a = 0.2
+            # （b/a = 1.4 の行は b'/a = 0.01 と 0.4 の間を補間）
+            v = (0.2 - 0.01) / (0.4 - 0.01)
+            row_1 = (1.206 + 1.024) / 2
+            row_14 = ((1.683 + 1.286) / 2) * (1 - v) + ((1.2 + 0.968) / 2) * v
+            assert coeff["beta"] == pytest.approx((row_1 + row_14) / 2)
+
+        def test_linear_b1_out_of_range(self):
+            """補間に使う行の b'/a の範囲外の場合にエラーが発生すること"""
+            glass_layer = GlassLayer([6, 6], InterlayerMaterialTypeEnum.SG) # type: ignore
+            with pytest.raises(ValueError, match="b1/a is smaller than 0.01 or greater than 1.2. use FEM instead"):
+                FourSidePartialLoadGlass(
+                    1000, 1800, glass_layer, 1.0, 300, 1500, GlassMaterial(), LookupModeEnum.LINEAR
+                )
+
+        def test_linear_batch_matches_single_calculation(self):
+            """一括計算の結果が1枚ずつの計算結果と一致すること"""
+            glass_material = GlassMaterial()
+            panels = [(1000, 1000, 10, 10), (1000, 1200, 300, 200), (1000, 1700, 450, 1100), (1000, 1800, 300, 1500)]
+            a, b, a1, b1 = (np.array(column, dtype=np.float64) for column in zip(*panels))
+            count = len(panels)
+
+            result = FourSidePartialLoadGlass.calculate_batch(
+                a, b, np.full(count, 12.0), np.ones(count), a1, b1, np.full(count, glass_material.E, dtype=np.float64),
+                LookupModeEnum.LINEAR,
+            )
+
+            glass_layer = GlassLayer([6, 6], InterlayerMaterialTypeEnum.SG) # type: ignore
+            for i, (short_edge, long_edge, load_a, load_b) in enumerate(panels[:3]):
+                plate = FourSidePartialLoadGlass(
+                    short_edge, long_edge, glass_layer, 1.0, load_a, load_b, glass_material, LookupModeEnum.LINEAR
+                )
+                assert result["sigma"][i] == plate.calculate_stress()
+                assert result["delta"][i] == plate.calculate_displacement()
+                assert result["error"][i] is None
+            assert result["error"][3] == "b1/a is smaller than 0.01 or greater than 1.2. use FEM instead"
+            assert np.isnan(result["sigma"][3])
@@ -1,6 +1,7 @@
 import pytest
+import numpy as np
 from app.services.glass_calculator.glass_layer import GlassLayer
-from app.services.glass_calculator.contracts.enums import InterlayerMaterialTypeEnum
+from app.services.glass_calculator.contracts.enums import InterlayerMaterialTypeEnum, LookupModeEnum
 from app.services.glass_calculator.fourside.uniform import FourSideUniformLoadGlass
 from app.services.glass_calculator.glass_material import GlassMaterial
 
@@ -164,3 +165,75 @@ class TestFourSideUniformLoadGlass:
             # thickness**3 は 125 (5^3)
             expected = (0.116 * (0.5 * 100**4)) / (125 * E)
             assert pytest.approx(displacement, 0.001) == expected
+
+    class TestCalculateBatch:
+        """一括計算メソッドのテスト"""
+
+        def test_batch_matches_single_calculation(self):
+            """一括計算の結果が1枚ずつの計算結果と一致すること"""
+            glass_material = GlassMaterial()
+            panels = [(100, 100, [6, 6], 1.0), (100, 200, [5], 0.5), (100, 130, [8], 2.0)]
+            a = np.array([panel[0] for panel in panels], dtype=np.float64)
+            b = np.array([panel[1] for panel in panels], dtype=np.float64)
+            w = np.array([panel[3] for panel in panels], dtype=np.float64)
+            E = np.full(len(panels), glass_material.E, dtype=np.float64)
+            thickness = GlassLayer.get_equivalent_thickness_batch(
+                [panel[2] for panel in panels], InterlayerMaterialTypeEnum.SG
+            )
+
+            result = FourSideUniformLoadGlass.calculate_batch(a, b, thickness, w, E)
+
+            for i, (short_edge, long_edge, layer, load) in enumerate(panels):
+                glass_layer = GlassLayer(layer, InterlayerMaterialTypeEnum.SG)  # type: ignore
+                plate = FourSideUniformLoadGlass(short_edge, long_edge, glass_layer, load, glass_material)
+                assert result["sigma"][i] == plate.calculate_stress()
+                assert result["delta"][i] == plate.calculate_displacement()
+                assert result["error"][i] is None
+
+        def test_batch_reports_errors_per_row(self):
+            """不正な行だけがエラーになり、他の行は計算されること"""
+            a = np.array([200, 100, 100], dtype=np.float64)
+            b = np.array([100, 600, 100], dtype=np.float64)
+            thickness = np.full(3, 12.0)
+            w = np.ones(3)
+            E = np.full(3, 71600.0)
+
+            result = FourSideUniformLoadGlass.calculate_batch(a, b, thickness, w, E)
+
+            assert result["error"][0] == "短辺が長辺より長くなることはできません"
+            assert result["error"][1] == "b/aが5を超えています。代わりにFEMを使用してください"
+            assert result["error"][2] is None
+            assert np.isnan(result["sigma"][:2]).all()
+            assert pytest.approx(result["sigma"][2], 0.001) == (0.272 * 100**2) / 144
+
+    class TestLookupMode:
+        """係数の求め方（step, linear）のテスト"""
+
+        def test_linear_interpolates_between_rows(self):
+            """linearでは表の行の間の係数を線形補間すること"""
+            glass_layer = GlassLayer([8], InterlayerMaterialTypeEnum.SG)  # type: ignore
+            plate = FourSideUniformLoadGlass(100, 110, glass_layer, 1.0, GlassMaterial(), LookupModeEnum.LINEAR)
+            assert pytest.approx(plate.beta) == (0.272 + 0.362) / 2
+            assert pytest.approx(plate.alpha) == (0.047 + 0.065) / 2
+
+        def test_linear_matches_step_on_rows(self):
+            """表の行の辺長比ではlinearとstepが一致すること"""
+            glass_layer = GlassLayer([8], InterlayerMaterialTypeEnum.SG)  # type: ignore
+            for ratio in [1, 1.2, 1.5, 2, 3, 4, 5]:
+                step = FourSideUniformLoadGlass(100, 100 * ratio, glass_layer, 1.0, GlassMaterial())
+                linear = FourSideUniformLoadGlass(100, 100 * ratio, glass_layer, 1.0, GlassMaterial(), LookupModeEnum.LINEAR)
+                assert linear.calculate_stress() == pytest.approx(step.calculate_stress())
+
+        def test_batch_linear_matches_single_calculation(self):
+            """一括計算のlinearが1枚ずつの計算と一致すること"""
+            a = np.array([100, 100, 100], dtype=np.float64)
+            b = np.array([110, 170, 460], dtype=np.float64)
+            result = FourSideUniformLoadGlass.calculate_batch(
+                a, b, np.full(3, 8.0), np.ones(3), np.full(3, 71600.0), LookupModeEnum.LINEAR
+            )
+
+            glass_layer = GlassLayer([8], InterlayerMaterialTypeEnum.SG)  # type: ignore
+            for i in range(3):
+                plate = FourSideUniformLoadGlass(a[i], b[i], glass_layer, 1.0, GlassMaterial(), LookupModeEnum.LINEAR)
+                assert result["sigma"][i] == plate.calculate_stress()
+                assert result["delta"][i] == plate.calculate_displacement()
@@ -0,0 +1,72 @@
+import pickle
+
+import pytest
+
+from app.services.glass_calculator.contracts.enums import InterlayerMaterialTypeEnum, LoadDurationEnum
+from app.services.glass_calculator.glass_layer import GlassLayer
+from app.services.glass_calculator.glass_material import GlassMaterial
+from app.services.glass_calculator.laminate import effective_thickness
+
+
+class TestGlassLayer:
+    """ガラス層の値オブジェクトのテスト"""
+
+    def test_interned(self):
+        """同じ積層構成・中間膜の条件であれば同じオブジェクトを共有すること"""
+        layer = GlassLayer([6, 8], InterlayerMaterialTypeEnum.PVB, span=1000)
+
+        assert GlassLayer((6.0, 8.0), InterlayerMaterialTypeEnum.PVB, span=1000.0) is layer
+        assert GlassLayer([6, 8], InterlayerMaterialTypeEnum.PVB, span=1200) is not layer
+        assert GlassLayer([6, 8], InterlayerMaterialTypeEnum.PVB, load_duration=LoadDurationEnum.MONTH, span=1000) != layer
+        assert pickle.loads(pickle.dumps(layer)) is layer
+
+    def test_sg_ignores_interlayer_conditions(self):
+        """SG・単板は中間膜の条件によらず同じオブジェクトとなり、有効板厚は合計板厚であること"""
+        layer = GlassLayer([6, 8], InterlayerMaterialTypeEnum.SG, load_duration=LoadDurationEnum.PERMANENT, span=1000)
+        single = GlassLayer([10], InterlayerMaterialTypeEnum.PVB, temperature=50, span=1000)
+
+        assert GlassLayer([6, 8], InterlayerMaterialTypeEnum.SG) is layer
+        assert GlassLayer([10], InterlayerMaterialTypeEnum.PVB) is single
+        assert layer.get_equivalent_thickness() == layer.get_stress_thickness() == 14
+        assert single.get_equivalent_thickness() == 10
+
+    def test_cached_thickness(self):
+        """有効板厚とその2乗・3乗は laminate の計算と一致すること"""
+        layer = GlassLayer([6, 6], InterlayerMaterialTypeEnum.PVB, span=1000)
+        deflection, stress = effective_thickness(
+            (6.0, 6.0), InterlayerMaterialTypeEnum.PVB, 0.76, LoadDurationEnum.GUST, 20.0, 1000.0, 71600.0
+        )
+
+        assert layer.get_equivalent_thickness() == deflection
+        assert layer.get_stress_thickness() == stress
+        assert layer.get_stress_thickness_squared() == stress ** 2
+        assert layer.get_equivalent_thickness_cubed() == deflection ** 3
+        assert layer.get_outer_layer_thickness() == (6, 6)
+
+    def test_immutable(self):
+        """属性は変更できないこと"""
+        layer = GlassLayer([6], InterlayerMaterialTypeEnum.SG)
+
+        with pytest.raises(AttributeError):
+            layer.layers = (8.0,)  # type: ignore
+        with pytest.raises(AttributeError):
+            layer.extra = 1  # type: ignore
+
+    def test_empty_layers(self):
+        """板厚が空の場合、外側の板厚は求められないこと"""
+        with pytest.raises(IndexError):
+            GlassLayer([], InterlayerMaterialTypeEnum.SG).get_outer_layer_thickness()
+
+
+class TestGlassMaterial:
+    """ガラス材料の値オブジェクトのテスト"""
+
+    def test_interned_and_immutable(self):
+        """同じ定数であれば同じオブジェクトを共有し、変更できないこと"""
+        material = GlassMaterial()
+
+        assert GlassMaterial(71600.0, 0.3) is material
+        assert GlassMaterial(70000, 0.22) != material
+        assert pickle.loads(pickle.dumps(material)) is material
+        with pytest.raises(AttributeError):
+            material.E = 70000  # type: ignore
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from app.schemas.glass import IGUInputScheme
+from app.services.glass_calculator.igu import InsulatingGlassUnit
+
+
+def make_unit(**kwargs) -> IGUInputScheme:
+    data = {"a": 1000, "b": 1500, "outer": {"t": [6]}, "inner": {"t": [6]}, "cavity": 12, "w": 0.002}
+    data.update(kwargs)
+    return IGUInputScheme(**data)  # type: ignore
+
+
+class TestInsulatingGlassUnit:
+    """複層ガラスの荷重分担の計算クラスのテスト"""
+
+    def test_loads_sum_to_wind_pressure(self):
+        """外側・内側のガラスの荷重の和が風圧と等しく、同じ構成のガラスはほぼ半分ずつ分担すること"""
+        result = InsulatingGlassUnit.calculate_batch([make_unit()])[0]
+
+        assert result["outer"]["load"] + result["inner"]["load"] == pytest.approx(0.002)
+        assert result["inner"]["load"] == pytest.approx(0.001, rel=0.1)
+        assert result["cavity_pressure"] == result["inner"]["load"]
+
+    def test_stiffer_pane_takes_larger_share(self):
+        """剛性の大きいガラスが大きな荷重を分担すること"""
+        result = InsulatingGlassUnit.calculate_batch([make_unit(inner={"t": [10]})])[0]
+
+        assert result["inner"]["load"] > 0.0015
+        assert result["inner"]["sigma"] > result["outer"]["sigma"]
+
+    def test_isochore_pressure_from_temperature(self):
+        """中空層の温度の上昇による等容圧力は状態方程式の値（約0.34kPa/K）となり、ガラスの変形で小さくなること"""
+        result = InsulatingGlassUnit.calculate_batch([make_unit(w=0.0, delta_temperature=20)])[0]
+
+        assert result["isochore_pressure"] == pytest.approx(101.3e-3 * 20 / 293.15)
+        assert 0 < result["cavity_pressure"] < result["isochore_pressure"]
+        assert result["outer"]["load"] == -result["inner"]["load"]
+
+    def test_solve_cavity_pressure_satisfies_gas_law(self):
+        """収束した中空層の圧力が状態方程式を満たすこと"""
+        volume = np.array([1.8e7, 1.8e7])
+        outer_volume = np.array([2.0e9, 1.0e7])
+        inner_volume = np.array([2.0e9, 3.0e8])
+        w = np.array([0.003, -0.001])
+
+        result = InsulatingGlassUnit.solve_cavity_pressure(
+            w, volume, outer_volume, inner_volume, np.full(2, 0.1013), np.full(2, 293.15),
+            np.array([15.0, -20.0]), np.array([0.002, -0.001]), np.array([300.0, 0.0]),
+        )
+
+        outside = 0.1013 - np.array([0.002, -0.001]) - 0.012e-3 * np.array([300.0, 0.0])
+        p = result["cavity_pressure"]
+        current = volume - outer_volume * (w - p) + inner_volume * p
+        assert (outside + p) * current == pytest.approx(0.1013 * volume * (293.15 + np.array([15.0, -20.0])) / 293.15)
+        assert result["converged"].all()
+
+    def test_batch_keeps_order_and_row_errors(self):
+        """一括計算が1ユニットずつの計算と一致し、エラーは行ごとに返ること"""
+        units = [
+            make_unit(),
+            make_unit(outer={"t": []}),
+            make_unit(support="circular-uniform", b=None),
+            make_unit(outer={"t": [5, 5], "interlayer": "pvb"}, inner={"t": [8], "glass_type": "tempered"}),
+        ]
+
+        results = InsulatingGlassUnit.calculate_batch(units)
+
+        assert results[0] == InsulatingGlassUnit.calculate_batch([units[0]])[0]
+        assert results[1] == {"error": "板厚が指定されていません"}
+        assert results[2] == InsulatingGlassUnit.calculate_batch([units[2]])[0]
+        assert results[3] == InsulatingGlassUnit.calculate_batch([units[3]])[0]
+        assert "error" not in results[3]
@@ -0,0 +1,157 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+
+from app.api.v1 import jobs
+from app.schemas.glass import BatchItemScheme
+from app.services.glass_calculator.glass_calculator import CalculateStress
+from app.services.job_queue.job_queue import JobQueue
+
+panels_adapter = TypeAdapter(list[BatchItemScheme])
+
+
+def _panels(count: int):
+    return panels_adapter.validate_python(
+        [{"support": "four-uniform", "a": 100, "b": 100, "t": [6, 6], "w": 1.0}] * count
+    )
+
+
+class TestJobQueue:
+    """一括計算ジョブのキューのテスト"""
+
+    def test_submit_splits_into_chunks(self, tmp_path):
+        """ジョブがチャンクに分割されて登録されること"""
+        queue = JobQueue(str(tmp_path / "jobs.sqlite3"))
+
+        status = queue.submit(_panels(5), chunk_size=2)
+
+        assert status["status"] == "queued"
+        assert status["total_rows"] == 5
+        assert status["total_chunks"] == 3
+        assert status["progress"] == 0.0
+
+    def test_process_all_chunks(self, tmp_path):
+        """全てのチャンクを処理するとジョブが完了し、入力順の結果が得られること"""
+        queue = JobQueue(str(tmp_path / "jobs.sqlite3"))
+        job_id = queue.submit(_panels(5), chunk_size=2)["id"]
+
+        while queue.process_next_chunk():
+            pass
+
+        status = queue.get_status(job_id)
+        results = list(queue.iter_results(job_id))
+        assert status["status"] == "done"  # type: ignore
+        assert len(results) == 5
+        assert results[0]["sigma"] == round((0.272 * (1.0 * 100**2)) / 144, 2)
+
+    def test_resume_after_restart(self, tmp_path, monkeypatch):
+        """再起動後は完了したチャンクを再計算せずに続きから処理すること"""
+        path = str(tmp_path / "jobs.sqlite3")
+        queue = JobQueue(path)
+        job_id = queue.submit(_panels(4), chunk_size=2)["id"]
+        assert queue.process_next_chunk()
+
+        restarted = JobQueue(path)
+        calls = []
+        original = restarted._complete_chunk
+        monkeypatch.setattr(
+            restarted, "_complete_chunk", lambda *args: calls.append(args[1]) or original(*args)
+        )
+        while restarted.process_next_chunk():
+            pass
+
+        assert calls == [1]
+        assert restarted.get_status(job_id)["status"] == "done"  # type: ignore
+
+    def test_expired_lease_is_reclaimed(self, tmp_path):
+        """ワーカーが停止してリースが切れたチャンクは再処理されること"""
+        queue = JobQueue(str(tmp_path / "jobs.sqlite3"), lease_seconds=-1)
+        job_id = queue.submit(_panels(1), chunk_size=1)["id"]
+        assert queue._claim_chunk() is not None  # 計算途中で停止したワーカー
+
+        assert queue.process_next_chunk()
+        assert queue.get_status(job_id)["status"] == "done"  # type: ignore
+
+    def test_unknown_job(self, tmp_path):
+        """存在しないジョブはNoneを返すこと"""
+        queue = JobQueue(str(tmp_path / "jobs.sqlite3"))
+
+        assert queue.get_status("unknown") is None
+
+    def test_failed_chunk_is_retried(self, tmp_path, monkeypatch):
+        """計算に失敗したチャンクは再処理され、成功すればジョブが完了すること"""
+        queue = JobQueue(str(tmp_path / "jobs.sqlite3"))
+        job_id = queue.submit(_panels(2), chunk_size=1)["id"]
+        original = CalculateStress.calculate_batch_rows
+        failures = iter([RuntimeError("一時的なエラー")])
+
+        def flaky(panels):
+            error = next(failures, None)
+            if error is not None:
+                raise error
+            return original(panels)
+
+        monkeypatch.setattr(CalculateStress, "calculate_batch_rows", staticmethod(flaky))
+        while queue.process_next_chunk():
+            pass
+
+        status = queue.get_status(job_id)
+        assert status["status"] == "done"  # type: ignore
+        assert status["failed_chunks"] == 0  # type: ignore
+        assert len(list(queue.iter_results(job_id))) == 2
+
+    def test_chunk_fails_after_max_attempts(self, tmp_path, monkeypatch):
+        """上限まで失敗したチャンクはジョブを失敗とし、他のチャンクの結果は行ごとのエラーと共に返すこと"""
+        queue = JobQueue(str(tmp_path / "jobs.sqlite3"), max_attempts=2)
+        job_id = queue.submit(_panels(5), chunk_size=2)["id"]
+        original = CalculateStress.calculate_batch_rows
+        calls = []
+
+        def failing_second_chunk(panels):
+            calls.append(len(panels))
+            if len(calls) == 2 or len(calls) == 3:
+                raise RuntimeError("計算エラー")
+            return original(panels)
+
+        monkeypatch.setattr(CalculateStress, "calculate_batch_rows", staticmethod(failing_second_chunk))
+        while queue.process_next_chunk():
+            pass
+
+        status = queue.get_status(job_id)
+        results = list(queue.iter_results(job_id))
+        assert status["status"] == "failed"  # type: ignore
+        assert status["error"] == "計算エラー"  # type: ignore
+        assert (status["done_chunks"], status["failed_chunks"]) == (2, 1)  # type: ignore
+        assert len(calls) == 4
+        assert len(results) == 5
+        assert results[2] == results[3] == {"error": "計算エラー"}
+        assert "sigma" in results[0] and "sigma" in results[4]
+
+    def test_partial_results_of_running_job(self, tmp_path):
+        """実行中のジョブは先頭から続けて完了したチャンクまでの結果を返すこと"""
+        queue = JobQueue(str(tmp_path / "jobs.sqlite3"))
+        job_id = queue.submit(_panels(5), chunk_size=2)["id"]
+
+        assert list(queue.iter_results(job_id)) == []
+        assert queue.process_next_chunk()
+        assert queue._claim_chunk() is not None  # 2番目のチャンクは計算中
+        assert queue.process_next_chunk()
+
+        assert queue.get_status(job_id)["status"] == "running"  # type: ignore
+        assert len(list(queue.iter_results(job_id))) == 2
+
+    def test_results_endpoint_serves_running_job(self, tmp_path, monkeypatch):
+        """/results は完了前のジョブにも完了したチャンクの結果と状態を返すこと"""
+        queue = JobQueue(str(tmp_path / "jobs.sqlite3"))
+        job_id = queue.submit(_panels(3), chunk_size=2)["id"]
+        assert queue.process_next_chunk()
+        monkeypatch.setattr(jobs, "get_job_queue", lambda: queue)
+        app = FastAPI()
+        app.include_router(jobs.router, prefix="/jobs")
+
+        response = TestClient(app).get(f"/jobs/{job_id}/results")
+
+        assert response.status_code == 200
+        assert response.headers["x-job-status"] == "running"
+        assert len(response.text.splitlines()) == 2
@@ -0,0 +1,172 @@
+import numpy as np
+import pytest
+
+from app.schemas.glass import BatchInputScheme, FourSideUniformInputScheme
+from app.services.glass_calculator.contracts.enums import InterlayerMaterialTypeEnum, LoadDurationEnum
+from app.services.glass_calculator.glass_calculator import CalculateStress
+from app.services.glass_calculator.glass_layer import GlassLayer
+from app.services.glass_calculator.laminate import (
+    effective_thickness,
+    effective_thickness_batch,
+    get_shear_modulus_table,
+    shear_modulus,
+)
+from app.services.result_cache.result_cache import get_result_cache
+
+
+class TestShearModulus:
+    """中間膜のせん断弾性係数のテスト"""
+
+    def test_table_point(self):
+        """表の点では表の値を返すこと"""
+        table = get_shear_modulus_table(InterlayerMaterialTypeEnum.PVB)
+
+        assert shear_modulus(InterlayerMaterialTypeEnum.PVB, LoadDurationEnum.GUST, 20.0) == pytest.approx(
+            table.values[2, 0]
+        )
+
+    def test_decreases_with_duration_and_temperature(self):
+        """荷重の継続時間が長いほど、温度が高いほど小さくなること"""
+        gust = shear_modulus(InterlayerMaterialTypeEnum.PVB, LoadDurationEnum.GUST, 25.0)
+
+        assert shear_modulus(InterlayerMaterialTypeEnum.PVB, LoadDurationEnum.DAY, 25.0) < gust
+        assert shear_modulus(InterlayerMaterialTypeEnum.PVB, LoadDurationEnum.GUST, 35.0) < gust
+
+    def test_sg_has_no_table(self):
+        """SGは表が無い（完全一体として扱う）こと"""
+        with pytest.raises(ValueError):
+            get_shear_modulus_table(InterlayerMaterialTypeEnum.SG)
+
+
+class TestEffectiveThickness:
+    """合わせガラスの有効板厚のテスト"""
+
+    def test_two_plies_matches_wolfel_bennison(self):
+        """2層の場合は（合計板厚の上限に達しない範囲で）Wölfel–Bennisonの式と一致すること"""
+        h1, h2, hv, a, E = 6.0, 8.0, 1.52, 1200.0, 71600.0
+        G = shear_modulus(InterlayerMaterialTypeEnum.PVB, LoadDurationEnum.GUST, 30.0)
+        hs = (h1 + h2) / 2 + hv
+        hs1, hs2 = hs * h1 / (h1 + h2), hs * h2 / (h1 + h2)
+        Is = h1 * hs2 ** 2 + h2 * hs1 ** 2
+        gamma = 1 / (1 + 9.6 * E * Is * hv / (G * hs ** 2 * a ** 2))
+        deflection = (h1 ** 3 + h2 ** 3 + 12 * gamma * Is) ** (1 / 3)
+        stress = min(
+            (deflection ** 3 / (h1 + 2 * gamma * hs2)) ** 0.5, (deflection ** 3 / (h2 + 2 * gamma * hs1)) ** 0.5
+        )
+
+        result = effective_thickness((h1, h2), InterlayerMaterialTypeEnum.PVB, hv, LoadDurationEnum.GUST, 30.0, a, E)
+
+        assert max(result) < h1 + h2
+        assert result == pytest.approx((deflection, stress), rel=1e-12)
+
+    def test_capped_at_monolithic(self):
+        """せん断結合が強い場合（既定の条件: 瞬間・20℃）も有効板厚は合計板厚（SG）を超えないこと"""
+        deflection, stress = effective_thickness(
+            (5.0, 5.0), InterlayerMaterialTypeEnum.PVB, 0.76, LoadDurationEnum.GUST, 20.0, 1000.0, 71600.0
+        )
+
+        assert deflection == stress == 10
+
+    def test_bounded_by_layered_and_monolithic(self):
+        """有効板厚はせん断結合なし（各層の3乗和）と完全一体（合計板厚）の間にあること"""
+        layers = (5.0, 5.0, 5.0)
+        deflection, stress = effective_thickness(
+            layers, InterlayerMaterialTypeEnum.EVA, 0.76, LoadDurationEnum.MONTH, 30.0, 1500.0, 71600.0
+        )
+        layered = effective_thickness(
+            layers, InterlayerMaterialTypeEnum.EVA, 0.76, LoadDurationEnum.MONTH, 30.0, 0.0, 71600.0
+        )
+
+        assert layered[0] == pytest.approx(3 ** (1 / 3) * 5)
+        assert layered[0] < deflection <= sum(layers)
+        assert layered[1] < stress
+
+    def test_batch_matches_single(self):
+        """一括計算が1構成ずつの計算（メモ化した値）と一致し、SG・単板・空の構成は合計板厚となること"""
+        layers = [[6, 6], [8], [4, 6, 8], [6, 6], []]
+        interlayer = [
+            InterlayerMaterialTypeEnum.PVB,
+            InterlayerMaterialTypeEnum.PVB,
+            InterlayerMaterialTypeEnum.EVA,
+            InterlayerMaterialTypeEnum.SG,
+            InterlayerMaterialTypeEnum.PVB,
+        ]
+        durations = [LoadDurationEnum.GUST, LoadDurationEnum.GUST, LoadDurationEnum.HOUR, LoadDurationEnum.GUST, LoadDurationEnum.GUST]
+        span = np.array([1000, 1000, 1500, 1000, 1000], dtype=np.float64)
+
+        result = effective_thickness_batch(layers, interlayer, 0.76, durations, 20.0, span, 71600.0)
+
+        for i in range(3):
+            expected = effective_thickness(
+                tuple(float(t) for t in layers[i]), interlayer[i], 0.76, durations[i], 20.0, span[i], 71600.0
+            )
+            assert (result["deflection"][i], result["stress"][i]) == pytest.approx(expected, rel=1e-12)
+        assert result["deflection"][1] == result["stress"][1] == 8
+        assert result["deflection"][3] == result["stress"][3] == 12
+        assert result["deflection"][4] == result["stress"][4] == 0
+
+    def test_batch_all_empty(self):
+        """全ての構成が空の場合も板厚0を返すこと"""
+        result = effective_thickness_batch([[], []], [InterlayerMaterialTypeEnum.PVB] * 2, 0.76, [LoadDurationEnum.GUST] * 2, 20.0, 1000.0, 71600.0)
+
+        assert result["deflection"].tolist() == result["stress"].tolist() == [0, 0]
+
+    def test_glass_layer_sg_is_total_thickness(self):
+        """SGは従来どおり合計板厚であること"""
+        layer = GlassLayer([6, 8], InterlayerMaterialTypeEnum.SG, span=1000)
+
+        assert layer.get_equivalent_thickness() == layer.get_stress_thickness() == 14
+
+
+class TestCalculateStressInterlayer:
+    """中間膜の指定のテスト"""
+
+    def test_pvb_is_more_flexible_than_sg(self):
+        """PVB（長期・高温）はSGより応力・変位が大きくなること"""
+        sg = CalculateStress.calculate_fourside_uniform(
+            FourSideUniformInputScheme(a=1000, b=1500, t=[6, 6], w=0.002)  # type: ignore
+        )
+        pvb = CalculateStress.calculate_fourside_uniform(
+            FourSideUniformInputScheme(a=1000, b=1500, t=[6, 6], w=0.002, interlayer="pvb", load_duration="50year", temperature=40)  # type: ignore
+        )
+
+        assert pvb["sigma"] > sg["sigma"]
+        assert pvb["delta"] > sg["delta"]
+
+    def test_pvb_default_not_stiffer_than_sg(self):
+        """既定の条件（瞬間・20℃）でもPVBはSGより応力・変位が小さくならないこと"""
+        sg = CalculateStress.calculate_fourside_uniform(
+            FourSideUniformInputScheme(a=1000, b=1500, t=[5, 5], w=0.002)  # type: ignore
+        )
+        pvb = CalculateStress.calculate_fourside_uniform(
+            FourSideUniformInputScheme(a=1000, b=1500, t=[5, 5], w=0.002, interlayer="pvb")  # type: ignore
+        )
+
+        assert pvb["sigma"] >= sg["sigma"]
+        assert pvb["delta"] >= sg["delta"]
+
+    def test_batch_matches_single_calculation(self):
+        """一括計算の合わせガラスの行が1枚ずつの計算結果と一致すること"""
+        panels = [
+            {"support": "four-uniform", "a": 1000, "b": 1500, "t": [6, 6], "w": 0.002, "interlayer": "pvb"},
+            {"support": "four-uniform", "a": 1000, "b": 1500, "t": [6, 6], "w": 0.002, "interlayer": "eva", "solver": "fem"},
+            {"support": "three-uniform", "free": 1000, "fix": 800, "t": [5, 5], "w": 0.002, "interlayer": "pvb", "temperature": 30},
+            {"support": "circular-uniform", "D": 1000, "t": [5, 5], "w": 0.002, "interlayer": "eva"},
+        ]
+        data = BatchInputScheme(panels=panels)  # type: ignore
+
+        results = CalculateStress.calculate_batch(data)["results"]
+        get_result_cache().clear()
+
+        assert results[0] == CalculateStress.calculate_fourside_uniform(data.panels[0])
+        assert results[1] == CalculateStress.calculate_fourside_uniform(data.panels[1])
+        assert results[2] == CalculateStress.calculate_threeside_uniform(data.panels[2])
+        assert results[3] == CalculateStress.calculate_circular_uniform(data.panels[3])
+
+    def test_batch_of_empty_layups(self):
+        """全ての行が空の構成の一括計算は、例外ではなく行ごとのエラーを返すこと"""
+        data = BatchInputScheme(panels=[{"support": "four-uniform", "a": 1000, "b": 1000, "t": [], "w": 0.001}] * 2)  # type: ignore
+
+        results = CalculateStress.calculate_batch(data)["results"]
+
+        assert results == [{"error": "板厚が指定されていません"}] * 2
@@ -0,0 +1,114 @@
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.glass import FourSideUniformInputScheme, LoadCombinationPanelScheme
+from app.services.glass_calculator.glass_calculator import CalculateStress
+from app.services.glass_calculator.load_combination import GLASS_UNIT_WEIGHT, LoadCombination
+
+
+def make_panel(**kwargs) -> LoadCombinationPanelScheme:
+    data = {
+        "support": "four-uniform",
+        "a": 1000,
+        "b": 1500,
+        "t": [8],
+        "slope": 15,
+        "cases": [
+            {"name": "G", "kind": "self_weight"},
+            {"name": "W+", "kind": "wind", "w": 0.002},
+            {"name": "W-", "kind": "wind", "w": -0.003},
+            {"name": "S", "kind": "snow", "w": 0.001},
+        ],
+    }
+    data.update(kwargs)
+    return LoadCombinationPanelScheme(**data)  # type: ignore
+
+
+class TestLoadCombination:
+    """荷重の組み合わせの計算クラスのテスト"""
+
+    def test_expand_combinations(self):
+        """自重を常に含め、同じ種類の荷重（正圧・負圧）は同時に組み合わせないこと"""
+        names = [name for name, _ in LoadCombination.expand_combinations(make_panel())]
+
+        assert names == ["G", "G+S", "G+W+", "G+W++S", "G+W-", "G+W-+S"]
+
+    def test_superposition_matches_single_calculation(self):
+        """単一の荷重の組み合わせは1枚ずつの計算と一致し、組み合わせは荷重の和の計算と一致すること"""
+        panel = make_panel(slope=90, combinations=[
+            {"name": "W", "factors": {"W+": 1}},
+            {"name": "W+S", "factors": {"W+": 1, "S": 1.5}},
+        ])
+
+        rows = LoadCombination.calculate_batch([panel], details=True)[0]["combinations"]
+        wind = CalculateStress.calculate_fourside_uniform(
+            FourSideUniformInputScheme(a=1000, b=1500, t=[8], w=0.002)  # type: ignore
+        )
+        combined = CalculateStress.calculate_fourside_uniform(
+            FourSideUniformInputScheme(a=1000, b=1500, t=[8], w=0.0035)  # type: ignore
+        )
+
+        assert (rows[0]["sigma"], rows[0]["delta"]) == (wind["sigma"], wind["delta"])
+        assert rows[0]["utilization"] == wind["utilization_short_term"]
+        assert rows[1]["sigma"] == pytest.approx(combined["sigma"], abs=0.01)
+
+    def test_terms_and_governing(self):
+        """長期の荷重のみの組み合わせは長期許容応力で検定し、検定比が最大の組み合わせを返すこと"""
+        result = LoadCombination.calculate_batch([make_panel()], details=True)[0]
+        rows = {row["name"]: row for row in result["combinations"]}
+
+        assert rows["G"]["term"] == rows["G+S"]["term"] == "long_term"
+        assert rows["G+W+"]["term"] == "short_term"
+        # 負圧は自重・積雪と打ち消し合う
+        assert rows["G+W-+S"]["sigma"] < rows["G+W-"]["sigma"]
+        assert result["governing"] == max(result["combinations"], key=lambda row: row["utilization"])
+
+    def test_self_weight_from_slope(self):
+        """自重は板厚と傾斜角から面外方向の成分を求め、鉛直のガラスでは0となること"""
+        flat = make_panel(slope=0, combinations=[{"factors": {"G": 1}}])
+        vertical = make_panel(slope=90, combinations=[{"factors": {"G": 1}}])
+        expected = CalculateStress.calculate_fourside_uniform(
+            FourSideUniformInputScheme(a=1000, b=1500, t=[8], w=GLASS_UNIT_WEIGHT * 8)  # type: ignore
+        )
+
+        results = LoadCombination.calculate_batch([flat, vertical])
+
+        assert results[0]["governing"]["sigma"] == expected["sigma"]
+        assert results[0]["governing"]["utilization"] == expected["utilization_long_term"]
+        assert results[1]["governing"]["sigma"] == 0
+
+    def test_laminated_uses_duration(self):
+        """合わせガラス（PVB）は継続時間の長い荷重ほど有効板厚が小さくなること"""
+        panel = make_panel(t=[6, 6], interlayer="pvb", cases=[
+            {"name": "short", "kind": "wind", "w": 0.002},
+            {"name": "long", "kind": "snow", "w": 0.002},
+        ])
+
+        rows = {row["name"]: row for row in LoadCombination.calculate_batch([panel], details=True)[0]["combinations"]}
+
+        assert rows["long"]["sigma"] > rows["short"]["sigma"]
+
+    def test_batch_keeps_order_and_row_errors(self):
+        """エラーは行ごとに返り、他の行の結果は1行ずつの計算と一致すること"""
+        panels = [
+            make_panel(),
+            make_panel(combinations=[{"factors": {"X": 1}}]),
+            make_panel(cases=[{"name": "S", "kind": "snow"}]),
+            make_panel(support="two-uniform", b=2000),
+            make_panel(b=6000),
+            make_panel(cases=[{"name": "W", "kind": "wind", "w": 0.001}, {"name": "W", "kind": "wind", "w": 0.002}]),
+        ]
+
+        results = LoadCombination.calculate_batch(panels)
+
+        assert results[0] == LoadCombination.calculate_batch([panels[0]])[0]
+        assert results[1] == {"error": "未定義の荷重ケース: X"}
+        assert results[2] == {"error": "荷重を入力してください: S"}
+        assert results[3] == LoadCombination.calculate_batch([panels[3]])[0]
+        assert results[4] == {"error": "b/aが5を超えています。代わりにFEMを使用してください"}
+        assert results[5] == {"error": "荷重ケースの名前が重複しています: W"}
+
+    def test_empty_combinations_rejected(self):
+        """組み合わせの空のリストは入力エラーとなること"""
+        with pytest.raises(ValidationError):
+            make_panel(combinations=[])
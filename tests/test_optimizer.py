@@ -0,0 +1,90 @@
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.glass import ThicknessOptimizationInputScheme
+
+from app.services.glass_calculator.contracts.enums import GlassTypeEnum, SupportTypeEnum
+from app.services.glass_calculator.optimizer import ThicknessOptimizer
+
+CATALOG = [3, 4, 5, 6, 8, 10, 12, 15, 19]
+
+
+class TestThicknessOptimizer:
+    """最小板厚の探索クラスのテスト"""
+
+    def test_lightest_single_layer(self):
+        """応力のみの場合に条件を満たす最も薄い単板が選ばれること"""
+        result = ThicknessOptimizer.optimize(
+            SupportTypeEnum.FOUR_UNIFORM, {"a": 1500, "b": 2500}, 0.003, 71600, GlassTypeEnum.TEMPERED, CATALOG, 1
+        )
+
+        assert result["t"] == [8]
+        assert result["sigma"] <= result["allowable_stress"] == 88.3
+        # 1つ薄い板厚は許容応力を超えること
+        assert (0.603 * 0.003 * 1500**2) / 6**2 > 88.3
+
+    def test_deflection_limit(self):
+        """変位の制限値を満たすまで板厚が増えること"""
+        without_limit = ThicknessOptimizer.optimize(
+            SupportTypeEnum.FOUR_UNIFORM, {"a": 1500, "b": 2500}, 0.003, 71600, GlassTypeEnum.TEMPERED, CATALOG, 1
+        )
+        with_limit = ThicknessOptimizer.optimize(
+            SupportTypeEnum.FOUR_UNIFORM, {"a": 1500, "b": 2500}, 0.003, 71600, GlassTypeEnum.TEMPERED, CATALOG, 1, 20
+        )
+
+        assert without_limit["delta"] > 20
+        assert with_limit["delta"] <= 20
+        assert sum(with_limit["t"]) > sum(without_limit["t"])
+
+    def test_pruned_candidates_are_not_evaluated(self):
+        """必要な等価板厚を下回る候補は評価されないこと"""
+        result = ThicknessOptimizer.optimize(
+            SupportTypeEnum.FOUR_UNIFORM, {"a": 1500, "b": 2500}, 0.003, 71600, GlassTypeEnum.FLOAT, CATALOG, 2, 15
+        )
+
+        assert result["candidates"] == 54
+        assert result["evaluated"] < result["candidates"]
+        assert result["delta"] <= 15
+
+    def test_stops_at_first_passing_layup(self):
+        """候補を軽い順に計算し、条件を満たす候補が見つかった時点で探索をやめること"""
+        catalog = [2 + 0.5 * i for i in range(20)]
+
+        result = ThicknessOptimizer.optimize(
+            SupportTypeEnum.FOUR_UNIFORM, {"a": 1500, "b": 2500}, 0.003, 71600, GlassTypeEnum.FLOAT, catalog, 4
+        )
+
+        assert result["candidates"] == 10625
+        assert result["evaluated"] <= 64
+        assert result["sigma"] <= result["allowable_stress"]
+
+    def test_layups_in_weight_order(self):
+        """積層構成が重さの軽い順（同じ重さは枚数の少ない順）に全て1回ずつ返されること"""
+        layups = list(ThicknessOptimizer.iter_layups([3, 4, 6], 3))
+
+        assert len(layups) == 3 + 6 + 10
+        assert layups[:5] == [[3], [4], [6], [3, 3], [3, 4]]
+        assert [(sum(layup), len(layup)) for layup in layups] == sorted((sum(layup), len(layup)) for layup in layups)
+        assert len({tuple(layup) for layup in layups}) == len(layups)
+
+    def test_catalog_length_limited(self):
+        """使用できる板厚の数は入力で制限されること"""
+        with pytest.raises(ValidationError):
+            ThicknessOptimizationInputScheme(
+                support="four-uniform", a=1500, b=2500, w=0.003, catalog=[2 + 0.5 * i for i in range(21)]  # type: ignore
+            )
+
+    def test_no_layup_satisfies(self):
+        """条件を満たす積層構成が無い場合にエラーを返すこと"""
+        result = ThicknessOptimizer.optimize(
+            SupportTypeEnum.CIRCULAR_UNIFORM, {"a": 1500}, 0.003, 71600, GlassTypeEnum.FLOAT, [3], 1
+        )
+
+        assert result["error"] == "条件を満たす積層構成がありません"
+
+    def test_out_of_table(self):
+        """形状が係数テーブルの範囲外の場合にエラーが発生すること"""
+        with pytest.raises(ValueError, match="b/aが5を超えています"):
+            ThicknessOptimizer.optimize(
+                SupportTypeEnum.FOUR_UNIFORM, {"a": 1000, "b": 6000}, 0.003, 71600, GlassTypeEnum.FLOAT, CATALOG, 1
+            )
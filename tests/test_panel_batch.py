@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+
+from app.schemas.glass import BatchInputScheme
+from app.services.glass_calculator.contracts.enums import (
+    GlassTypeEnum,
+    InterlayerMaterialTypeEnum,
+    LookupModeEnum,
+    SolverEnum,
+    SupportTypeEnum,
+)
+from app.services.glass_calculator.glass_calculator import CalculateStress
+from app.services.glass_calculator.panel_batch import PanelBatch
+
+
+def make_panels(panels):
+    return BatchInputScheme(panels=[{"support": "four-uniform", **panel} for panel in panels]).panels  # type: ignore
+
+
+class TestPanelBatch:
+    """列指向のパネルの表現のテスト"""
+
+    def test_from_panels(self):
+        """入力モデルの属性が列に、積層構成が offsets と values に詰められること"""
+        panels = make_panels([
+            {"a": 1000, "b": 1500, "t": [6, 8], "w": 0.002, "interlayer": "pvb"},
+            {"a": 800, "b": 900, "t": [10], "w": 0.003, "lookup_mode": "linear"},
+        ])
+
+        batch = PanelBatch.from_panels(SupportTypeEnum.FOUR_UNIFORM, panels)
+
+        assert len(batch) == 2
+        assert batch.columns["a"].tolist() == [1000, 800]
+        assert batch.columns["a"].dtype == np.float64 and batch.columns["a"].flags.c_contiguous
+        assert batch.layup_offsets.tolist() == [0, 2, 3]
+        assert batch.layup_values.tolist() == [6, 8, 10]
+        assert batch.categories["interlayer"].tolist() == [InterlayerMaterialTypeEnum.PVB, InterlayerMaterialTypeEnum.SG]
+        assert batch.categories["lookup_mode"].tolist() == [LookupModeEnum.STEP, LookupModeEnum.LINEAR]
+        assert batch.total_thickness().tolist() == [14, 10]
+        assert batch.outer_thickness().tolist() == [6, 10]
+
+    def test_defaults_and_read_only(self):
+        """列は行数に広げ、省略した列は既定値となり、列は読み取り専用であること"""
+        batch = PanelBatch(SupportTypeEnum.CIRCULAR_UNIFORM, {"D": [800, 1000], "w": 0.002}, [0, 1, 1], [8])
+
+        assert batch.columns["w"].tolist() == [0.002, 0.002]
+        assert batch.columns["E"].tolist() == [71600, 71600]
+        assert batch.categories["glass_type"].tolist() == [GlassTypeEnum.FLOAT] * 2
+        assert batch.total_thickness().tolist() == [8, 0]
+        assert np.isnan(batch.outer_thickness()[1])
+        with pytest.raises(ValueError):
+            batch.columns["D"][0] = 1
+
+    def test_take(self):
+        """行を選ぶと積層構成も詰め直されること"""
+        batch = PanelBatch(
+            SupportTypeEnum.FOUR_UNIFORM, {"a": [1, 2, 3], "b": [4, 5, 6], "w": 0.001}, [0, 2, 2, 5], [1, 2, 3, 4, 5]
+        )
+
+        part = batch.take([2, 0])
+        mask = batch.take(np.array([False, True, True]))
+
+        assert part.columns["a"].tolist() == [3, 1]
+        assert [part.layup(i).tolist() for i in range(2)] == [[3, 4, 5], [1, 2]]
+        assert [mask.layup(i).tolist() for i in range(2)] == [[], [3, 4, 5]]
+
+
+class TestCalculatePanels:
+    """PanelBatch の一括計算のテスト"""
+
+    def test_matches_batch_rows(self):
+        """係数の求め方・中間膜・計算方法が混在しても、入力モデルからの一括計算と一致すること"""
+        panels = make_panels([
+            {"a": 1000, "b": 1500, "t": [6], "w": 0.002},
+            {"a": 1000, "b": 1550, "t": [6], "w": 0.002, "lookup_mode": "linear"},
+            {"a": 1000, "b": 1500, "t": [6, 6], "w": 0.002, "interlayer": "pvb", "temperature": 40},
+            {"a": 1000, "b": 6000, "t": [8], "w": 0.002, "solver": "auto"},
+            {"a": 1000, "b": 1500, "t": [8], "w": 0.002, "solver": "fem", "glass_type": "tempered"},
+        ])
+        expected = CalculateStress.calculate_batch_rows(panels)
+
+        result, thickness, allowable = CalculateStress.calculate_panels(
+            PanelBatch.from_panels(SupportTypeEnum.FOUR_UNIFORM, panels)
+        )
+        rows = CalculateStress._to_batch_results(SupportTypeEnum.FOUR_UNIFORM, result, thickness, allowable)
+
+        assert rows == expected
+        assert result["solver"].tolist() == [SolverEnum.TABLE] * 3 + [SolverEnum.FEM] * 2
+
+    def test_columns_without_input_models(self):
+        """入力モデルを作らずに列から直接計算できること"""
+        count = 1000
+        a = np.linspace(500, 1500, count)
+        batch = PanelBatch(
+            SupportTypeEnum.FOUR_UNIFORM,
+            {"a": a, "b": 2 * a, "w": 0.002},
+            np.arange(count + 1) * 2,
+            np.full(2 * count, 5.0),
+        )
+
+        result, thickness, allowable = CalculateStress.calculate_panels(batch)
+        single = CalculateStress.calculate_batch_rows(make_panels([{"a": a[-1], "b": 2 * a[-1], "t": [5, 5], "w": 0.002}]))[0]
+
+        assert thickness.tolist() == [10.0] * count
+        assert round(float(result["sigma"][-1]), 2) == single["sigma"]
+        assert np.all(np.diff(result["sigma"]) >= 0)
+        assert allowable["shortTerm"].tolist() == [24.5] * count
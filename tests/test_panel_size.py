@@ -0,0 +1,45 @@
+import pytest
+
+from app.services.glass_calculator.contracts.enums import GlassTypeEnum, InterlayerMaterialTypeEnum, SupportTypeEnum
+from app.services.glass_calculator.fourside.uniform import FourSideUniformLoadGlass
+from app.services.glass_calculator.glass_layer import GlassLayer
+from app.services.glass_calculator.glass_material import GlassMaterial
+from app.services.glass_calculator.panel_size import PanelSizeSolver
+
+
+class TestPanelSizeSolver:
+    """最大寸法の計算クラスのテスト"""
+
+    def test_breakpoints_pass_scalar_calculation(self):
+        """係数テーブルの区切りの辺長比でも、求めた寸法が1枚ずつの計算で許容応力以下となること"""
+        ratio = [float(value) for value in FourSideUniformLoadGlass.coefficient_table.axes["b_by_a"]]
+        result = PanelSizeSolver.solve(SupportTypeEnum.FOUR_UNIFORM, ratio, [8], 0.002, 71600, GlassTypeEnum.FLOAT)
+
+        layer = GlassLayer([8], InterlayerMaterialTypeEnum.SG)  # type: ignore
+        for row in result["results"]:
+            glass = FourSideUniformLoadGlass(row["a"], row["b"], layer, 0.002, GlassMaterial())
+            sigma = glass.calculate_stress()
+            assert sigma <= 24.5 * (1 + 1e-9)
+            assert sigma == pytest.approx(24.5)
+
+    def test_deflection_limit(self):
+        """変位の制限値で決まる場合は変位が制限値に一致すること"""
+        result = PanelSizeSolver.solve(SupportTypeEnum.FOUR_UNIFORM, [1.0], [8], 0.002, 71600, GlassTypeEnum.FLOAT, 20)
+        row = result["results"][0]
+
+        layer = GlassLayer([8], InterlayerMaterialTypeEnum.SG)  # type: ignore
+        glass = FourSideUniformLoadGlass(row["a"], row["b"], layer, 0.002, GlassMaterial())
+        assert row["governing"] == "deflection"
+        assert glass.calculate_displacement() == pytest.approx(20)
+
+    def test_row_errors(self):
+        """係数テーブルの範囲外の辺長比は行ごとのエラーとなること"""
+        result = PanelSizeSolver.solve(SupportTypeEnum.THREE_UNIFORM, [0.05, 1.0], [5, 5], 0.002, 71600, GlassTypeEnum.TEMPERED)
+
+        assert result["results"][0]["error"] == "b/a is smaller than 0.1. use FEM instead"
+        assert result["results"][1]["a"] > 0
+
+    def test_unsupported_support(self):
+        """部分荷重・円形は対象外であること"""
+        with pytest.raises(ValueError):
+            PanelSizeSolver.solve(SupportTypeEnum.FOUR_PARTIAL, [1.0], [8], 0.002, 71600, GlassTypeEnum.FLOAT)
@@ -0,0 +1,111 @@
+import math
+
+import numpy as np
+import pytest
+
+from app.schemas.glass import BreakageProbabilityInputScheme, FourSideUniformInputScheme
+from app.services.glass_calculator import probability
+from app.services.glass_calculator.glass_calculator import CalculateStress
+from app.services.glass_calculator.probability import BreakageProbability, StressHistogram, thickness_tolerance
+
+
+PANEL = {"support": "four-uniform", "a": 1000, "b": 1500, "t": [6], "w": 0.003}
+
+
+def make_input(**kwargs) -> BreakageProbabilityInputScheme:
+    data = {"panel": PANEL, "samples": 20000, "chunk_size": 5000, "seed": 1}
+    data.update(kwargs)
+    return BreakageProbabilityInputScheme(**data)  # type: ignore
+
+
+class TestStressHistogram:
+    """応力のヒストグラムのテスト"""
+
+    def test_quantile_matches_numpy(self):
+        """ヒストグラムから求めたパーセンタイルがnumpyの値と区間の幅の範囲で一致すること"""
+        sigma = np.random.default_rng(0).lognormal(3.0, 0.3, 100000)
+        histogram = StressHistogram.count(sigma)
+
+        assert histogram.sum() == len(sigma)
+        for q in (0.1, 0.5, 0.99):
+            assert StressHistogram.quantile(histogram, q * len(sigma)) == pytest.approx(np.quantile(sigma, q), rel=4e-3)
+
+    def test_out_of_range_values(self):
+        """範囲外の値は先頭・末尾の区間に入ること"""
+        histogram = StressHistogram.count(np.array([0.0, 1e-5, 1.0, 1e6]))
+
+        assert histogram[0] == 2
+        assert histogram[-1] == 1
+
+
+class TestBreakageProbability:
+    """モンテカルロ法による破損確率の計算クラスのテスト"""
+
+    def test_thickness_tolerance(self):
+        """呼び厚さごとの許容差"""
+        assert thickness_tolerance(6) == 0.2
+        assert thickness_tolerance(10) == 0.3
+        assert thickness_tolerance(19) == 1.0
+
+    def test_deterministic_load_matches_weibull_cdf(self):
+        """板厚・風圧がばらつかない場合、応力は決定論的な計算と一致し、破損確率はWeibull分布の値となること"""
+        result = BreakageProbability.calculate(
+            make_input(samples=200000, chunk_size=100000, thickness_tolerance=0, wind_cov=0)
+        )
+        sigma = CalculateStress.calculate_fourside_uniform(FourSideUniformInputScheme(**PANEL))["sigma"]  # type: ignore
+        expected = 1 - math.exp(-((sigma / result["weibull_scale"]) ** result["weibull_shape"]))
+
+        assert result["stress_percentiles"][0]["value"] == pytest.approx(sigma, rel=4e-3)
+        assert result["mean_stress"] == pytest.approx(sigma, abs=0.01)
+        assert result["failure_probability_lower"] < expected < result["failure_probability_upper"]
+
+    def test_streams_cumulative_estimates(self):
+        """チャンクごとに累積の推定値を返し、最後の推定値は calculate と一致すること"""
+        data = make_input()
+
+        estimates = list(BreakageProbability.iter_estimates(data))
+
+        assert [estimate["samples"] for estimate in estimates] == [5000, 10000, 15000, 20000]
+        assert [estimate["done"] for estimate in estimates] == [False, False, False, True]
+        assert estimates[-1] == BreakageProbability.calculate(data)
+        last = estimates[-1]
+        assert last["failure_probability_lower"] <= last["failure_probability"] <= last["failure_probability_upper"]
+        assert all(p["lower"] <= p["value"] <= p["upper"] for p in last["stress_percentiles"])
+
+    def test_seed_reproducible_across_workers(self):
+        """同じ種であればプロセス数によらず同じ結果となり、種が異なれば結果が異なること"""
+        single = BreakageProbability.calculate(make_input())
+
+        assert BreakageProbability.calculate(make_input(workers=2)) == single
+        assert BreakageProbability.calculate(make_input(seed=2)) != single
+
+    def test_falls_back_without_process_pool(self, monkeypatch):
+        """プロセスプールを作れない環境・Lambdaでは同じプロセスで計算し、同じ結果となること"""
+        single = BreakageProbability.calculate(make_input())
+
+        def unavailable(*args, **kwargs):
+            raise OSError(38, "Function not implemented")
+
+        monkeypatch.setattr(probability, "ProcessPoolExecutor", unavailable)
+        assert BreakageProbability.calculate(make_input(workers=2)) == single
+
+        monkeypatch.setattr(probability, "ProcessPoolExecutor", lambda *args, **kwargs: pytest.fail("プロセスプールを作成"))
+        monkeypatch.setenv("AWS_LAMBDA_FUNCTION_NAME", "glass-calculator")
+        assert BreakageProbability.calculate(make_input(workers=4)) == single
+
+    def test_laminated_and_fem_panels(self):
+        """合わせガラス（PVB）・FEMに切り替えるパネルも計算できること"""
+        pvb = BreakageProbability.calculate(make_input(panel={**PANEL, "t": [5, 5], "interlayer": "pvb"}))
+        fem = BreakageProbability.calculate(make_input(panel={**PANEL, "b": 6000, "solver": "auto"}))
+
+        assert pvb["done"] and pvb["mean_stress"] < 20
+        assert fem["done"] and fem["failure_probability"] > pvb["failure_probability"]
+
+    @pytest.mark.parametrize("panel, message", [
+        ({**PANEL, "b": 6000}, "b/aが5を超えています。代わりにFEMを使用してください"),
+        ({**PANEL, "solver": "nonlinear"}, "大たわみ解析（nonlinear）は破損確率の計算に対応していません"),
+        ({**PANEL, "t": []}, "板厚が指定されていません"),
+    ])
+    def test_errors(self, panel, message):
+        """呼び厚さで計算できない条件はエラーを返すこと"""
+        assert list(BreakageProbability.iter_estimates(make_input(panel=panel))) == [{"error": message}]
@@ -0,0 +1,141 @@
+import dataclasses
+
+from app.schemas.glass import FourSideUniformBatchInputScheme, FourSideUniformInputScheme
+from app.services.glass_calculator import laminate
+from app.services.glass_calculator.contracts.enums import InterlayerMaterialTypeEnum, SupportTypeEnum
+from app.services.glass_calculator.glass_calculator import CalculateStress
+from app.services.result_cache.result_cache import ResultCache, canonical_key, get_result_cache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResultCache:
+    """計算結果のLRUキャッシュのテスト"""
+
+    def test_hit_and_miss(self):
+        """キャッシュした結果が返され、ヒット・ミスが数えられること"""
+        cache = ResultCache(max_size=2)
+
+        assert cache.get("a") is None
+        cache.put("a", {"sigma": 1.0})
+
+        assert cache.get("a") == {"sigma": 1.0}
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["hit_rate"] == 0.5
+
+    def test_returns_copy(self):
+        """返された結果を変更してもキャッシュは変わらないこと"""
+        cache = ResultCache(max_size=2)
+        cache.put("a", {"sigma": 1.0})
+
+        cache.get("a")["sigma"] = 2.0  # type: ignore
+
+        assert cache.get("a") == {"sigma": 1.0}
+
+    def test_evicts_least_recently_used(self):
+        """件数の上限を超えた場合に最も長く使われていない結果が削除されること"""
+        cache = ResultCache(max_size=2)
+        cache.put("a", {"sigma": 1.0})
+        cache.put("b", {"sigma": 2.0})
+        cache.get("a")
+
+        cache.put("c", {"sigma": 3.0})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"sigma": 1.0}
+        assert cache.get("c") == {"sigma": 3.0}
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["size"] == 2
+
+    def test_expires_after_ttl(self):
+        """保持時間を過ぎた結果は使われないこと"""
+        clock = FakeClock()
+        cache = ResultCache(max_size=2, ttl_seconds=10, clock=clock)
+        cache.put("a", {"sigma": 1.0})
+
+        clock.now = 9.9
+        assert cache.get("a") == {"sigma": 1.0}
+        clock.now = 10.0
+        assert cache.get("a") is None
+        assert cache.stats()["expirations"] == 1
+        assert cache.stats()["size"] == 0
+
+    def test_disabled_when_size_is_zero(self):
+        """件数の上限が0の場合はキャッシュしないこと"""
+        cache = ResultCache(max_size=0)
+        cache.put("a", {"sigma": 1.0})
+
+        assert cache.get("a") is None
+
+
+class TestCanonicalKey:
+    """キャッシュのキーのテスト"""
+
+    def test_same_input_same_key(self):
+        """数値の表記によらず同じ入力は同じキーになること"""
+        first = FourSideUniformInputScheme(a=1000, b=2000, t=[6, 6], w=1)  # type: ignore
+        second = FourSideUniformInputScheme(a=1000.0, b=2000.0, t=[6.0, 6.0], w=1.0)  # type: ignore
+
+        assert canonical_key("single", SupportTypeEnum.FOUR_UNIFORM, first) == canonical_key(
+            "single", SupportTypeEnum.FOUR_UNIFORM, second
+        )
+
+    def test_different_input_different_key(self):
+        """積層構成・支持条件が異なる場合は別のキーになること"""
+        data = FourSideUniformInputScheme(a=1000, b=2000, t=[6, 6], w=1)  # type: ignore
+        other = FourSideUniformInputScheme(a=1000, b=2000, t=[12], w=1)  # type: ignore
+
+        key = canonical_key("single", SupportTypeEnum.FOUR_UNIFORM, data)
+        assert key != canonical_key("single", SupportTypeEnum.FOUR_UNIFORM, other)
+        assert key != canonical_key("single", SupportTypeEnum.THREE_UNIFORM, data)
+        assert "four-uniform:1" in key
+
+    def test_shear_modulus_version_in_key(self, monkeypatch):
+        """PVB, EVAのキーにはせん断弾性係数の表の版が含まれ、版が変わると別のキーになること"""
+        data = FourSideUniformInputScheme(a=1000, b=2000, t=[6, 6], w=1, interlayer="pvb")  # type: ignore
+        key = canonical_key("single", SupportTypeEnum.FOUR_UNIFORM, data)
+        table = laminate.get_shear_modulus_table(InterlayerMaterialTypeEnum.PVB)
+        monkeypatch.setitem(laminate._tables, InterlayerMaterialTypeEnum.PVB, dataclasses.replace(table, version="2"))
+
+        assert "pvb:1" in key
+        assert canonical_key("single", SupportTypeEnum.FOUR_UNIFORM, data) != key
+
+
+class TestCalculateStressCache:
+    """計算クラスのキャッシュのテスト"""
+
+    def test_single_calculation_is_cached(self):
+        """同じ入力の2回目の計算はキャッシュから返されること"""
+        data = FourSideUniformInputScheme(a=1000, b=2000, t=[6, 6], w=1)  # type: ignore
+
+        first = CalculateStress.calculate_fourside_uniform(data)
+        second = CalculateStress.calculate_fourside_uniform(data)
+
+        assert first == second
+        assert get_result_cache().stats()["hits"] == 1
+        assert get_result_cache().stats()["misses"] == 1
+
+    def test_batch_rows_are_cached(self):
+        """一括計算ではキャッシュに無い行だけが計算され、結果は入力順に返されること"""
+        panels = [
+            {"a": 1000, "b": 2000, "t": [6, 6], "w": 1},
+            {"a": 1000, "b": 1500, "t": [6, 6], "w": 1},
+        ]
+        first = CalculateStress.calculate_fourside_uniform_batch(
+            FourSideUniformBatchInputScheme(panels=panels[:1])  # type: ignore
+        )
+        results = CalculateStress.calculate_fourside_uniform_batch(
+            FourSideUniformBatchInputScheme(panels=panels)  # type: ignore
+        )["results"]
+
+        assert results[0] == first["results"][0]
+        assert results[1]["sigma"] > 0
+        assert get_result_cache().stats()["hits"] == 1
+        assert get_result_cache().stats()["misses"] == 2
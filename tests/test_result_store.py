@@ -0,0 +1,101 @@
+import dataclasses
+import json
+import sqlite3
+
+import pytest
+
+from app.schemas.glass import FourSideUniformInputScheme
+from app.services.glass_calculator import laminate
+from app.services.glass_calculator.contracts.enums import InterlayerMaterialTypeEnum
+from app.services.glass_calculator.glass_calculator import CalculateStress
+from app.services.result_cache import result_store
+from app.services.result_cache.result_cache import get_result_cache
+from app.services.result_cache.result_store import ResultStore
+
+
+class TestResultStore:
+    """計算結果の永続キャッシュのテスト"""
+
+    def test_put_and_get(self, tmp_path):
+        """保存した計算結果がキーの順に返されること"""
+        store = ResultStore(str(tmp_path / "results.sqlite3"))
+        store.put_many({"a": {"sigma": 1.0}, "b": {"error": "エラー"}})
+
+        assert store.get_many(["b", "c", "a"]) == [{"error": "エラー"}, None, {"sigma": 1.0}]
+        assert store.stats()["hits"] == 2
+        assert store.stats()["misses"] == 1
+
+    def test_survives_reopen(self, tmp_path):
+        """別のインスタンス（プロセスの再起動）でも保存した計算結果が使われること"""
+        path = str(tmp_path / "results.sqlite3")
+        ResultStore(path).put_many({"a": {"sigma": 1.0}})
+
+        assert ResultStore(path).get_many(["a"]) == [{"sigma": 1.0}]
+
+    def test_evicts_least_recently_used_over_max_bytes(self, tmp_path):
+        """合計サイズが上限を超えた場合に最も長く使われていない結果が削除されること"""
+        store = ResultStore(str(tmp_path / "results.sqlite3"), max_bytes=40)
+        store.put_many({"a": {"sigma": 1.0}})
+        store.put_many({"b": {"sigma": 2.0}})
+        store.get_many(["a"])
+
+        store.put_many({"c": {"sigma": 3.0}})
+
+        assert store.get_many(["a", "b", "c"]) == [{"sigma": 1.0}, None, {"sigma": 3.0}]
+        assert store.stats()["evictions"] == 1
+        assert store.stats()["bytes"] <= 40
+
+    def test_cleared_when_coefficient_version_changes(self, tmp_path):
+        """係数テーブルの版が保存時と異なる場合は保存した結果が使われないこと"""
+        path = str(tmp_path / "results.sqlite3")
+        ResultStore(path).put_many({"a": {"sigma": 1.0}})
+        connection = sqlite3.connect(path)
+        connection.execute(
+            "UPDATE meta SET value = ? WHERE name = 'table_versions'", (json.dumps({"coefficient": {"four-uniform": "0"}}),)
+        )
+        connection.commit()
+        connection.close()
+
+        assert ResultStore(path).get_many(["a"]) == [None]
+
+    def test_cleared_when_shear_modulus_version_changes(self, tmp_path, monkeypatch):
+        """中間膜のせん断弾性係数の表の版が保存時と異なる場合は保存した結果が使われないこと"""
+        path = str(tmp_path / "results.sqlite3")
+        ResultStore(path).put_many({"a": {"sigma": 1.0}})
+        table = laminate.get_shear_modulus_table(InterlayerMaterialTypeEnum.PVB)
+        monkeypatch.setitem(laminate._tables, InterlayerMaterialTypeEnum.PVB, dataclasses.replace(table, version="2"))
+
+        assert ResultStore(path).get_many(["a"]) == [None]
+
+    def test_recreated_when_schema_version_changes(self, tmp_path):
+        """テーブル構成の版が異なるデータベースは作り直されること"""
+        path = str(tmp_path / "results.sqlite3")
+        connection = sqlite3.connect(path)
+        connection.execute("CREATE TABLE results (key TEXT PRIMARY KEY, value TEXT)")
+        connection.commit()
+        connection.close()
+
+        store = ResultStore(path)
+        store.put_many({"a": {"sigma": 1.0}})
+
+        assert store.get_many(["a"]) == [{"sigma": 1.0}]
+
+
+class TestCalculateStressResultStore:
+    """計算クラスの永続キャッシュのテスト"""
+
+    def test_calculation_reuses_stored_result(self, tmp_path, monkeypatch):
+        """メモリのキャッシュが空でも永続キャッシュの計算結果が使われること"""
+        store = ResultStore(str(tmp_path / "results.sqlite3"))
+        monkeypatch.setattr(result_store, "_result_store", store)
+        data = FourSideUniformInputScheme(a=1000, b=2000, t=[6, 6], w=1)  # type: ignore
+        get_result_cache().clear()
+
+        first = CalculateStress.calculate_fourside_uniform(data)
+        get_result_cache().clear()
+        second = CalculateStress.calculate_fourside_uniform(data)
+
+        assert first == second
+        assert store.stats()["hits"] == 1
+        assert store.stats()["misses"] == 1
+        get_result_cache().clear()
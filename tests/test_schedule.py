@@ -0,0 +1,57 @@
+import csv
+import io
+
+import pytest
+
+from app.services.glass_calculator.schedule import GlassSchedule
+
+
+def _read(content: bytes):
+    return list(csv.DictReader(io.StringIO(content.decode("utf-8"))))
+
+
+class TestGlassSchedule:
+    """ガラス一覧表の計算クラスのテスト"""
+
+    class TestCalculateCsv:
+        """CSVの計算メソッドのテスト"""
+
+        def test_adds_result_columns(self):
+            """元の列を残したまま計算結果の列が追加されること"""
+            content = (
+                "name,a,b,t1,t2,w,support\n"
+                "P1,100,100,6,6,1.0,four-uniform\n"
+                "P2,500,,6,6,1.0,circular-uniform\n"
+            ).encode()
+
+            rows = _read(GlassSchedule.calculate_csv(content))
+
+            assert rows[0]["name"] == "P1"
+            assert float(rows[0]["sigma"]) == round((0.272 * (1.0 * 100**2)) / 144, 2)
+            assert float(rows[0]["utilization_short_term"]) == pytest.approx((0.272 * 100**2 / 144) / 24.5, abs=0.001)
+            assert float(rows[0]["utilization_long_term"]) > float(rows[0]["utilization_short_term"])
+            assert rows[0]["error"] == ""
+            assert float(rows[1]["sigma"]) == round(1.212 * (1.0 * 250**2) / 12**2, 2)
+
+        def test_reports_errors_per_row(self):
+            """不正な行だけがエラーになり、他の行は計算されること"""
+            content = (
+                "a,b,t1,w\n"
+                "200,100,6,1.0\n"
+                "100,x,6,1.0\n"
+                "100,100,,1.0\n"
+                "100,100,6,1.0\n"
+            ).encode()
+
+            rows = _read(GlassSchedule.calculate_csv(content))
+
+            assert rows[0]["error"] == "短辺が長辺より長くなることはできません"
+            assert rows[1]["error"] == "b: 正の数値を入力してください"
+            assert rows[2]["error"] == "板厚が指定されていません"
+            assert rows[3]["error"] == ""
+            assert rows[0]["sigma"] == ""
+
+        def test_empty_file(self):
+            """空のファイルの場合にエラーが発生すること"""
+            with pytest.raises(ValueError, match="CSVが空です"):
+                GlassSchedule.calculate_csv(b"")
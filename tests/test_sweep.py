@@ -0,0 +1,94 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.glass import SweepInputScheme
+from app.services.glass_calculator.allowable_stress import GlassAllowableUnitStress
+from app.services.glass_calculator.contracts.enums import GlassTypeEnum, SupportTypeEnum
+from app.services.glass_calculator.sweep import ParametricSweep
+
+
+class TestParametricSweep:
+    """パラメータスイープの計算クラスのテスト"""
+
+    class TestExpandAxis:
+        """軸の展開のテスト"""
+
+        def test_range_includes_stop(self):
+            """範囲指定の場合に終了値を含むこと"""
+            axis = ParametricSweep.expand_axis(SimpleNamespace(start=500, stop=1500, step=250))
+
+            assert axis.tolist() == [500, 750, 1000, 1250, 1500]
+
+        def test_axis_length_exceeds_maximum(self):
+            """軸の値の数が上限を超える場合にエラーが発生すること"""
+            with pytest.raises(ValueError, match="軸の値の数が10000を超えています"):
+                ParametricSweep.expand_axis(SimpleNamespace(start=1, stop=100000, step=1))
+
+    class TestCalculate:
+        """グリッド計算のテスト"""
+
+        def test_grid_in_c_order(self):
+            """グリッドがa, b, t, w の順にC順で並ぶこと"""
+            a = np.array([100.0, 200.0])
+            b = np.array([200.0])
+            w = np.array([1.0, 2.0])
+
+            result = ParametricSweep.calculate(
+                SupportTypeEnum.FOUR_UNIFORM, a, b, [[6, 6], [5]], w, 71600, 0, 100
+            )
+
+            assert result["shape"] == [2, 1, 2, 2]
+            assert result["next_offset"] is None
+            assert pytest.approx(result["sigma"][0], 0.001) == (0.603 * (1.0 * 100**2)) / 144
+            assert pytest.approx(result["sigma"][3], 0.001) == (0.603 * (2.0 * 100**2)) / 25
+            assert pytest.approx(result["sigma"][4], 0.001) == (0.272 * (1.0 * 200**2)) / 144
+
+        def test_utilization(self):
+            """検定比が積層構成の外側の板厚の短期・長期許容応力で求められること"""
+            one = np.array([1000.0])
+            layers = [[6, 8], [5]]
+
+            result = ParametricSweep.calculate(SupportTypeEnum.FOUR_UNIFORM, one, one, layers, np.array([0.002]), 71600, 0, 100)
+
+            allowable = GlassAllowableUnitStress.get_allowable_stress_batch(GlassTypeEnum.FLOAT, np.array([6.0, 5.0]))
+            np.testing.assert_allclose(result["utilization_short_term"], result["sigma"] / allowable["shortTerm"])
+            np.testing.assert_allclose(result["utilization_long_term"], result["sigma"] / allowable["longTerm"])
+            assert np.all(result["utilization_short_term"] < result["utilization_long_term"])
+
+        def test_chunked_grid_matches_whole_grid(self):
+            """分割して計算した結果が一括で計算した結果と一致すること"""
+            a = np.linspace(100, 1000, 7)
+            b = np.linspace(500, 2000, 5)
+            w = np.array([1.0, 1.5, 2.0])
+            layers = [[6], [8], [6, 6]]
+            whole = ParametricSweep.calculate(SupportTypeEnum.THREE_UNIFORM, a, b, layers, w, 71600, 0, 1000)
+
+            chunks = []
+            offset = 0
+            while offset is not None:
+                result = ParametricSweep.calculate(SupportTypeEnum.THREE_UNIFORM, a, b, layers, w, 71600, offset, 40)
+                chunks.append(result["sigma"])
+                offset = result["next_offset"]
+
+            np.testing.assert_array_equal(np.concatenate(chunks), whole["sigma"])
+
+        def test_offset_beyond_grid(self):
+            """offset がグリッドの件数以上の場合は空の結果を返すこと"""
+            one = np.array([1000.0])
+
+            result = ParametricSweep.calculate(SupportTypeEnum.FOUR_UNIFORM, one, one, [[6]], one, 71600, 5, 100)
+
+            assert result["offset"] == 5
+            assert result["next_offset"] is None
+            assert len(result["sigma"]) == len(result["delta"]) == 0
+
+    class TestInputScheme:
+        """入力のテスト"""
+
+        def test_empty_layup_rejected(self):
+            """空の積層構成は入力エラーとすること（等価板厚0で応力・変位が無限大となるため）"""
+            with pytest.raises(ValidationError):
+                SweepInputScheme(support="four-uniform", a=[1000], b=[1000], t=[[6], []], w=[1000])  # type: ignore
@@ -1,3 +1,4 @@
+import numpy as np
 from app.services.glass_calculator.glass_layer import GlassLayer
 from app.services.glass_calculator.contracts.enums import InterlayerMaterialTypeEnum
 from app.services.glass_calculator.glass_material import GlassMaterial
@@ -172,3 +173,33 @@ class TestTwoSideUniformLoadGlass:
             # thickness**3 は 125 (5^3)
             expected = (0.165 * (1.0 * 1000 ** 4)) / (125 * E)
             assert pytest.approx(displacement, 0.001) == expected
+
+    class TestCalculateBatch:
+        """一括計算メソッドのテスト"""
+
+        def test_batch_matches_single_calculation(self):
+            """一括計算の結果が1枚ずつの計算結果と一致すること"""
+            glass_material = GlassMaterial()
+            panels = [(1000, 800, 8.0, 1.0), (1000, 2500, 12.0, 0.5), (500, 1000, 6.0, 2.0)]
+            free_edge, fixed_edge, thickness, w = (np.array(column, dtype=np.float64) for column in zip(*panels))
+            E = np.full(len(panels), glass_material.E, dtype=np.float64)
+
+            result = TwoSideUniformLoadGlass.calculate_batch(free_edge, fixed_edge, thickness, w, E)
+
+            for i, (free, fix, t, load) in enumerate(panels):
+                glass_layer = GlassLayer([t], InterlayerMaterialTypeEnum.SG)  # type: ignore
+                plate = TwoSideUniformLoadGlass(free, fix, glass_layer, load, glass_material)
+                assert result["sigma"][i] == plate.calculate_stress()
+                assert result["delta"][i] == plate.calculate_displacement()
+                assert result["error"][i] is None
+
+        def test_batch_reports_errors_per_row(self):
+            """辺長比が範囲外の行だけがエラーになること"""
+            free_edge = np.array([1000, 1000], dtype=np.float64)
+            fixed_edge = np.array([300, 1000], dtype=np.float64)
+
+            result = TwoSideUniformLoadGlass.calculate_batch(free_edge, fixed_edge, np.full(2, 8.0), np.ones(2), np.full(2, 71600.0))
+
+            assert result["error"][0] == "b/a is smaller than 0.5. use FEM instead"
+            assert np.isnan(result["sigma"][0])
+            assert result["error"][1] is None